@@ -0,0 +1 @@
+"""Standalone benchmarks; run one with ``python -m benchmarks.<name>``."""
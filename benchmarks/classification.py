@@ -0,0 +1,92 @@
+"""
+Compare classification-only throughput with full canonicalization.
+
+Every case runs on the same deterministic corpus: the bundled CLI examples
+for the equation paths, and random symmetric homogeneous matrices for the
+matrix paths. Full canonicalization uses a canonicalizer without a result
+cache, so repeated equations are not answered from memory.
+
+Run with ``python -m benchmarks.classification [--size N] [--repeat R]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable, Sequence
+
+import numpy as np
+
+from src.main import ExampleCatalog
+from src.numerical import ClassificationStrategy, QuadricMatrixBatch, classify, classify_many
+from src.numerical.canonicalize import _default_canonicalizer
+from src.numerical.models import FloatArray
+
+
+def equation_corpus(size: int) -> list[str]:
+    """Return ``size`` equations cycling through the bundled examples."""
+
+    equations = [example.equation for example in ExampleCatalog.examples]
+    return [equations[index % len(equations)] for index in range(size)]
+
+
+def matrix_corpus(size: int, seed: int = 0) -> FloatArray:
+    """Return ``size`` random symmetric homogeneous matrices."""
+
+    matrices = np.random.default_rng(seed).normal(size=(size, 4, 4))
+    return np.asarray(matrices + matrices.transpose(0, 2, 1), dtype=np.float64)
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of ``repeat`` wall-clock timings in seconds."""
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(size: int, repeat: int) -> dict[str, float]:
+    """
+    Time every case and return microseconds per quadric.
+
+    Args:
+        size: int
+            Number of quadrics per case.
+        repeat: int
+            Timings per case; the fastest is kept.
+        return: dict[str, float]
+            Microseconds per quadric keyed by case name.
+    """
+
+    equations = equation_corpus(size)
+    matrices = matrix_corpus(size)
+    canonicalizer = _default_canonicalizer()
+    spectral, characteristic = ClassificationStrategy.SPECTRAL, ClassificationStrategy.CHARACTERISTIC
+    cases: dict[str, Callable[[], object]] = {
+        "canonize equations": lambda: [canonicalizer.canonize(equation) for equation in equations],
+        "classify equations (spectral)": lambda: [classify(equation, spectral) for equation in equations],
+        "classify equations (characteristic)": lambda: [classify(equation, characteristic) for equation in equations],
+        "classify_many equations (characteristic)": lambda: classify_many(equations, characteristic),
+        "canonize_many matrices": lambda: canonicalizer.canonize_many(QuadricMatrixBatch.from_homogeneous(matrices)),
+        "classify_many matrices (spectral)": lambda: classify_many(matrices, spectral),
+        "classify_many matrices (characteristic)": lambda: classify_many(matrices, characteristic),
+    }
+    return {name: best_time(case, repeat) / size * 1e6 for name, case in cases.items()}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Print microseconds per quadric for every case."""
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000, help="quadrics per case")
+    parser.add_argument("--repeat", type=int, default=3, help="timings per case; the fastest is reported")
+    arguments = parser.parse_args(argv)
+    for name, microseconds in run(arguments.size, arguments.repeat).items():
+        print(f"{name:<45} {microseconds:10.2f} us/quadric")
+
+
+if __name__ == "__main__":
+    main()
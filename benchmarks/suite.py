@@ -0,0 +1,259 @@
+"""
+Measure throughput and latency percentiles of every pipeline entry point.
+
+Each of the 17 quadric types gets a deterministic corpus from
+:func:`src.numerical.generator.generate_quadrics`: a canonical form with
+seeded random coefficients, moved by a random proper rotation and
+translation and written as equation text. Every case times one call per
+equation, keeps the fastest of ``--repeat`` passes, and reports throughput and
+p50/p90/p99 latency per type. The report is JSON; with ``--baseline`` the
+p50 latencies are compared against a stored report and the exit status is
+non-zero when any case slows down by more than ``--threshold``. Only the
+Manim-free graphics contracts are imported.
+
+Run with ``python -m benchmarks.suite [--size N] [--output report.json]
+[--baseline baseline.json] [--threshold 0.25]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.graphics.models import RenderPlan
+from src.graphics.surface_spec import SurfaceSpecFactory, UnsupportedSurfaceError
+from src.numerical.canonicalize import _default_canonicalizer, canonize_quadric
+from src.numerical.classifier import QuadricClassifier
+from src.numerical.generator import generate_quadrics
+from src.numerical.models import CanonicalizationResult, QuadricType
+from src.numerical.parser import QuadricParser
+
+
+CASES = ("parse", "parse_matrices", "classify", "canonize_quadric", "surface_spec", "render_plan")
+DEFAULT_THRESHOLD = 0.25
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    """
+    Describe one case and type whose latency exceeds the baseline threshold.
+
+    Args:
+        case: str
+            Benchmark case name.
+        quadric_type: str
+            Type slug of the slowed-down corpus.
+        baseline: float
+            Baseline p50 latency in microseconds.
+        current: float
+            Current p50 latency in microseconds.
+    return: Regression
+        One entry of the comparison report.
+    """
+
+    case: str
+    quadric_type: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Return the current latency relative to the baseline."""
+
+        return self.current / self.baseline
+
+
+def corpora(size: int, seed: int = 0) -> dict[QuadricType, list[str]]:
+    """Return one deterministic corpus of ``size`` equations per quadric type."""
+
+    rng = np.random.default_rng(seed)
+    return {quadric_type: generate_quadrics(quadric_type, size, rng).equations() for quadric_type in QuadricType}
+
+
+def latency_summary(latencies: Sequence[float]) -> dict[str, float]:
+    """
+    Summarize per-call latencies of one pass.
+
+    Args:
+        latencies: collections.abc.Sequence[float]
+            Wall time of every call in seconds.
+        return: dict[str, float]
+            Call count, calls per second, and mean and percentile latencies in
+            microseconds.
+    """
+
+    values = np.asarray(latencies, dtype=np.float64)
+    total = float(np.sum(values))
+    summary = {
+        "count": float(values.size),
+        "throughput": values.size / total if total > 0.0 else 0.0,
+        "mean_us": float(np.mean(values)) * 1e6,
+    }
+    for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES).tolist()):
+        summary[f"p{percentile}_us"] = value * 1e6
+    return summary
+
+
+def _time_calls(call: Callable[[Any], object], items: Sequence[Any], repeat: int) -> list[float]:
+    """Time one call per item and return the latencies of the fastest pass."""
+
+    best: list[float] | None = None
+    for _ in range(repeat):
+        latencies = []
+        for item in items:
+            start = time.perf_counter()
+            call(item)
+            latencies.append(time.perf_counter() - start)
+        if best is None or sum(latencies) < sum(best):
+            best = latencies
+    return best if best is not None else []
+
+
+def _renderable(factory: SurfaceSpecFactory, results: list[CanonicalizationResult]) -> bool:
+    """Return whether the type of ``results`` has a real surface to build."""
+
+    try:
+        factory.create(results[0])
+    except UnsupportedSurfaceError:
+        return False
+    return True
+
+
+def run(size: int, repeat: int = 3, seed: int = 0, cases: Sequence[str] = CASES) -> dict[str, Any]:
+    """
+    Time every requested case on every type corpus.
+
+    Args:
+        size: int
+            Equations per type.
+        repeat: int
+            Passes per case and type; the fastest pass is reported.
+        seed: int
+            Seed of the corpus generator.
+        cases: collections.abc.Sequence[str]
+            Names from :data:`CASES` to run.
+        return: dict[str, typing.Any]
+            ``metadata`` and, under ``cases``, one latency summary per case
+            and type slug.
+    """
+
+    unknown = sorted(set(cases) - set(CASES))
+    if unknown:
+        raise ValueError(f"unknown benchmark cases: {', '.join(unknown)}")
+    parser = QuadricParser()
+    classifier = QuadricClassifier(tolerance=1e-10)
+    factory = SurfaceSpecFactory()
+    canonicalizer = _default_canonicalizer()
+    report: dict[str, Any] = {
+        "metadata": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "size": size,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "cases": {case: {} for case in cases},
+    }
+    for quadric_type, equations in corpora(size, seed).items():
+        matrices = [parser.parse_matrices(equation) for equation in equations]
+        results = [canonicalizer.canonize_matrices(matrix, equation) for matrix, equation in zip(matrices, equations)]
+        timed: dict[str, tuple[Callable[[Any], object], Sequence[Any]]] = {
+            "parse": (parser.parse, equations),
+            "parse_matrices": (parser.parse_matrices, equations),
+            "classify": (lambda item: classifier.classify(item.quadratic, item.homogeneous), matrices),
+            "canonize_quadric": (canonize_quadric, equations),
+            "render_plan": (RenderPlan.from_result, results),
+        }
+        if "surface_spec" in cases and _renderable(factory, results):
+            timed["surface_spec"] = (factory.create, results)
+        for case in cases:
+            if case in timed:
+                call, items = timed[case]
+                latencies = _time_calls(call, items, repeat)
+                report["cases"][case][quadric_type.slug] = latency_summary(latencies)
+    return report
+
+
+def compare(
+    report: dict[str, Any], baseline: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[Regression]:
+    """
+    Return every case and type whose p50 latency grew by more than ``threshold``.
+
+    Args:
+        report: dict[str, typing.Any]
+            Current output of :func:`run`.
+        baseline: dict[str, typing.Any]
+            Stored report to compare against; entries missing from either side
+            are skipped.
+        threshold: float
+            Accepted relative slowdown, for example ``0.25`` for 25%.
+        return: list[Regression]
+            Regressions in case and type order.
+    """
+
+    if threshold < 0.0:
+        raise ValueError("threshold must be non-negative")
+    regressions = []
+    for case, types in report["cases"].items():
+        for slug, summary in types.items():
+            reference = baseline.get("cases", {}).get(case, {}).get(slug)
+            if reference is None or reference["p50_us"] <= 0.0:
+                continue
+            if summary["p50_us"] > reference["p50_us"] * (1.0 + threshold):
+                regressions.append(Regression(case, slug, reference["p50_us"], summary["p50_us"]))
+    return regressions
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    """Return the command-line interface of the suite."""
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=50, help="equations per quadric type")
+    parser.add_argument("--repeat", type=int, default=3, help="passes per case; the fastest is reported")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the corpus generator")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES), help="cases to run")
+    parser.add_argument("--output", type=Path, help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="stored JSON report to compare p50 latencies against")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="accepted relative p50 slowdown (default 0.25)"
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the suite, write the report, and return 1 when the baseline comparison regresses."""
+
+    arguments = build_argument_parser().parse_args(argv)
+    report = run(arguments.size, arguments.repeat, arguments.seed, arguments.cases)
+    text = json.dumps(report, indent=2)
+    if arguments.output is None:
+        print(text)
+    else:
+        arguments.output.write_text(text + "\n", encoding="utf-8")
+    if arguments.baseline is None:
+        return 0
+    baseline = json.loads(arguments.baseline.read_text(encoding="utf-8"))
+    regressions = compare(report, baseline, arguments.threshold)
+    for regression in regressions:
+        print(
+            f"regression: {regression.case} on {regression.quadric_type}: "
+            f"{regression.baseline:.1f} -> {regression.current:.1f} us ({regression.ratio:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,17 +1,72 @@
-"""Quadric canonicalization package. Run checks with ``python -m pytest -q``."""
+"""
+Quadric canonicalization package. Run checks with ``python -m pytest -q``.
+
+Importing the package is nearly free: each public name loads its defining
+module on first access.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.numerical.classifier import classify, classify_many
+    from src.numerical.models import AffineTransformation, CanonicalizationResult, QuadricType, TransformationKind
+    from src.numerical.canonicalize import (
+        canonize_coefficients,
+        canonize_coefficients_many,
+        canonize_matrix,
+        canonize_matrix_many,
+        canonize_quadric,
+    )
+    from src.numerical.parallel import canonize_parallel
+
+# Public names map to their defining module, which is imported on first access.
+_EXPORTS = {
+    "classify": "src.numerical.classifier",
+    "classify_many": "src.numerical.classifier",
+    "AffineTransformation": "src.numerical.models",
+    "CanonicalizationResult": "src.numerical.models",
+    "QuadricType": "src.numerical.models",
+    "TransformationKind": "src.numerical.models",
+    "canonize_coefficients": "src.numerical.canonicalize",
+    "canonize_coefficients_many": "src.numerical.canonicalize",
+    "canonize_matrix": "src.numerical.canonicalize",
+    "canonize_matrix_many": "src.numerical.canonicalize",
+    "canonize_quadric": "src.numerical.canonicalize",
+    "canonize_parallel": "src.numerical.parallel",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module that defines ``name`` and cache the attribute."""
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily exported names alongside the loaded ones."""
+
+    return sorted({*globals(), *__all__})
 
-from src.numerical import (
-    AffineTransformation,
-    CanonicalizationResult,
-    QuadricType,
-    TransformationKind,
-    canonize_quadric,
-)
 
 __all__ = [
     "AffineTransformation",
     "CanonicalizationResult",
     "QuadricType",
     "TransformationKind",
+    "canonize_coefficients",
+    "canonize_coefficients_many",
+    "canonize_matrix",
+    "canonize_matrix_many",
+    "canonize_parallel",
     "canonize_quadric",
+    "classify",
+    "classify_many",
 ]
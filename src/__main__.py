@@ -1,5 +1,5 @@
-"""Run the interactive application through ``python -m src``."""
+"""Run the command-line application through ``python -m src``."""
 
 from src.main import main
 
-main()
+raise SystemExit(main())
@@ -14,6 +14,7 @@ from manim import Arrow, MathTex, TexTemplate, VGroup
 
 from src import AffineTransformation, TransformationKind
 from src.graphics.models import RenderPlan, TextOverlayGroups
+from src.numerical.quadric_polynomial import QuadricPolynomial
 
 
 TEXT_COLOR = mn.RED
@@ -47,17 +48,20 @@ def _tex_template() -> TexTemplate:
     return template
 
 
-def convert_equation(equation: sp.Expr) -> MathTex:
+def convert_equation(equation: sp.Expr | QuadricPolynomial) -> MathTex:
     """
-    Convert one polynomial expression into a compact Manim equation.
+    Convert one polynomial into a compact Manim equation.
 
     Args:
-        equation: sympy.Expr
-            Polynomial expression whose zero level set is the quadric.
+        equation: sympy.Expr | QuadricPolynomial
+            Polynomial whose zero level set is the quadric; coefficient
+            polynomials are formatted without building a SymPy expression.
         return: MathTex
             Fixed-frame equation ending in ``=0``.
     """
 
+    if isinstance(equation, QuadricPolynomial):
+        return MathTex(f"{equation.to_latex(DISPLAY_DECIMALS)}=0", tex_template=_tex_template())
     display_replacements = {
         coefficient: sp.Float(round(float(coefficient), DISPLAY_DECIMALS))
         for coefficient in equation.atoms(sp.Float)
@@ -114,10 +118,8 @@ class TextOverlayBuilder:
             stroke_width=TEXT_BOLDNESS,
         )
         result = plan.result
-        equations = (
-            convert_equation(result.initial_equation).scale(TEXT_SCALE),
-            convert_equation(result.middle_equation).scale(TEXT_SCALE),
-            convert_equation(result.final_equation).scale(TEXT_SCALE),
+        equations = tuple(
+            convert_equation(polynomial).scale(TEXT_SCALE) for polynomial in result.stage_polynomials
         )
         matrices = (
             mn.Matrix(np.round(result.initial_matrix, decimals=DISPLAY_DECIMALS)).scale(TEXT_SCALE),
@@ -15,6 +15,7 @@ import numpy.typing as npt
 
 from src import CanonicalizationResult, QuadricType
 from src.graphics.models import Bounds3D, SurfaceParameters
+from src.numerical.allocation_profile import AllocationProfiler, AllocationStage
 from src.numerical.models import FloatArray
 
 
@@ -153,11 +154,19 @@ class SurfaceSpec:
 
 
 class SurfaceSpecFactory:
-    """Select one canonical parameterization strategy by typed quadric family."""
+    """
+    Select one canonical parameterization strategy by typed quadric family.
+
+    Args:
+        allocations: AllocationProfiler | None
+            Optional tracemalloc profiler wrapped around every :meth:`create`.
+    """
 
+    allocations: AllocationProfiler | None
     _builders: dict[QuadricType, Callable[[SurfaceParameters], tuple[ParametricPatch, ...]]]
 
-    def __init__(self) -> None:
+    def __init__(self, allocations: AllocationProfiler | None = None) -> None:
+        self.allocations = allocations
         self._builders = {
             QuadricType.REAL_ELLIPSOID: self._ellipsoid,
             QuadricType.ONE_SHEET_HYPERBOLOID: self._one_sheet_hyperboloid,
@@ -184,6 +193,9 @@ class SurfaceSpecFactory:
                 Equation-exact finite patches and their camera bounds.
         """
 
+        if self.allocations is not None:
+            with self.allocations.stage(AllocationStage.SURFACE_SPEC):
+                return self.create_from_parameters(SurfaceParameters.from_result(result))
         return self.create_from_parameters(SurfaceParameters.from_result(result))
 
     def create_from_parameters(self, parameters: SurfaceParameters) -> SurfaceSpec:
@@ -1,17 +1,30 @@
 """
-Provide the interactive command-line entry point and Manim render orchestration.
+Provide the command-line entry point and Manim render orchestration.
 
-Run the application with ``python -m src`` after installing the graphics extra.
-Run non-rendering tests with ``python -m pytest tests -q``.
+Run the interactive application with ``python -m src`` after installing the
+graphics extra, or classify and canonicalize equations without rendering
+through ``python -m src classify`` and ``python -m src batch``. Run
+non-rendering tests with
+``python -m pytest tests -q``.
 """
 
 from __future__ import annotations
 
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
+from itertools import tee
 from pathlib import Path
+from typing import Any, TextIO
 
-from src import CanonicalizationResult, QuadricType, canonize_quadric
+from src import CanonicalizationResult, QuadricType, canonize_quadric, classify_many
 from src.graphics.models import RenderSettings
+from src.numerical import ClassificationStrategy
+from src.numerical.classifier import UNCLASSIFIED
+from src.numerical.parallel import DEFAULT_CHUNKSIZE, CanonicalizationFailure, iter_canonize_parallel
 
 
 @dataclass(frozen=True, slots=True)
@@ -108,7 +121,7 @@ def select_example() -> str:
             print(error)
 
 
-def main() -> None:
+def run_interactive() -> None:
     """Read CLI input, canonicalize the equation, and render its transformation."""
 
     use_example = input("Use a bundled quadric example? Type y/n: ")
@@ -122,5 +135,239 @@ def main() -> None:
     graphic_wrapper_function(result, quality or "1", output_path)
 
 
+def classify_equations(equations: Sequence[str], strategy: ClassificationStrategy, output: TextIO) -> int:
+    """
+    Write the type slug of every equation, one line each, in input order.
+
+    Args:
+        equations: collections.abc.Sequence[str]
+            Degree-two equations.
+        strategy: ClassificationStrategy
+            Invariants read by the decision table.
+        output: typing.TextIO
+            Stream receiving one slug, or ``unclassified``, per equation.
+        return: int
+            Exit status: zero when every equation was classified.
+    """
+
+    codes = classify_many(equations, strategy).tolist()
+    for code in codes:
+        output.write(("unclassified" if code == UNCLASSIFIED else QuadricType(code).slug) + "\n")
+    return int(UNCLASSIFIED in codes)
+
+
+def read_batch_equations(lines: Iterable[str]) -> Iterator[str | CanonicalizationFailure]:
+    """
+    Yield the equations of plain-text or JSON Lines input, skipping blank lines.
+
+    Args:
+        lines: collections.abc.Iterable[str]
+            Input lines; a line starting with ``{`` is a JSON object whose
+            ``equation`` field holds the equation, any other line is one.
+        return: collections.abc.Iterator[str | CanonicalizationFailure]
+            Equations in input order, with a failure record in place of every
+            line that is not valid JSON or lacks a string ``equation``.
+    """
+
+    index = 0
+    for number, line in enumerate(lines, start=1):
+        text = line.strip()
+        if not text:
+            continue
+        if not text.startswith("{"):
+            yield text
+        else:
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as error:
+                yield CanonicalizationFailure(index, text, type(error).__name__, f"line {number}: {error.msg}")
+            else:
+                equation = record.get("equation") if isinstance(record, dict) else None
+                if isinstance(equation, str):
+                    yield equation
+                else:
+                    message = f"line {number}: JSON input needs a string 'equation' field"
+                    yield CanonicalizationFailure(index, text, "ValueError", message)
+        index += 1
+
+
+def batch_record(
+    index: int, equation: str, outcome: CanonicalizationResult | CanonicalizationFailure
+) -> dict[str, Any]:
+    """
+    Describe one batch outcome as a JSON-ready object with a fixed set of keys.
+
+    Args:
+        index: int
+            Zero-based position of the equation in the input.
+        equation: str
+            Equation text as read.
+        outcome: CanonicalizationResult | CanonicalizationFailure
+            Result or failure record returned for the equation.
+        return: dict[str, typing.Any]
+            Type slug, matrices, rotation, and translation, with ``error`` set
+            to ``None``; failures set those keys to ``None`` and carry the
+            error type and message.
+    """
+
+    if isinstance(outcome, CanonicalizationFailure):
+        return {
+            "index": index,
+            "equation": equation,
+            "quadric_type": None,
+            "centered": None,
+            "initial_matrix": None,
+            "middle_matrix": None,
+            "final_matrix": None,
+            "rotation_matrix": None,
+            "translation_vector": None,
+            "error": {"type": outcome.error_type, "message": outcome.message},
+        }
+    return {
+        "index": index,
+        "equation": equation,
+        "quadric_type": outcome.quadric_type.slug,
+        "centered": outcome.centered,
+        "initial_matrix": outcome.initial_matrix.tolist(),
+        "middle_matrix": outcome.middle_matrix.tolist(),
+        "final_matrix": outcome.final_matrix.tolist(),
+        "rotation_matrix": outcome.rotation_matrix.tolist(),
+        "translation_vector": outcome.translation_vector.tolist(),
+        "error": None,
+    }
+
+
+def canonize_batch(
+    equations: Iterable[str | CanonicalizationFailure],
+    output: TextIO,
+    workers: int = 1,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> int:
+    """
+    Stream one JSON line per input equation, in input order.
+
+    Args:
+        equations: collections.abc.Iterable[str | CanonicalizationFailure]
+            Degree-two equations, consumed lazily, and failure records of
+            unreadable input lines, written as they are.
+        output: typing.TextIO
+            Stream receiving one :func:`batch_record` per line.
+        workers: int
+            Worker processes; one canonicalizes in the calling process.
+        chunksize: int
+            Equations sent to a worker per task.
+        return: int
+            Exit status: zero when every equation was canonicalized.
+    """
+
+    # The second copy pairs each outcome with its text; tee only buffers the
+    # entries still in flight.
+    submitted, echoed = tee(equations)
+    valid = (equation for equation in submitted if isinstance(equation, str))
+    outcomes = iter_canonize_parallel(valid, workers=workers, chunksize=chunksize)
+    failed = False
+    for index, entry in enumerate(echoed):
+        outcome: CanonicalizationResult | CanonicalizationFailure
+        if isinstance(entry, CanonicalizationFailure):
+            equation, outcome = entry.equation, entry
+        else:
+            equation, outcome = entry, next(outcomes)
+        failed = failed or isinstance(outcome, CanonicalizationFailure)
+        output.write(json.dumps(batch_record(index, equation, outcome)) + "\n")
+    # Exhaust the stream so the worker pool shuts down before returning.
+    for _ in outcomes:
+        pass
+    return int(failed)
+
+
+def _positive_int(text: str) -> int:
+    """Parse a command-line count that must be at least one."""
+
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {text}")
+    return value
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    """Return the ``python -m src`` parser; without a subcommand it runs interactively."""
+
+    parser = argparse.ArgumentParser(prog="python -m src", description="Canonicalize and render quadric surfaces.")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("render", help="prompt for an equation and render its canonicalization (default)")
+    classify_parser = commands.add_parser("classify", help="print the type of every equation without canonicalizing")
+    classify_parser.add_argument(
+        "equations", nargs="*", help="equations; read one per line from --input or stdin if omitted"
+    )
+    classify_parser.add_argument("-i", "--input", type=Path, help="file with one equation per line")
+    classify_parser.add_argument(
+        "--strategy",
+        choices=[strategy.value for strategy in ClassificationStrategy],
+        default=ClassificationStrategy.SPECTRAL.value,
+        help="invariants used by the decision table",
+    )
+    batch_parser = commands.add_parser(
+        "batch", help="canonicalize equations without rendering and write one JSON object per line"
+    )
+    batch_parser.add_argument(
+        "-i", "--input", type=Path, help="file with one equation or JSON object per line; stdin if omitted"
+    )
+    batch_parser.add_argument("-o", "--output", type=Path, help="JSON Lines destination; stdout if omitted")
+    batch_parser.add_argument("-w", "--workers", type=_positive_int, default=1, help="worker processes (default: 1)")
+    batch_parser.add_argument(
+        "--chunksize", type=_positive_int, default=DEFAULT_CHUNKSIZE, help="equations sent to a worker per task"
+    )
+    return parser
+
+
+def run_batch(source: Path | None, destination: Path | None, workers: int, chunksize: int) -> int:
+    """
+    Run the ``batch`` subcommand between files or standard streams.
+
+    Args:
+        source: pathlib.Path | None
+            Input file; ``None`` reads stdin.
+        destination: pathlib.Path | None
+            Output file; ``None`` writes stdout.
+        workers: int
+            Worker processes.
+        chunksize: int
+            Equations sent to a worker per task.
+        return: int
+            Zero on success, one when an equation or input line failed.
+    """
+
+    reader: AbstractContextManager[TextIO] = source.open(encoding="utf-8") if source else nullcontext(sys.stdin)
+    writer: AbstractContextManager[TextIO] = (
+        destination.open("w", encoding="utf-8") if destination else nullcontext(sys.stdout)
+    )
+    with reader as lines, writer as output:
+        return canonize_batch(read_batch_equations(lines), output, workers, chunksize)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Dispatch ``python -m src`` to a subcommand.
+
+    Args:
+        argv: collections.abc.Sequence[str] | None
+            Arguments after the program name; ``None`` reads ``sys.argv``.
+        return: int
+            Process exit status.
+    """
+
+    arguments = build_argument_parser().parse_args(argv)
+    if arguments.command == "classify":
+        equations: list[str] = arguments.equations
+        if not equations:
+            lines = arguments.input.read_text().splitlines() if arguments.input else sys.stdin.read().splitlines()
+            equations = [line.strip() for line in lines if line.strip()]
+        return classify_equations(equations, ClassificationStrategy(arguments.strategy), sys.stdout)
+    if arguments.command == "batch":
+        return run_batch(arguments.input, arguments.output, arguments.workers, arguments.chunksize)
+    run_interactive()
+    return 0
+
+
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
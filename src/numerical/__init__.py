@@ -1,25 +1,151 @@
-"""Public numerical API. Run its checks with ``python -m pytest tests -q``."""
-
-from src.numerical.classifier import NotAQuadricError, QuadricClassifier
-from src.numerical.models import (
-    AffineTransformation,
-    CanonicalizationResult,
-    QuadricMatrices,
-    QuadricType,
-    TransformationKind,
-)
-from src.numerical.parser import QuadricParser
-from src.numerical.canonicalize import QuadricCanonicalizer, canonize_quadric
+"""
+Public numerical API. Run its checks with ``python -m pytest tests -q``.
+
+Every name is resolved lazily, so ``from src.numerical import classify_many``
+imports only the classifier and its NumPy dependencies, never the archive,
+parallel, or SymPy-backed modules.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.numerical.allocation_profile import AllocationProfiler, AllocationStage
+    from src.numerical.archive import ArchiveReader, ArchiveWriter, write_archive
+    from src.numerical.cache import CanonicalizationCache
+    from src.numerical.classifier import NotAQuadricError, QuadricClassifier, classify, classify_many
+    from src.numerical.generator import GeneratedQuadrics, generate_quadrics
+    from src.numerical.models import (
+        AffineTransformation,
+        BatchCanonicalization,
+        CanonicalizationResult,
+        ClassificationStrategy,
+        QuadricMatrices,
+        QuadricMatrixBatch,
+        QuadricType,
+        TransformationKind,
+        ValidationMode,
+    )
+    from src.numerical.parser import QuadricParser
+    from src.numerical.canonicalize import (
+        QuadricCanonicalizer,
+        batch_result,
+        canonize_coefficients,
+        canonize_coefficients_many,
+        canonize_matrix,
+        canonize_matrix_many,
+        canonize_quadric,
+        recanonize_matrix,
+    )
+    from src.numerical.parallel import CanonicalizationFailure, canonize_parallel, iter_canonize_parallel
+    from src.numerical.persistent_cache import PersistentCanonicalizationCache
+    from src.numerical.result_table import ResultTable
+    from src.numerical.stage_timings import PipelineStage, PipelineTimings
+    from src.numerical.sweep import ParameterSweep, TypeTransition, sweep_parameters
+
+# Public names map to their defining module, which is imported on first access.
+_EXPORTS = {
+    "AllocationProfiler": "src.numerical.allocation_profile",
+    "AllocationStage": "src.numerical.allocation_profile",
+    "ArchiveReader": "src.numerical.archive",
+    "ArchiveWriter": "src.numerical.archive",
+    "write_archive": "src.numerical.archive",
+    "CanonicalizationCache": "src.numerical.cache",
+    "NotAQuadricError": "src.numerical.classifier",
+    "QuadricClassifier": "src.numerical.classifier",
+    "classify": "src.numerical.classifier",
+    "classify_many": "src.numerical.classifier",
+    "GeneratedQuadrics": "src.numerical.generator",
+    "generate_quadrics": "src.numerical.generator",
+    "AffineTransformation": "src.numerical.models",
+    "BatchCanonicalization": "src.numerical.models",
+    "CanonicalizationResult": "src.numerical.models",
+    "ClassificationStrategy": "src.numerical.models",
+    "QuadricMatrices": "src.numerical.models",
+    "QuadricMatrixBatch": "src.numerical.models",
+    "QuadricType": "src.numerical.models",
+    "TransformationKind": "src.numerical.models",
+    "ValidationMode": "src.numerical.models",
+    "QuadricParser": "src.numerical.parser",
+    "QuadricCanonicalizer": "src.numerical.canonicalize",
+    "batch_result": "src.numerical.canonicalize",
+    "canonize_coefficients": "src.numerical.canonicalize",
+    "canonize_coefficients_many": "src.numerical.canonicalize",
+    "canonize_matrix": "src.numerical.canonicalize",
+    "canonize_matrix_many": "src.numerical.canonicalize",
+    "canonize_quadric": "src.numerical.canonicalize",
+    "recanonize_matrix": "src.numerical.canonicalize",
+    "CanonicalizationFailure": "src.numerical.parallel",
+    "canonize_parallel": "src.numerical.parallel",
+    "iter_canonize_parallel": "src.numerical.parallel",
+    "PersistentCanonicalizationCache": "src.numerical.persistent_cache",
+    "ResultTable": "src.numerical.result_table",
+    "PipelineStage": "src.numerical.stage_timings",
+    "PipelineTimings": "src.numerical.stage_timings",
+    "ParameterSweep": "src.numerical.sweep",
+    "TypeTransition": "src.numerical.sweep",
+    "sweep_parameters": "src.numerical.sweep",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module that defines ``name`` and cache the attribute."""
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily exported names alongside the loaded ones."""
+
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "CanonicalizationResult",
     "AffineTransformation",
+    "AllocationProfiler",
+    "AllocationStage",
+    "ArchiveReader",
+    "ArchiveWriter",
+    "BatchCanonicalization",
+    "CanonicalizationCache",
+    "CanonicalizationFailure",
+    "ClassificationStrategy",
+    "GeneratedQuadrics",
     "NotAQuadricError",
+    "PersistentCanonicalizationCache",
+    "PipelineStage",
+    "PipelineTimings",
     "QuadricCanonicalizer",
     "QuadricClassifier",
     "QuadricMatrices",
+    "QuadricMatrixBatch",
     "QuadricParser",
     "QuadricType",
+    "ParameterSweep",
+    "ResultTable",
+    "TypeTransition",
     "TransformationKind",
+    "ValidationMode",
+    "batch_result",
+    "canonize_coefficients",
+    "canonize_coefficients_many",
+    "canonize_matrix",
+    "canonize_matrix_many",
+    "canonize_parallel",
     "canonize_quadric",
+    "classify",
+    "classify_many",
+    "generate_quadrics",
+    "iter_canonize_parallel",
+    "recanonize_matrix",
+    "sweep_parameters",
+    "write_archive",
 ]
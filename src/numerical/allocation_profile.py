@@ -0,0 +1,187 @@
+"""
+Account for memory allocated by canonicalization and surface construction.
+
+An :class:`AllocationProfiler` passed to :class:`QuadricCanonicalizer` or
+:class:`SurfaceSpecFactory` measures each profiled stage with
+:mod:`tracemalloc`: the peak traced memory above the stage's starting point
+and the bytes still held when it returns. Stages nest (``canonize`` contains
+``build_result``) without losing the enclosing stage's peak. Tracing starts
+on the first profiled stage and slows every allocation in the process, so the
+profiler is meant for diagnostics and budget tests, not production runs.
+
+Run the allocation tests with ``python -m pytest tests/test_allocation_profile.py -q``.
+"""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+
+class AllocationStage(StrEnum):
+    """Name the stages wrapped by allocation profiling."""
+
+    CANONIZE = "canonize"
+    BUILD_RESULT = "build_result"
+    SURFACE_SPEC = "surface_spec"
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationStatistics:
+    """
+    Summarize the allocations of every call to one stage.
+
+    Args:
+        calls: int
+            Number of profiled calls.
+        peak_bytes: int
+            Largest peak of traced memory above a call's starting point.
+        total_peak_bytes: int
+            Sum of the per-call peaks.
+        retained_bytes: int
+            Net traced memory still held after all calls returned.
+        max_retained_bytes: int
+            Largest net memory held by a single call on return.
+    return: AllocationStatistics
+        Immutable snapshot of one stage.
+    """
+
+    calls: int
+    peak_bytes: int
+    total_peak_bytes: int
+    retained_bytes: int
+    max_retained_bytes: int
+
+    @property
+    def mean_peak_bytes(self) -> float:
+        """Return the average per-call peak."""
+
+        return self.total_peak_bytes / self.calls if self.calls else 0.0
+
+
+class AllocationProfiler:
+    """
+    Record peak and retained traced memory per profiled stage.
+
+    The profiler starts :mod:`tracemalloc` on first use when it is not already
+    tracing and stops it again in :meth:`stop` or on leaving a ``with`` block.
+    Tracing is process-wide, so profile one thread at a time.
+    """
+
+    _statistics: dict[str, AllocationStatistics]
+    _frames: list[list[int]]
+    _started: bool
+
+    def __init__(self) -> None:
+        self._statistics = {}
+        self._frames = []
+        self._started = False
+
+    def __enter__(self) -> AllocationProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start tracing unless :mod:`tracemalloc` is already running."""
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+
+    def stop(self) -> None:
+        """Stop tracing if this profiler started it; recorded statistics are kept."""
+
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """
+        Measure the traced memory of one call to a stage.
+
+        Args:
+            stage: str
+                Stage name, usually an :class:`AllocationStage`.
+            return: collections.abc.Iterator[None]
+                Context manager profiling its body, including when it raises.
+        """
+
+        self.start()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._frames:
+            # Keep the enclosing stage's peak before the shared counter is reset.
+            self._frames[-1][1] = max(self._frames[-1][1], peak)
+        tracemalloc.reset_peak()
+        frame = [current, current]
+        self._frames.append(frame)
+        try:
+            yield
+        finally:
+            self._frames.pop()
+            after, peak = tracemalloc.get_traced_memory()
+            peak = max(frame[1], peak)
+            if self._frames:
+                self._frames[-1][1] = max(self._frames[-1][1], peak)
+            self._record(str(stage), peak - frame[0], after - frame[0])
+
+    def statistics(self, stage: str) -> AllocationStatistics | None:
+        """Return the summary of one stage, or ``None`` when it was never profiled."""
+
+        return self._statistics.get(str(stage))
+
+    def reset(self) -> None:
+        """Drop every recorded statistic."""
+
+        self._statistics.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Export the per-stage statistics as JSON-ready values.
+
+        Args:
+            return: dict[str, typing.Any]
+                One mapping per stage name with byte counts and call totals.
+        """
+
+        return {
+            "unit": "bytes",
+            "stages": {
+                stage: {
+                    "calls": statistics.calls,
+                    "peak": statistics.peak_bytes,
+                    "mean_peak": statistics.mean_peak_bytes,
+                    "retained": statistics.retained_bytes,
+                    "max_retained": statistics.max_retained_bytes,
+                }
+                for stage, statistics in sorted(self._statistics.items())
+            },
+        }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Serialize :meth:`to_dict` as JSON text."""
+
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def _record(self, stage: str, peak: int, retained: int) -> None:
+        """Fold one call into the running statistics of its stage."""
+
+        previous = self._statistics.get(stage, AllocationStatistics(0, 0, 0, 0, 0))
+        self._statistics[stage] = AllocationStatistics(
+            calls=previous.calls + 1,
+            peak_bytes=max(previous.peak_bytes, peak),
+            total_peak_bytes=previous.total_peak_bytes + peak,
+            retained_bytes=previous.retained_bytes + retained,
+            max_retained_bytes=max(previous.max_retained_bytes, retained) if previous.calls else retained,
+        )
+
+
+__all__ = ["AllocationProfiler", "AllocationStage", "AllocationStatistics"]
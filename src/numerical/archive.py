@@ -0,0 +1,316 @@
+"""
+Archive canonicalization results in a memory-mappable binary file.
+
+The file starts with a fixed 64-byte header (magic, format version, record
+size) followed by fixed-width little-endian records holding the type code,
+center flag, three stage matrices, rotation, and translation of one result.
+Writers append in chunks and ``fsync`` each one, so a crash leaves at most a
+torn trailing record, which readers ignore. Readers map the records with
+``np.memmap``: columns, type filters, and row lookups read the page cache
+directly instead of unpickling or re-running the canonicalization.
+
+Run the archive tests with ``python -m pytest tests/test_archive.py -q``.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+
+import numpy as np
+import numpy.typing as npt
+
+from src.numerical.models import BoolArray, CanonicalizationResult, QuadricType
+from src.numerical.result_table import ResultTable
+
+
+ARCHIVE_MAGIC = b"QUADARCH"
+ARCHIVE_VERSION = 1
+HEADER_SIZE = 64
+DEFAULT_CHUNK_RECORDS = 4096
+RECORD_DTYPE = np.dtype(
+    [
+        ("quadric_type", "i1"),
+        ("centered", "?"),
+        ("padding", "V6"),
+        ("initial_matrix", "<f8", (4, 4)),
+        ("middle_matrix", "<f8", (4, 4)),
+        ("final_matrix", "<f8", (4, 4)),
+        ("rotation_matrix", "<f8", (3, 3)),
+        ("translation_vector", "<f8", (3,)),
+    ]
+)
+_HEADER = struct.Struct("<8sII")
+
+
+class ArchiveFormatError(ValueError):
+    """Raised when a file is not a result archive this version can read."""
+
+
+def _header() -> bytes:
+    return _HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, RECORD_DTYPE.itemsize).ljust(HEADER_SIZE, b"\0")
+
+
+def _check_header(header: bytes, path: Path) -> None:
+    """Reject files with a foreign magic, version, or record layout."""
+
+    if len(header) < HEADER_SIZE:
+        raise ArchiveFormatError(f"{path} is too short to hold an archive header")
+    magic, version, record_size = _HEADER.unpack_from(header)
+    if magic != ARCHIVE_MAGIC:
+        raise ArchiveFormatError(f"{path} is not a result archive")
+    if version != ARCHIVE_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ArchiveFormatError(
+            f"{path} uses archive version {version} with {record_size}-byte records; "
+            f"expected version {ARCHIVE_VERSION} with {RECORD_DTYPE.itemsize}-byte records"
+        )
+
+
+def _records_from_table(table: ResultTable) -> npt.NDArray[np.void]:
+    records = np.zeros(len(table), dtype=RECORD_DTYPE)
+    records["quadric_type"] = table.quadric_types
+    records["centered"] = table.centered
+    records["initial_matrix"] = table.initial_matrices
+    records["middle_matrix"] = table.middle_matrices
+    records["final_matrix"] = table.final_matrices
+    records["rotation_matrix"] = table.rotation_matrices
+    records["translation_vector"] = table.translation_vectors
+    return records
+
+
+class ArchiveWriter:
+    """
+    Append results to an archive, creating it with a header when missing.
+
+    Args:
+        path: str | os.PathLike[str]
+            Archive file. An existing archive is validated and appended to; a
+            torn trailing record from an interrupted write is discarded.
+        chunk_records: int
+            Number of records buffered before each write and ``fsync``.
+    """
+
+    path: Path
+    chunk_records: int
+
+    def __init__(self, path: str | os.PathLike[str], chunk_records: int = DEFAULT_CHUNK_RECORDS) -> None:
+        if chunk_records < 1:
+            raise ValueError("chunk_records must be at least one")
+        self.path = Path(path)
+        self.chunk_records = chunk_records
+        self._pending: list[CanonicalizationResult] = []
+        self._file: BinaryIO = open(self.path, "a+b")
+        self._file.seek(0)
+        header = self._file.read(HEADER_SIZE)
+        if header:
+            _check_header(header, self.path)
+            size = os.fstat(self._file.fileno()).st_size
+            complete = HEADER_SIZE + (size - HEADER_SIZE) // RECORD_DTYPE.itemsize * RECORD_DTYPE.itemsize
+            if complete != size:
+                self._file.truncate(complete)
+        else:
+            self._file.write(_header())
+            self._sync()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def append(self, result: CanonicalizationResult) -> None:
+        """Buffer one result, writing the chunk once it is full."""
+
+        self._pending.append(result)
+        if len(self._pending) >= self.chunk_records:
+            self.flush()
+
+    def extend(self, results: Iterable[CanonicalizationResult]) -> None:
+        """Buffer many results, writing every full chunk."""
+
+        for result in results:
+            self.append(result)
+
+    def write_table(self, table: ResultTable) -> None:
+        """
+        Write a columnar table directly, in durable chunks.
+
+        Args:
+            table: ResultTable
+                Rows appended in table order after any buffered results.
+        """
+
+        self.flush()
+        for start in range(0, len(table), self.chunk_records):
+            self._file.write(_records_from_table(table[start : start + self.chunk_records]).tobytes())
+            self._sync()
+
+    def flush(self) -> None:
+        """Write and ``fsync`` the buffered results."""
+
+        if not self._pending:
+            return
+        self._file.write(_records_from_table(ResultTable.from_results(self._pending)).tobytes())
+        self._sync()
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush the buffered results and close the file."""
+
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class ArchiveReader:
+    """
+    Map an archive read-only for zero-copy access to its records.
+
+    Args:
+        path: str | os.PathLike[str]
+            Archive written by :class:`ArchiveWriter`. Records appended after
+            the reader opened are not visible until it is reopened.
+    """
+
+    path: Path
+    records: npt.NDArray[np.void]
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            _check_header(file.read(HEADER_SIZE), self.path)
+            size = os.fstat(file.fileno()).st_size
+        count = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        if count == 0:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+        else:
+            self.records = np.memmap(self.path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+    def __len__(self) -> int:
+        return int(self.records.shape[0])
+
+    def close(self) -> None:
+        """Drop the mapping; arrays already taken from it keep it alive."""
+
+        self.records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def table(self) -> ResultTable:
+        """
+        Return every record as a table whose columns view the mapping.
+
+        Args:
+            return: ResultTable
+                Zero-copy table; ``source_indices`` are archive row numbers.
+        """
+
+        records = self.records
+        return ResultTable(
+            quadric_types=records["quadric_type"],
+            centered=records["centered"],
+            initial_matrices=records["initial_matrix"],
+            middle_matrices=records["middle_matrix"],
+            final_matrices=records["final_matrix"],
+            rotation_matrices=records["rotation_matrix"],
+            translation_vectors=records["translation_vector"],
+            source_indices=np.arange(len(records), dtype=np.int64),
+        )
+
+    def type_mask(self, *quadric_types: QuadricType) -> BoolArray:
+        """Return the archive rows whose type is one of ``quadric_types``."""
+
+        return np.isin(self.records["quadric_type"], np.array([int(kind) for kind in quadric_types], dtype=np.int8))
+
+    def of_type(self, *quadric_types: QuadricType) -> ResultTable:
+        """
+        Return the rows of the given types, keeping their archive row numbers.
+
+        Args:
+            quadric_types: QuadricType
+                Accepted types.
+            return: ResultTable
+                In-memory copy of the matching rows.
+        """
+
+        return self.table()[self.type_mask(*quadric_types)]
+
+    def row(self, index: int) -> CanonicalizationResult:
+        """
+        Materialize one archive row as a result model.
+
+        Args:
+            index: int
+                Row number, negative values counting from the end.
+            return: CanonicalizationResult
+                Result holding copies of the record's arrays.
+        """
+
+        if not -len(self) <= index < len(self):
+            raise IndexError("archive row out of range")
+        record = self.records[index]
+        return CanonicalizationResult.trusted(
+            quadric_type=QuadricType(int(record["quadric_type"])),
+            centered=bool(record["centered"]),
+            initial_matrix=np.array(record["initial_matrix"], dtype=np.float64),
+            middle_matrix=np.array(record["middle_matrix"], dtype=np.float64),
+            final_matrix=np.array(record["final_matrix"], dtype=np.float64),
+            translation_vector=np.array(record["translation_vector"], dtype=np.float64),
+            rotation_matrix=np.array(record["rotation_matrix"], dtype=np.float64),
+        )
+
+
+def write_archive(path: str | os.PathLike[str], results: Iterable[CanonicalizationResult] | ResultTable) -> int:
+    """
+    Append results to an archive, creating it when missing.
+
+    Args:
+        path: str | os.PathLike[str]
+            Archive file.
+        results: collections.abc.Iterable[CanonicalizationResult] | ResultTable
+            Results or a columnar table to append.
+        return: int
+            Number of records in the archive afterwards.
+    """
+
+    with ArchiveWriter(path) as writer:
+        if isinstance(results, ResultTable):
+            writer.write_table(results)
+        else:
+            writer.extend(results)
+    return (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+
+
+__all__ = [
+    "ARCHIVE_MAGIC",
+    "ARCHIVE_VERSION",
+    "ArchiveFormatError",
+    "ArchiveReader",
+    "ArchiveWriter",
+    "HEADER_SIZE",
+    "RECORD_DTYPE",
+    "write_archive",
+]
@@ -0,0 +1,291 @@
+"""
+Canonicalize stacks of quadrics with batched NumPy kernels.
+
+Each kernel mirrors one scalar strategy of
+:mod:`src.numerical.canonicalize` row for row: rows are grouped by
+:class:`QuadricType`, their stacked eigenpairs come from one
+:class:`QuadricInvariantBatch`, and every congruence is a batched
+``T.T @ A @ T`` product.
+
+Run the batch checks with ``python -m pytest tests/test_transformer.py -q -k many``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.numerical.classifier import UNCLASSIFIED
+from src.numerical.invariants import ROUNDOFF_FACTOR, QuadricInvariantBatch
+from src.numerical.models import BatchCanonicalization, BoolArray, FloatArray, Int8Array, IntArray, QuadricType
+from src.numerical.numerical_helpers import batch_relative_tolerance
+
+
+CENTERED_TYPES = frozenset(
+    {
+        QuadricType.REAL_ELLIPSOID,
+        QuadricType.COMPLEX_ELLIPSOID,
+        QuadricType.ONE_SHEET_HYPERBOLOID,
+        QuadricType.TWO_SHEET_HYPERBOLOID,
+        QuadricType.REAL_CONE,
+        QuadricType.COMPLEX_CONE,
+    }
+)
+
+UNSUPPORTED_INVARIANTS_MESSAGE = "unsupported quadric invariants"
+
+
+@dataclass(frozen=True, slots=True)
+class _KernelOutput:
+    """Store normalized stage matrices and transformations for one row group."""
+
+    middle: FloatArray
+    final: FloatArray
+    basis: FloatArray
+    coordinate_translation: FloatArray
+    failures: tuple[tuple[int, str], ...]
+
+
+def _row_thresholds(values: FloatArray) -> FloatArray:
+    """Return per-row roundoff thresholds broadcastable against ``values``."""
+
+    threshold = batch_relative_tolerance(values, ROUNDOFF_FACTOR)
+    return threshold.reshape((-1,) + (1,) * (values.ndim - 1))
+
+
+def _clean_roundoff(values: FloatArray) -> FloatArray:
+    """Set scale-relative cancellation artifacts of every row to zero."""
+
+    return np.where(np.abs(values) < _row_thresholds(values), 0.0, values)
+
+
+def _rotate(homogeneous: FloatArray, basis: FloatArray) -> FloatArray:
+    """Return ``R.T @ M @ R`` for homogeneous rotations built from each basis."""
+
+    rotation = np.zeros_like(homogeneous)
+    rotation[:, :3, :3] = basis
+    rotation[:, 3, 3] = 1.0
+    return np.swapaxes(rotation, 1, 2) @ homogeneous @ rotation
+
+
+def _translate(homogeneous: FloatArray, offset: FloatArray) -> FloatArray:
+    """Return ``T.T @ M @ T`` for homogeneous translations by each offset."""
+
+    translation = np.broadcast_to(np.eye(4), homogeneous.shape).copy()
+    translation[:, :3, 3] = offset
+    return np.swapaxes(translation, 1, 2) @ homogeneous @ translation
+
+
+def _ordered_proper_eigenbases(
+    quadratic: FloatArray,
+    eigenvalues: FloatArray,
+    eigenvectors: FloatArray,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Order every eigenbasis positive-negative-null and make it proper.
+
+    Args:
+        quadratic: numpy.ndarray
+            Quadratic blocks with shape ``(M, 3, 3)`` defining each threshold.
+        eigenvalues: numpy.ndarray
+            Ascending eigenvalues with shape ``(M, 3)``.
+        eigenvectors: numpy.ndarray
+            Matching eigenvector columns with shape ``(M, 3, 3)``.
+        return: tuple[numpy.ndarray, numpy.ndarray]
+            Ordered cleaned eigenvalues and determinant-one bases.
+    """
+
+    threshold = batch_relative_tolerance(quadratic, ROUNDOFF_FACTOR)[:, np.newaxis]
+    cleaned = np.where(np.abs(eigenvalues) < threshold, 0.0, eigenvalues)
+    category = np.where(cleaned > 0.0, 0, np.where(cleaned < 0.0, 1, 2))
+    # Ties keep the ascending LAPACK order, matching the scalar concatenation.
+    order = np.argsort(3 * category + np.arange(3), axis=1)
+    ordered_values = np.take_along_axis(cleaned, order, axis=1)
+    ordered_vectors = np.take_along_axis(eigenvectors, order[:, np.newaxis, :], axis=2)
+    improper = np.linalg.det(ordered_vectors) < 0
+    ordered_vectors[improper, :, 2] *= -1
+    return ordered_values, ordered_vectors
+
+
+def _centered_kernel(invariants: QuadricInvariantBatch, rows: IntArray) -> _KernelOutput:
+    """Batch :func:`src.numerical.canonicalize.centered_quadric`."""
+
+    homogeneous = invariants.homogeneous[rows]
+    diagonal, basis = _ordered_proper_eigenbases(
+        invariants.quadratic[rows],
+        invariants.quadratic_eigenvalues[rows],
+        invariants.quadratic_eigenvectors[rows],
+    )
+    middle = _rotate(homogeneous, basis)
+    singular = np.any(np.abs(diagonal) <= _row_thresholds(diagonal), axis=1)
+    transformed_linear = np.einsum("nji,nj->ni", basis, homogeneous[:, :3, 3])
+    safe_diagonal = np.where(singular[:, np.newaxis], 1.0, diagonal)
+    coordinate_translation = -transformed_linear / safe_diagonal
+    final = _translate(middle, coordinate_translation)
+    failures = tuple(
+        (int(row), "full-rank canonicalization requires three non-zero eigenvalues")
+        for row in rows[singular]
+    )
+    return _KernelOutput(middle, final, basis, coordinate_translation, failures)
+
+
+def _acentered_kernel(invariants: QuadricInvariantBatch, rows: IntArray) -> _KernelOutput:
+    """Batch the rank-one and rank-two branches of ``acentered_quadric``."""
+
+    homogeneous = invariants.homogeneous[rows]
+    diagonal, basis = _ordered_proper_eigenbases(
+        invariants.quadratic[rows],
+        invariants.quadratic_eigenvalues[rows],
+        invariants.quadratic_eigenvectors[rows],
+    )
+    middle = _rotate(homogeneous, basis)
+    linear = middle[:, :3, 3]
+    active = np.abs(diagonal) > _row_thresholds(diagonal)
+    rank = np.count_nonzero(active, axis=1)
+    safe_diagonal = np.where(active, diagonal, 1.0)
+    coordinate_translation = np.where(active, -linear / safe_diagonal, 0.0)
+    null_linear = np.abs(linear) > _row_thresholds(linear)
+
+    # Rank two: complete both squares, then cancel the constant along the
+    # null axis when it carries a linear term.
+    reduced_constant = middle[:, 3, 3] - np.sum(np.where(active, linear**2 / safe_diagonal, 0.0), axis=1)
+    null_index = np.argmin(active, axis=1)
+    null_value = np.take_along_axis(linear, null_index[:, np.newaxis], axis=1)[:, 0]
+    shifts_null_axis = (rank == 2) & np.take_along_axis(null_linear, null_index[:, np.newaxis], axis=1)[:, 0]
+    safe_null_value = np.where(shifts_null_axis, null_value, 1.0)
+    null_translation = np.where(shifts_null_axis, -reduced_constant / (2.0 * safe_null_value), 0.0)
+    positions = np.arange(rows.size)
+    coordinate_translation[positions, null_index] += null_translation
+
+    final = _translate(middle, coordinate_translation)
+    unexpected_null = (rank == 1) & np.any(null_linear & ~active, axis=1)
+    failures = [
+        (int(row), f"non-centered canonicalization requires rank one or two; received rank {int(row_rank)}")
+        for row, row_rank in zip(rows[(rank != 1) & (rank != 2)], rank[(rank != 1) & (rank != 2)])
+    ]
+    failures.extend(
+        (int(row), "rank-one non-parabolic quadric has an unexpected null-space linear term")
+        for row in rows[unexpected_null]
+    )
+    return _KernelOutput(middle, final, basis, coordinate_translation, tuple(failures))
+
+
+def _parabolic_kernel(invariants: QuadricInvariantBatch, rows: IntArray) -> _KernelOutput:
+    """Batch :func:`src.numerical.parabolic_cylinder.parabolic_cylinder_canonize`."""
+
+    homogeneous = invariants.homogeneous[rows]
+    eigenvalues = invariants.quadratic_eigenvalues[rows]
+    eigenvectors = invariants.quadratic_eigenvectors[rows]
+    nonzero = np.abs(eigenvalues) > _row_thresholds(invariants.quadratic[rows])[:, :, 0]
+    rank_one = np.count_nonzero(nonzero, axis=1) == 1
+    quadratic_index = np.argmax(nonzero, axis=1)
+    quadratic_value = np.take_along_axis(eigenvalues, quadratic_index[:, np.newaxis], axis=1)[:, 0]
+    quadratic_value = np.where(rank_one, quadratic_value, 1.0)
+    quadratic_direction = np.take_along_axis(eigenvectors, quadratic_index[:, np.newaxis, np.newaxis], axis=2)[:, :, 0]
+    linear = homogeneous[:, :3, 3]
+    quadratic_linear = np.einsum("ni,ni->n", quadratic_direction, linear)
+    null_linear = linear - quadratic_linear[:, np.newaxis] * quadratic_direction
+    null_linear_norm = np.linalg.norm(null_linear, axis=1)
+    has_null_linear = null_linear_norm > _row_thresholds(linear)[:, 0]
+    safe_norm = np.where(has_null_linear, null_linear_norm, 1.0)
+
+    parabolic_direction = null_linear / safe_norm[:, np.newaxis]
+    free_direction = np.cross(quadratic_direction, parabolic_direction)
+    free_norm = np.linalg.norm(free_direction, axis=1)
+    free_direction /= np.where(free_norm > 0, free_norm, 1.0)[:, np.newaxis]
+    basis = np.stack([quadratic_direction, parabolic_direction, free_direction], axis=2)
+    improper = np.linalg.det(basis) < 0
+    basis[improper, :, 2] *= -1
+
+    reduced_constant = homogeneous[:, 3, 3] - quadratic_linear * quadratic_linear / quadratic_value
+    coordinate_translation = np.stack(
+        [
+            -quadratic_linear / quadratic_value,
+            -reduced_constant / (2.0 * safe_norm),
+            np.zeros(rows.size),
+        ],
+        axis=1,
+    )
+    middle = _rotate(homogeneous, basis)
+    final = _translate(middle, coordinate_translation)
+    failures = [
+        (int(row), "a parabolic cylinder must have a rank-one quadratic block") for row in rows[~rank_one]
+    ]
+    failures.extend(
+        (int(row), "a parabolic cylinder must have a linear term in the quadratic null space")
+        for row in rows[rank_one & ~has_null_linear]
+    )
+    return _KernelOutput(middle, final, basis, coordinate_translation, tuple(failures))
+
+
+def canonize_invariant_batch(
+    invariants: QuadricInvariantBatch,
+    quadric_types: Int8Array,
+    errors: tuple[str | None, ...] | None = None,
+) -> BatchCanonicalization:
+    """
+    Canonicalize classified batch invariants with one kernel per strategy.
+
+    Args:
+        invariants: QuadricInvariantBatch
+            Normalized matrices and stacked eigenpairs of every row.
+        quadric_types: numpy.ndarray
+            ``int8`` classification of every row; :data:`UNCLASSIFIED` rows fail.
+        errors: tuple[str | None, ...] | None
+            Earlier per-row errors, for example from parsing, that are kept.
+        return: BatchCanonicalization
+            Stacked stage matrices and transformations at the input scale.
+    """
+
+    count = len(invariants)
+    row_errors: list[str | None] = list(errors) if errors is not None else [None] * count
+    if len(row_errors) != count or quadric_types.shape != (count,):
+        raise ValueError("quadric_types and errors must contain one entry per batch row")
+    for row in np.flatnonzero(~invariants.valid):
+        row_errors[row] = row_errors[row] or "quadric matrix cannot be identically zero"
+    for row in np.flatnonzero(invariants.valid & (quadric_types == UNCLASSIFIED)):
+        row_errors[row] = row_errors[row] or UNSUPPORTED_INVARIANTS_MESSAGE
+    eligible = np.array([error is None for error in row_errors], dtype=np.bool_)
+
+    middle = np.zeros((count, 4, 4), dtype=np.float64)
+    final = np.zeros((count, 4, 4), dtype=np.float64)
+    basis = np.zeros((count, 3, 3), dtype=np.float64)
+    coordinate_translation = np.zeros((count, 3), dtype=np.float64)
+    centered_mask = np.isin(quadric_types, [int(quadric_type) for quadric_type in CENTERED_TYPES])
+    parabolic_mask = quadric_types == QuadricType.PARABOLIC_CYLINDER
+    groups = (
+        (_centered_kernel, eligible & centered_mask),
+        (_parabolic_kernel, eligible & parabolic_mask),
+        (_acentered_kernel, eligible & ~centered_mask & ~parabolic_mask),
+    )
+    for kernel, mask in groups:
+        rows = np.flatnonzero(mask)
+        if rows.size == 0:
+            continue
+        with np.errstate(divide="ignore", invalid="ignore"):
+            output = kernel(invariants, rows)
+        middle[rows] = output.middle
+        final[rows] = output.final
+        basis[rows] = output.basis
+        coordinate_translation[rows] = output.coordinate_translation
+        for failed_row, message in output.failures:
+            row_errors[failed_row] = row_errors[failed_row] or message
+
+    error_mask: BoolArray = np.array([error is not None for error in row_errors], dtype=np.bool_)
+    succeeded = ~error_mask
+    scale = np.where(succeeded, invariants.scale, 0.0)[:, np.newaxis, np.newaxis]
+    return BatchCanonicalization(
+        quadric_types=np.where(succeeded, quadric_types, UNCLASSIFIED).astype(np.int8),
+        centered=succeeded & centered_mask,
+        initial_matrices=invariants.homogeneous * scale,
+        middle_matrices=_clean_roundoff(middle) * scale,
+        final_matrices=_clean_roundoff(final) * scale,
+        rotation_matrices=np.where(succeeded[:, np.newaxis, np.newaxis], np.swapaxes(basis, 1, 2), 0.0),
+        translation_vectors=np.where(succeeded[:, np.newaxis], -coordinate_translation, 0.0),
+        error_mask=error_mask,
+        errors=tuple(row_errors),
+    )
+
+
+__all__ = ["UNSUPPORTED_INVARIANTS_MESSAGE", "canonize_invariant_batch"]
@@ -0,0 +1,268 @@
+"""
+Cache canonicalization results in a bounded, scale-invariant LRU.
+
+The first level is keyed on whitespace-normalized equation text. The second
+level is keyed on the homogeneous matrix divided by its largest entry and
+quantized to a grid, so positive scalar multiples of a cached quadric are
+answered by rescaling the cached stage matrices instead of recomputing them.
+The grid only selects an entry: a hit also requires the normalized matrix to
+equal the stored one exactly, because quadrics closer than any grid can still
+fall on different sides of the classifier's roundoff thresholds.
+
+Run the cache tests with ``python -m pytest tests/test_cache.py -q``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Protocol, TypeVar
+
+import numpy as np
+
+from src.numerical.models import CanonicalizationResult, FloatArray
+
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_QUANTUM = 1e-12
+
+_Key = TypeVar("_Key")
+_Value = TypeVar("_Value")
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStatistics:
+    """
+    Report cache effectiveness counters.
+
+    Args:
+        hits: int
+            Lookups answered by the equation-text level.
+        scaled_hits: int
+            Lookups answered by rescaling a second-level matrix entry.
+        misses: int
+            Matrix lookups that had to be canonicalized.
+        evictions: int
+            Entries dropped from either level to respect ``maxsize``.
+        size: int
+            Entries currently held across both levels.
+    return: CacheStatistics
+        Immutable snapshot of the counters.
+    """
+
+    hits: int
+    scaled_hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class ResultCache(Protocol):
+    """Describe the lookups :class:`QuadricCanonicalizer` performs on a cache."""
+
+    @property
+    def statistics(self) -> CacheStatistics: ...
+
+    def get_text(self, eq: str) -> CanonicalizationResult | None: ...
+
+    def put_text(self, eq: str, result: CanonicalizationResult) -> None: ...
+
+    def get_matrix(self, homogeneous: FloatArray) -> CanonicalizationResult | None: ...
+
+    def put_matrix(self, homogeneous: FloatArray, result: CanonicalizationResult) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+def normalize_equation_text(eq: str) -> str:
+    """Return the first-level key of an equation: its text without whitespace."""
+
+    return "".join(eq.split())
+
+
+def scale_normalized_key(homogeneous: FloatArray, quantum: float) -> tuple[bytes, float, FloatArray]:
+    """
+    Return the second-level key of a matrix, its scale, and its normalized form.
+
+    Args:
+        homogeneous: numpy.ndarray
+            Symmetric 4x4 matrix of one quadric.
+        quantum: float
+            Grid spacing applied to the entries after dividing by the largest one.
+        return: tuple[bytes, float, numpy.ndarray]
+            Quantized ``int64`` entries as bytes, the largest absolute entry,
+            and the matrix divided by it, which a hit must match exactly.
+    """
+
+    scale = float(np.max(np.abs(homogeneous)))
+    if scale == 0:
+        raise ValueError("quadric matrix cannot be identically zero")
+    normalized = np.asarray(homogeneous, dtype=np.float64) / scale
+    quantized = np.round(normalized / quantum).astype(np.int64)
+    return quantized.tobytes(), scale, normalized
+
+
+def rescaled_result(
+    result: CanonicalizationResult,
+    cached_scale: float,
+    homogeneous: FloatArray,
+    scale: float,
+) -> CanonicalizationResult:
+    """
+    Adapt a cached result to a positive multiple of its input matrix.
+
+    Args:
+        result: CanonicalizationResult
+            Result cached for a matrix whose largest entry was ``cached_scale``.
+        cached_scale: float
+            Largest absolute entry of the cached input matrix.
+        homogeneous: numpy.ndarray
+            Requested matrix, reported as the initial stage.
+        scale: float
+            Largest absolute entry of ``homogeneous``.
+        return: CanonicalizationResult
+            Result with rescaled middle and final stages and unchanged motion.
+    """
+
+    if np.array_equal(result.initial_matrix, homogeneous):
+        return result
+    factor = scale / cached_scale
+    return CanonicalizationResult.trusted(
+        quadric_type=result.quadric_type,
+        centered=result.centered,
+        initial_matrix=np.array(homogeneous, dtype=np.float64),
+        middle_matrix=result.middle_matrix * factor,
+        final_matrix=result.final_matrix * factor,
+        translation_vector=result.translation_vector,
+        rotation_matrix=result.rotation_matrix,
+    )
+
+
+class CanonicalizationCache:
+    """
+    Hold recent results under text and scale-normalized matrix keys.
+
+    Args:
+        maxsize: int
+            Maximum number of entries kept by each level.
+        quantum: float
+            Grid spacing applied to the scale-normalized matrix entries; two
+            matrices share a key when every entry rounds to the same multiple,
+            and a shared key is a hit only for identical normalized matrices.
+    """
+
+    maxsize: int
+    quantum: float
+    _texts: OrderedDict[str, CanonicalizationResult]
+    _matrices: OrderedDict[bytes, tuple[CanonicalizationResult, float, FloatArray]]
+    _lock: Lock
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, quantum: float = DEFAULT_QUANTUM) -> None:
+        if maxsize < 1:
+            raise ValueError("cache maxsize must be at least one")
+        if not 0.0 < quantum < 1.0:
+            raise ValueError("cache quantum must lie in (0, 1)")
+        self.maxsize = maxsize
+        self.quantum = quantum
+        self._texts = OrderedDict()
+        self._matrices = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._scaled_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """Return a snapshot of the hit, miss, and eviction counters."""
+
+        with self._lock:
+            return CacheStatistics(
+                hits=self._hits,
+                scaled_hits=self._scaled_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._texts) + len(self._matrices),
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        with self._lock:
+            self._texts.clear()
+            self._matrices.clear()
+            self._hits = self._scaled_hits = self._misses = self._evictions = 0
+
+    def get_text(self, eq: str) -> CanonicalizationResult | None:
+        """
+        Return the result cached for an equation text, if any.
+
+        Args:
+            eq: str
+                Equation whose whitespace-normalized text is looked up.
+            return: CanonicalizationResult | None
+                Cached result, or ``None`` on a first-level miss.
+        """
+
+        key = normalize_equation_text(eq)
+        with self._lock:
+            result = self._texts.get(key)
+            if result is not None:
+                self._texts.move_to_end(key)
+                self._hits += 1
+            return result
+
+    def put_text(self, eq: str, result: CanonicalizationResult) -> None:
+        """Store a result under its first-level equation-text key."""
+
+        with self._lock:
+            self._insert(self._texts, normalize_equation_text(eq), result)
+
+    def get_matrix(self, homogeneous: FloatArray) -> CanonicalizationResult | None:
+        """
+        Return a cached result for a positive multiple of ``homogeneous``.
+
+        Args:
+            homogeneous: numpy.ndarray
+                Symmetric 4x4 matrix of the requested quadric.
+            return: CanonicalizationResult | None
+                Cached result whose initial matrix is ``homogeneous`` and whose
+                later stages are rescaled to its scale, or ``None`` on a miss.
+        """
+
+        key, scale, normalized = scale_normalized_key(homogeneous, self.quantum)
+        with self._lock:
+            entry = self._matrices.get(key)
+            if entry is None or not np.array_equal(entry[2], normalized):
+                self._misses += 1
+                return None
+            self._matrices.move_to_end(key)
+            self._scaled_hits += 1
+        result, cached_scale, _ = entry
+        return rescaled_result(result, cached_scale, homogeneous, scale)
+
+    def put_matrix(self, homogeneous: FloatArray, result: CanonicalizationResult) -> None:
+        """Store a result with its normalized matrix under the second-level key."""
+
+        key, scale, normalized = scale_normalized_key(homogeneous, self.quantum)
+        with self._lock:
+            self._insert(self._matrices, key, (result, scale, normalized))
+
+    def _insert(self, level: OrderedDict[_Key, _Value], key: _Key, value: _Value) -> None:
+        level[key] = value
+        level.move_to_end(key)
+        while len(level) > self.maxsize:
+            level.popitem(last=False)
+            self._evictions += 1
+
+
+__all__ = [
+    "CacheStatistics",
+    "CanonicalizationCache",
+    "DEFAULT_CACHE_SIZE",
+    "ResultCache",
+    "normalize_equation_text",
+    "rescaled_result",
+    "scale_normalized_key",
+]
@@ -6,28 +6,47 @@ Run the transformation tests with ``python -m pytest tests/test_transformer.py -
 
 from __future__ import annotations
 
+import random
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import numpy as np
-import sympy as sp
-from scipy import linalg as la
+import numpy.typing as npt
 
 from src.numerical.numerical_helpers import (
     clean_near_zero,
-    expression_from_matrix,
     normalize_integer_coefficients,
-    numerical_rank,
     relative_tolerance,
 )
-from src.numerical.classifier import QuadricClassifier
-from src.numerical.models import CanonicalizationResult, FloatArray, QuadricType
+from src.numerical.allocation_profile import AllocationProfiler, AllocationStage
+from src.numerical.batch_canonicalize import UNSUPPORTED_INVARIANTS_MESSAGE, canonize_invariant_batch
+from src.numerical.cache import ResultCache
+from src.numerical.classifier import NotAQuadricError, QuadricClassifier
+from src.numerical.incremental import DEFAULT_MAX_SWEEPS, warm_invariants
+from src.numerical.invariants import QuadricInvariantBatch, QuadricInvariants
+from src.numerical.models import (
+    BatchCanonicalization,
+    CanonicalizationResult,
+    FloatArray,
+    QuadricMatrices,
+    QuadricMatrixBatch,
+    QuadricType,
+    ValidationMode,
+)
 from src.numerical.parabolic_cylinder import parabolic_cylinder_canonize
 from src.numerical.parser import QuadricParser
+from src.numerical.stage_timings import PipelineStage, PipelineTimings
+from src.numerical.symmetric_eigen import eigh3
+
+if TYPE_CHECKING:
+    import sympy as sp
 
 
 NUMERICAL_TOLERANCE = 1e-10
 ROUNDOFF_FACTOR = 100.0
 COEFFICIENT_ROUNDOFF_TOLERANCE = ROUNDOFF_FACTOR * float(np.finfo(np.float64).eps)
+_UNTIMED: AbstractContextManager[None] = nullcontext()
 
 
 @dataclass(frozen=True, slots=True)
@@ -78,7 +97,10 @@ def _clean_roundoff(matrix: FloatArray) -> FloatArray:
     return clean_near_zero(matrix, _roundoff_threshold(matrix))
 
 
-def _proper_symmetric_eigendecomposition(matrix: FloatArray) -> tuple[FloatArray, FloatArray]:
+def _proper_symmetric_eigendecomposition(
+    matrix: FloatArray,
+    invariants: QuadricInvariants | None = None,
+) -> tuple[FloatArray, FloatArray]:
     """
     Diagonalize a symmetric matrix in positive-negative-null eigenvalue order.
 
@@ -89,12 +111,18 @@ def _proper_symmetric_eigendecomposition(matrix: FloatArray) -> tuple[FloatArray
     Args:
         matrix: numpy.ndarray
             Symmetric 3x3 quadratic coefficient matrix.
+        invariants: QuadricInvariants | None
+            Shared invariants whose eigenpairs belong to ``matrix``; when
+            omitted the matrix is decomposed here.
         return: tuple[numpy.ndarray, numpy.ndarray]
             Ordered diagonal eigenvalue matrix and determinant-one eigenvector
             matrix whose columns are the corresponding eigenvectors.
     """
 
-    eigenvalues, eigenvectors = la.eigh(matrix)
+    if invariants is None:
+        eigenvalues, eigenvectors = eigh3(matrix)
+    else:
+        eigenvalues, eigenvectors = invariants.quadratic_eigenvalues, invariants.quadratic_eigenvectors
     ordered_threshold = _roundoff_threshold(matrix)
     cleaned_eigenvalues = clean_near_zero(eigenvalues, ordered_threshold)
     positive_indices = np.flatnonzero(cleaned_eigenvalues > 0.0)
@@ -116,6 +144,7 @@ def centered_quadric(
     A_overline: FloatArray,
     A: FloatArray,
     b: FloatArray,
+    invariants: QuadricInvariants | None = None,
 ) -> TransformationData:
     """
     Canonicalize a full-rank quadric through rotation then translation.
@@ -127,12 +156,15 @@ def centered_quadric(
             Full-rank symmetric quadratic block.
         b: numpy.ndarray
             Linear half-coefficient column.
+        invariants: QuadricInvariants | None
+            Shared invariants of the normalized matrices, reused instead of
+            decomposing ``A`` again.
         return: TransformationData
             Exact stage matrices and active point transformations.
     """
 
     initial_matrix = A_overline.copy()
-    diagonal, basis = _proper_symmetric_eigendecomposition(A)
+    diagonal, basis = _proper_symmetric_eigendecomposition(A, invariants)
     coordinate_rotation = _homogeneous_transform(basis, np.zeros(3, dtype=np.float64))
     middle_matrix = coordinate_rotation.T @ initial_matrix @ coordinate_rotation
     diagonal_values = np.diag(diagonal)
@@ -220,7 +252,8 @@ def acentered_quadric(
     A_overline: FloatArray,
     A: FloatArray,
     b: FloatArray,
-    eq: str,
+    eq: str | None = None,
+    invariants: QuadricInvariants | None = None,
 ) -> TransformationData:
     """
     Canonicalize a rank-deficient quadric through rotation then translation.
@@ -234,9 +267,12 @@ def acentered_quadric(
             Rank-one or rank-two symmetric quadratic block.
         b: numpy.ndarray
             Linear half-coefficient column.
-        eq: str
+        eq: str | None
             Original equation retained by the parabolic-cylinder compatibility
-            boundary.
+            boundary; matrix and coefficient inputs have none.
+        invariants: QuadricInvariants | None
+            Shared invariants of the normalized matrices, reused instead of
+            decomposing ``A`` again.
         return: TransformationData
             Exact stage matrices and active point transformations.
     """
@@ -244,14 +280,14 @@ def acentered_quadric(
     A_overline_og = A_overline.copy()
     if quadric_type is QuadricType.PARABOLIC_CYLINDER:
         A_overline, basis, coordinate_translation, A_overline_middle = parabolic_cylinder_canonize(
-            A_overline.copy(), A.copy(), b, eq, A_overline_og.copy()
+            A_overline.copy(), A.copy(), b, eq, A_overline_og.copy(), invariants=invariants
         )
     else:
-        diagonal, basis = _proper_symmetric_eigendecomposition(A)
+        diagonal, basis = _proper_symmetric_eigendecomposition(A, invariants)
         coordinate_rotation = _homogeneous_transform(basis, np.zeros(3, dtype=np.float64))
         A_overline_middle = coordinate_rotation.T @ A_overline_og @ coordinate_rotation
         transformed_linear = A_overline_middle[:3, 3].copy()
-        rank = numerical_rank(diagonal, ROUNDOFF_FACTOR)
+        rank = int(np.count_nonzero(np.abs(np.diag(diagonal)) > _roundoff_threshold(diagonal)))
         if rank == 2:
             coordinate_translation = _rank_two_coordinate_translation(
                 A_overline_middle,
@@ -279,14 +315,84 @@ def acentered_quadric(
 
 
 class QuadricCanonicalizer:
-    """Orchestrate parsing, classification, and canonical transformation strategies."""
+    """
+    Orchestrate parsing, classification, and canonical transformation strategies.
+
+    Args:
+        parser: QuadricParser
+            Equation parser used by :meth:`canonize`.
+        classifier: QuadricClassifier
+            Classifier applied to the shared invariants.
+        validation: ValidationMode
+            ``FULL`` re-verifies every result at the public boundary,
+            ``SAMPLED`` re-verifies a random ``sample_rate`` fraction, and
+            ``TRUSTED`` wraps the pipeline arrays without any check.
+        sample_rate: float
+            Fraction of results validated in ``SAMPLED`` mode.
+        seed: int | None
+            Seed of the sampling generator, for reproducible sampled runs.
+        cache: ResultCache | None
+            Optional in-memory or persistent cache consulted by :meth:`canonize` and
+            :meth:`canonize_matrices` before any work is done.
+        timings: PipelineTimings | None
+            Optional recorder of per-stage wall time for every scalar call;
+            cache hits record only the parsing that preceded them, under the
+            cached type, and :meth:`canonize_many` is not timed.
+        allocations: AllocationProfiler | None
+            Optional tracemalloc profiler of :meth:`canonize` and of every
+            result construction.
+    """
 
     parser: QuadricParser
     classifier: QuadricClassifier
-
-    def __init__(self, parser: QuadricParser, classifier: QuadricClassifier) -> None:
+    validation: ValidationMode
+    sample_rate: float
+    cache: ResultCache | None
+    timings: PipelineTimings | None
+    allocations: AllocationProfiler | None
+    _sampler: random.Random
+
+    def __init__(
+        self,
+        parser: QuadricParser,
+        classifier: QuadricClassifier,
+        validation: ValidationMode = ValidationMode.FULL,
+        sample_rate: float = 0.01,
+        seed: int | None = None,
+        cache: ResultCache | None = None,
+        timings: PipelineTimings | None = None,
+        allocations: AllocationProfiler | None = None,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must lie in [0, 1]")
         self.parser = parser
         self.classifier = classifier
+        self.validation = ValidationMode(validation)
+        self.sample_rate = sample_rate
+        self.cache = cache
+        self.timings = timings
+        self.allocations = allocations
+        self._sampler = random.Random(seed)
+
+    def should_validate(self) -> bool:
+        """Return whether the next result goes through full model validation."""
+
+        if self.validation is ValidationMode.FULL:
+            return True
+        if self.validation is ValidationMode.TRUSTED:
+            return False
+        return self._sampler.random() < self.sample_rate
+
+    def _stage(self, stage: PipelineStage) -> AbstractContextManager[None]:
+        """Return the timer of one stage, or a shared no-op context when timing is off."""
+
+        return _timed(self.timings, stage)
+
+    def _parse(self, eq: str) -> QuadricMatrices:
+        with self._stage(PipelineStage.PARSE):
+            coefficients = self.parser.coefficients(eq)
+        with self._stage(PipelineStage.MATRIX_CONSTRUCTION):
+            return QuadricMatrices.from_coefficients(coefficients)
 
     def canonize(self, eq: str) -> CanonicalizationResult:
         """
@@ -299,24 +405,174 @@ class QuadricCanonicalizer:
                 Typed matrices, equations, and transformations for the quadric.
         """
 
-        matrices = self.parser.parse_matrices(eq)
-        matrix_scale = float(np.max(np.abs(matrices.homogeneous)))
-        if matrix_scale == 0:
-            raise ValueError("quadric matrix cannot be identically zero")
-        homogeneous = matrices.homogeneous / matrix_scale
-        quadratic = matrices.quadratic / matrix_scale
+        if self.allocations is not None:
+            with self.allocations.stage(AllocationStage.CANONIZE):
+                return self._canonize_text(eq)
+        return self._canonize_text(eq)
+
+    def _canonize_text(self, eq: str) -> CanonicalizationResult:
+        if self.cache is None:
+            return self.canonize_matrices(self._parse(eq), eq)
+        result = self.cache.get_text(eq)
+        if result is None:
+            result = self.canonize_matrices(self._parse(eq), eq)
+            self.cache.put_text(eq, result)
+        return result
+
+    def canonize_matrices(self, matrices: QuadricMatrices, eq: str | None = None) -> CanonicalizationResult:
+        """
+        Transform already-constructed matrices into a validated result.
+
+        Args:
+            matrices: QuadricMatrices
+                Homogeneous, quadratic, and linear forms of one quadric.
+            eq: str | None
+                Source equation when the matrices were parsed from text.
+            return: CanonicalizationResult
+                Typed matrices, equations, and transformations for the quadric.
+        """
+
+        if self.cache is not None:
+            cached = self.cache.get_matrix(matrices.homogeneous)
+            if cached is not None:
+                if self.timings is not None:
+                    # File the parse stages buffered for this call under the cached type.
+                    self.timings.flush(cached.quadric_type)
+                return cached
+        result = self._canonize_uncached(matrices, eq)
+        if self.cache is not None:
+            self.cache.put_matrix(matrices.homogeneous, result)
+        return result
+
+    def recanonize(
+        self,
+        previous: CanonicalizationResult,
+        matrices: QuadricMatrices,
+        eq: str | None = None,
+        max_sweeps: int = DEFAULT_MAX_SWEEPS,
+    ) -> CanonicalizationResult:
+        """
+        Canonicalize a slightly changed quadric, warm-started from its previous frame.
+
+        The eigendecomposition starts from the previous rotation basis, so
+        eigenvector order and signs follow the previous frame instead of
+        flipping, and classification is skipped while the spectrum stays clear
+        of the roundoff thresholds. The cache is bypassed because cached bases
+        belong to other frames. When the warm start does not converge the
+        quadric is canonicalized from scratch.
+
+        Args:
+            previous: CanonicalizationResult
+                Result of the preceding frame of the same tracked quadric.
+            matrices: QuadricMatrices
+                Homogeneous, quadratic, and linear forms of the new frame.
+            eq: str | None
+                Source equation when the matrices were parsed from text.
+            max_sweeps: int
+                Maximum number of Jacobi sweeps before falling back.
+            return: CanonicalizationResult
+                Result of the new frame with a basis consistent with ``previous``.
+        """
+
+        with self._stage(PipelineStage.EIGENDECOMPOSITION):
+            warm = warm_invariants(previous, matrices.quadratic, matrices.homogeneous, max_sweeps)
+        if warm is None:
+            return self._canonize_uncached(matrices, eq)
+        invariants, type_holds = warm
+        if type_holds:
+            return self._canonize_classified(matrices, invariants, previous.quadric_type, eq)
+        with self._stage(PipelineStage.CLASSIFICATION):
+            quadric_type = self.classifier.classify_invariants(invariants)
+        return self._canonize_classified(matrices, invariants, quadric_type, eq)
+
+    def _canonize_uncached(self, matrices: QuadricMatrices, eq: str | None) -> CanonicalizationResult:
+        with self._stage(PipelineStage.EIGENDECOMPOSITION):
+            invariants = QuadricInvariants.from_matrices(matrices.quadratic, matrices.homogeneous)
+        with self._stage(PipelineStage.CLASSIFICATION):
+            quadric_type = self.classifier.classify_invariants(invariants)
+        return self._canonize_classified(matrices, invariants, quadric_type, eq)
+
+    def _canonize_classified(
+        self,
+        matrices: QuadricMatrices,
+        invariants: QuadricInvariants,
+        quadric_type: QuadricType,
+        eq: str | None,
+    ) -> CanonicalizationResult:
+        """Run the transformation strategy of a classified quadric on its shared invariants."""
+
+        matrix_scale = invariants.scale
+        homogeneous = invariants.homogeneous
+        quadratic = invariants.quadratic
         linear = matrices.linear / matrix_scale
-        quadric_type = self.classifier.classify(quadratic, homogeneous)
-        centered = numerical_rank(quadratic, ROUNDOFF_FACTOR) == 3
-        if centered:
-            data = centered_quadric(
-                homogeneous.copy(), quadratic.copy(), linear.copy()
-            )
-        else:
-            data = acentered_quadric(
-                quadric_type, homogeneous.copy(), quadratic.copy(), linear.copy(), eq
-            )
-        return _build_result(quadric_type, centered, data, matrix_scale)
+        centered = invariants.rank_quadratic == 3
+        with self._stage(PipelineStage.TRANSLATION):
+            if centered:
+                data = centered_quadric(
+                    homogeneous.copy(), quadratic.copy(), linear.copy(), invariants
+                )
+            else:
+                data = acentered_quadric(
+                    quadric_type, homogeneous.copy(), quadratic.copy(), linear.copy(), eq, invariants
+                )
+        result = _build_result(
+            quadric_type, centered, data, matrix_scale, self.should_validate(), self.timings, self.allocations
+        )
+        if self.timings is not None:
+            self.timings.flush(quadric_type)
+        return result
+
+    def canonize_many(self, batch: QuadricMatrixBatch) -> BatchCanonicalization:
+        """
+        Transform a stack of quadrics with batched kernels instead of a loop.
+
+        Rows are classified together, grouped by :class:`QuadricType`, and
+        each group runs one vectorized strategy. Failed rows are reported in
+        the returned error mask instead of raising.
+
+        Args:
+            batch: QuadricMatrixBatch
+                Stacked matrices, for example from :meth:`QuadricParser.parse_many`.
+            return: BatchCanonicalization
+                Stacked stage matrices, rotations, and translations in input order.
+        """
+
+        invariants = QuadricInvariantBatch.from_matrices(batch.quadratic, batch.homogeneous)
+        quadric_types = self.classifier.classify_invariant_batch(invariants)
+        return canonize_invariant_batch(invariants, quadric_types, batch.errors)
+
+
+def batch_result(batch: BatchCanonicalization, index: int, validate: bool = True) -> CanonicalizationResult:
+    """
+    Materialize one successful row of a batch as a result model.
+
+    Args:
+        batch: BatchCanonicalization
+            Output of :meth:`QuadricCanonicalizer.canonize_many`.
+        index: int
+            Row to materialize.
+        validate: bool
+            Run the full public-boundary validation instead of the trusted
+            constructor.
+        return: CanonicalizationResult
+            The same result :meth:`QuadricCanonicalizer.canonize_matrices` builds.
+    """
+
+    message = batch.errors[index]
+    if message is not None:
+        if message == UNSUPPORTED_INVARIANTS_MESSAGE:
+            raise NotAQuadricError(message)
+        raise ValueError(message)
+    data = TransformationData(
+        initial_matrix=batch.initial_matrices[index].copy(),
+        middle_matrix=batch.middle_matrices[index].copy(),
+        final_matrix=batch.final_matrices[index].copy(),
+        translation_vector=batch.translation_vectors[index].copy(),
+        rotation_matrix=batch.rotation_matrices[index].copy(),
+    )
+    return _build_result(
+        QuadricType(int(batch.quadric_types[index])), bool(batch.centered[index]), data, 1.0, validate
+    )
 
 
 def _build_result(
@@ -324,22 +580,43 @@ def _build_result(
     centered: bool,
     data: TransformationData,
     matrix_scale: float,
+    validate: bool = True,
+    timings: PipelineTimings | None = None,
+    allocations: AllocationProfiler | None = None,
 ) -> CanonicalizationResult:
-    initial_matrix = np.asarray(data.initial_matrix * matrix_scale, dtype=np.float64)
-    middle_matrix = np.asarray(data.middle_matrix * matrix_scale, dtype=np.float64)
-    final_matrix = np.asarray(data.final_matrix * matrix_scale, dtype=np.float64)
-    return CanonicalizationResult(
-        quadric_type=quadric_type,
-        centered=centered,
-        initial_matrix=initial_matrix,
-        middle_matrix=middle_matrix,
-        final_matrix=final_matrix,
-        translation_vector=data.translation_vector,
-        rotation_matrix=data.rotation_matrix,
-        initial_equation=convert_poly_coeffs(expression_from_matrix(initial_matrix)),
-        middle_equation=convert_poly_coeffs(expression_from_matrix(middle_matrix)),
-        final_equation=convert_poly_coeffs(expression_from_matrix(final_matrix)),
-    )
+    if allocations is not None:
+        with allocations.stage(AllocationStage.BUILD_RESULT):
+            return _build_result(quadric_type, centered, data, matrix_scale, validate, timings)
+    with _timed(timings, PipelineStage.BUILD_RESULT):
+        initial_matrix = np.asarray(data.initial_matrix * matrix_scale, dtype=np.float64)
+        middle_matrix = np.asarray(data.middle_matrix * matrix_scale, dtype=np.float64)
+        final_matrix = np.asarray(data.final_matrix * matrix_scale, dtype=np.float64)
+    build = CanonicalizationResult if validate else CanonicalizationResult.trusted
+    # The validation stage times model construction, which is only a wrap in TRUSTED mode.
+    with _timed(timings, PipelineStage.VALIDATION):
+        result = build(
+            quadric_type=quadric_type,
+            centered=centered,
+            initial_matrix=initial_matrix,
+            middle_matrix=middle_matrix,
+            final_matrix=final_matrix,
+            translation_vector=data.translation_vector,
+            rotation_matrix=data.rotation_matrix,
+        )
+    if timings is not None:
+        result._timings = timings
+    return result
+
+
+def _timed(timings: PipelineTimings | None, stage: PipelineStage) -> AbstractContextManager[None]:
+    return _UNTIMED if timings is None else timings.stage(stage)
+
+
+def _default_canonicalizer() -> QuadricCanonicalizer:
+    return QuadricCanonicalizer(parser=QuadricParser(), classifier=QuadricClassifier(tolerance=NUMERICAL_TOLERANCE))
+
+
+_SHARED_CANONICALIZER = _default_canonicalizer()
 
 
 def canonize_quadric(eq: str) -> CanonicalizationResult:
@@ -348,7 +625,9 @@ def canonize_quadric(eq: str) -> CanonicalizationResult:
 
     The result reports ordered active point transformations using
     ``next = linear_map @ current + offset``. Numerical values remain full
-    precision; presentation code is responsible for rounding.
+    precision; presentation code is responsible for rounding. No cache is
+    consulted; pass a :class:`CanonicalizationCache` to a
+    :class:`QuadricCanonicalizer` to reuse results.
 
     Args:
         eq: str
@@ -358,9 +637,99 @@ def canonize_quadric(eq: str) -> CanonicalizationResult:
             steps.
     """
 
-    canonicalizer = QuadricCanonicalizer(parser=QuadricParser(),
-                                         classifier=QuadricClassifier(tolerance=NUMERICAL_TOLERANCE))
-    return canonicalizer.canonize(eq)
+    return _SHARED_CANONICALIZER.canonize(eq)
+
+
+def canonize_coefficients(coefficients: npt.ArrayLike) -> CanonicalizationResult:
+    """
+    Canonicalize one quadric given by its ten polynomial coefficients.
+
+    Args:
+        coefficients: numpy.typing.ArrayLike
+            Coefficients of x**2, y**2, z**2, x*y, x*z, y*z, x, y, z, and the
+            constant term, in that order.
+        return: CanonicalizationResult
+            Same result as :func:`canonize_quadric` without string parsing.
+    """
+
+    return _default_canonicalizer().canonize_matrices(QuadricMatrices.from_coefficients(coefficients))
+
+
+def canonize_matrix(matrix: npt.ArrayLike) -> CanonicalizationResult:
+    """
+    Canonicalize one quadric given by its symmetric 4x4 homogeneous matrix.
 
+    Args:
+        matrix: numpy.typing.ArrayLike
+            Symmetric homogeneous matrix with half-coefficients off the diagonal.
+        return: CanonicalizationResult
+            Same result as :func:`canonize_quadric` without string parsing.
+    """
+
+    return _default_canonicalizer().canonize_matrices(QuadricMatrices.from_homogeneous(matrix))
+
+
+def recanonize_matrix(previous: CanonicalizationResult, matrix: npt.ArrayLike) -> CanonicalizationResult:
+    """
+    Canonicalize the next frame of a tracked quadric from its previous result.
+
+    Args:
+        previous: CanonicalizationResult
+            Result of the preceding frame.
+        matrix: numpy.typing.ArrayLike
+            Symmetric homogeneous matrix of the new frame.
+        return: CanonicalizationResult
+            Result whose basis follows ``previous``; see
+            :meth:`QuadricCanonicalizer.recanonize`.
+    """
+
+    return _SHARED_CANONICALIZER.recanonize(previous, QuadricMatrices.from_homogeneous(matrix))
+
+
+def canonize_coefficients_many(coefficients: npt.ArrayLike) -> list[CanonicalizationResult]:
+    """
+    Canonicalize every row of an ``(N, 10)`` coefficient array.
+
+    Args:
+        coefficients: numpy.typing.ArrayLike
+            One row per quadric in :func:`canonize_coefficients` order.
+        return: list[CanonicalizationResult]
+            Results in input row order.
+    """
+
+    rows = np.asarray(coefficients, dtype=np.float64)
+    if rows.ndim != 2 or rows.shape[1] != 10:
+        raise ValueError("quadric coefficients must have shape (N, 10)")
+    if not np.all(np.isfinite(rows)):
+        raise ValueError("quadric coefficients must be finite")
+    canonicalizer = _default_canonicalizer()
+    batch = canonicalizer.canonize_many(QuadricMatrixBatch.from_coefficients(rows))
+    return [batch_result(batch, index, canonicalizer.should_validate()) for index in range(len(batch))]
+
+
+def canonize_matrix_many(matrices: npt.ArrayLike) -> list[CanonicalizationResult]:
+    """
+    Canonicalize every matrix of an ``(N, 4, 4)`` homogeneous stack.
+
+    Args:
+        matrices: numpy.typing.ArrayLike
+            Symmetric homogeneous matrices stacked along the first axis.
+        return: list[CanonicalizationResult]
+            Results in input order.
+    """
 
-__all__ = ["QuadricCanonicalizer", "canonize_quadric"]
+    canonicalizer = _default_canonicalizer()
+    batch = canonicalizer.canonize_many(QuadricMatrixBatch.from_homogeneous(matrices))
+    return [batch_result(batch, index, canonicalizer.should_validate()) for index in range(len(batch))]
+
+
+__all__ = [
+    "QuadricCanonicalizer",
+    "batch_result",
+    "canonize_coefficients",
+    "canonize_coefficients_many",
+    "canonize_matrix",
+    "canonize_matrix_many",
+    "canonize_quadric",
+    "recanonize_matrix",
+]
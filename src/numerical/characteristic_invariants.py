@@ -0,0 +1,337 @@
+"""
+Read quadric invariants from characteristic polynomial coefficients.
+
+For a symmetric matrix the characteristic polynomial has only real roots, so
+its coefficients (trace, sum of principal 2x2 minors, determinant) decide the
+inertia by Descartes' rule of signs, and the rank is the order of the last
+non-zero coefficient. The same holds for the homogeneous matrix, whose
+coefficients are those of the quadratic block plus the principal minors that
+border it with the linear terms. Every value is a short polynomial in the
+matrix entries, so classification needs no eigen or SVD call; zero tests use
+``ROUNDOFF_FACTOR`` machine epsilons of the scale raised to the minor order.
+Near-singular inputs can therefore be judged differently from the spectral
+invariants, whose thresholds apply to the eigenvalues themselves.
+
+Run the classifier tests with ``python -m pytest tests/test_classifier.py -q``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TypeVar
+
+import numpy as np
+
+from src.numerical.invariants import ROUNDOFF_FACTOR
+from src.numerical.models import BoolArray, FloatArray, IntArray, MatrixInertia
+
+
+_EPSILON = float(np.finfo(np.float64).eps)
+_TINY = float(np.finfo(np.float64).tiny)
+_Value = TypeVar("_Value", float, FloatArray)
+
+
+def _coefficients(
+    a00: _Value,
+    a01: _Value,
+    a02: _Value,
+    a11: _Value,
+    a12: _Value,
+    a22: _Value,
+    b0: _Value,
+    b1: _Value,
+    b2: _Value,
+    c: _Value,
+) -> tuple[_Value, _Value, _Value, _Value, _Value, _Value]:
+    """Return the quadratic block coefficients and the bordered minor sums of one or many quadrics."""
+
+    cofactor00, cofactor11, cofactor22 = a11 * a22 - a12 * a12, a00 * a22 - a02 * a02, a00 * a11 - a01 * a01
+    cofactor01, cofactor02, cofactor12 = a02 * a12 - a01 * a22, a01 * a12 - a02 * a11, a01 * a02 - a00 * a12
+    trace = a00 + a11 + a22
+    minors = cofactor00 + cofactor11 + cofactor22
+    determinant = a00 * cofactor00 + a01 * cofactor01 + a02 * cofactor02
+    linear_squared = b0 * b0 + b1 * b1 + b2 * b2
+    quadratic_form = (
+        a00 * b0 * b0 + a11 * b1 * b1 + a22 * b2 * b2 + 2.0 * (a01 * b0 * b1 + a02 * b0 * b2 + a12 * b1 * b2)
+    )
+    adjugate_form = (
+        cofactor00 * b0 * b0
+        + cofactor11 * b1 * b1
+        + cofactor22 * b2 * b2
+        + 2.0 * (cofactor01 * b0 * b1 + cofactor02 * b0 * b2 + cofactor12 * b1 * b2)
+    )
+    return (
+        trace,
+        minors,
+        determinant,
+        c * trace - linear_squared,
+        c * minors - (trace * linear_squared - quadratic_form),
+        c * determinant - adjugate_form,
+    )
+
+
+def _sign_variations(sequence: list[float]) -> int:
+    """Count sign changes between consecutive non-zero entries."""
+
+    changes, last = 0, 0.0
+    for value in sequence:
+        if value != 0.0:
+            changes += last * value < 0.0
+            last = value
+    return changes
+
+
+@dataclass(frozen=True, slots=True)
+class CharacteristicInvariants:
+    """
+    Store the characteristic polynomial coefficients of one normalized quadric.
+
+    Args:
+        scale: float
+            Largest absolute homogeneous entry used for normalization.
+        quadratic_scale: float
+            Largest absolute entry of the normalized quadratic block.
+        quadratic_coefficients: tuple[float, float, float]
+            Trace, sum of principal 2x2 minors, and determinant of the block.
+        homogeneous_coefficients: tuple[float, float, float, float]
+            Sums of the principal 1x1 to 4x4 minors of the homogeneous matrix.
+        bordered_minors: tuple[float, float, float]
+            Sums of the principal 2x2, 3x3, and 4x4 minors containing the
+            constant term.
+    return: CharacteristicInvariants
+        Invariants consumed by :meth:`QuadricClassifier.classify_invariants`.
+    """
+
+    scale: float
+    quadratic_scale: float
+    quadratic_coefficients: tuple[float, float, float]
+    homogeneous_coefficients: tuple[float, float, float, float]
+    bordered_minors: tuple[float, float, float]
+
+    @classmethod
+    def from_matrices(cls, quadratic: FloatArray, homogeneous: FloatArray) -> CharacteristicInvariants:
+        """
+        Normalize one quadric and expand its principal minors.
+
+        Args:
+            quadratic: numpy.ndarray
+                Symmetric 3x3 quadratic block.
+            homogeneous: numpy.ndarray
+                Symmetric 4x4 homogeneous matrix.
+            return: CharacteristicInvariants
+                Invariants of the normalized matrices.
+        """
+
+        if quadratic.shape != (3, 3) or homogeneous.shape != (4, 4):
+            raise ValueError("expected quadratic shape (3, 3) and homogeneous shape (4, 4)")
+        scale = float(np.max(np.abs(homogeneous)))
+        if scale == 0:
+            raise ValueError("quadric matrix cannot be identically zero")
+        (a00, a01, a02), (_, a11, a12), (_, _, a22) = (quadratic / scale).tolist()
+        b0, b1, b2, c = (homogeneous[3] / scale).tolist()
+        trace, minors, determinant, bordered2, bordered3, bordered4 = _coefficients(
+            a00, a01, a02, a11, a12, a22, b0, b1, b2, c
+        )
+        return cls(
+            scale=scale,
+            quadratic_scale=max(abs(a00), abs(a01), abs(a02), abs(a11), abs(a12), abs(a22)),
+            quadratic_coefficients=(trace, minors, determinant),
+            homogeneous_coefficients=(trace + c, minors + bordered2, determinant + bordered3, bordered4),
+            bordered_minors=(bordered2, bordered3, bordered4),
+        )
+
+    def _nonzero_quadratic(self) -> list[bool]:
+        base = max(self.quadratic_scale, _TINY)
+        return [
+            abs(value) > ROUNDOFF_FACTOR * _EPSILON * base**order
+            for order, value in enumerate(self.quadratic_coefficients, start=1)
+        ]
+
+    @property
+    def rank_quadratic(self) -> int:
+        """Return the order of the last numerically non-zero block coefficient."""
+
+        nonzero = self._nonzero_quadratic()
+        return max((order for order, flag in enumerate(nonzero, start=1) if flag), default=0)
+
+    @property
+    def rank_homogeneous(self) -> int:
+        """Return the order of the last numerically non-zero homogeneous coefficient."""
+
+        threshold = ROUNDOFF_FACTOR * _EPSILON
+        orders = (order for order, value in enumerate(self.homogeneous_coefficients, start=1) if abs(value) > threshold)
+        return max(orders, default=0)
+
+    @property
+    def determinant_sign(self) -> float:
+        """Return the homogeneous determinant sign, or zero when it is singular."""
+
+        if self.rank_homogeneous != 4:
+            return 0.0
+        return 1.0 if self.homogeneous_coefficients[3] > 0.0 else -1.0
+
+    @property
+    def inertia(self) -> MatrixInertia:
+        """Return block eigenvalue sign counts by Descartes' rule of signs."""
+
+        nonzero = self._nonzero_quadratic()
+        rank = self.rank_quadratic
+        trace, minors, determinant = self.quadratic_coefficients
+        # Coefficients of det(t I - A) / t**(3 - rank), whose roots are the
+        # non-zero eigenvalues.
+        sequence = [1.0] + [
+            value if flag else 0.0 for value, flag in zip((-trace, minors, -determinant), nonzero)
+        ][:rank]
+        positive = _sign_variations(sequence)
+        return MatrixInertia(positive=positive, negative=rank - positive, zero=3 - rank)
+
+    @property
+    def reduced_constant(self) -> float:
+        """
+        Return the constant left after completing every non-null square.
+
+        For a block of rank ``r`` this is the bordered minor sum of order
+        ``r + 1`` divided by the block coefficient of order ``r``, which equals
+        :attr:`QuadricInvariants.reduced_constant` whenever the linear term
+        lies in the range of the block.
+        """
+
+        rank = self.rank_quadratic
+        if rank == 0:
+            return self.homogeneous_coefficients[0] - self.quadratic_coefficients[0]
+        return self.bordered_minors[rank - 1] / self.quadratic_coefficients[rank - 1]
+
+
+@dataclass(frozen=True, slots=True)
+class CharacteristicInvariantBatch:
+    """
+    Store :class:`CharacteristicInvariants` fields for ``N`` quadrics as stacked arrays.
+
+    Rows whose homogeneous matrix is identically zero are kept with unit
+    scale and flagged as invalid instead of raising.
+
+    Args:
+        scale: numpy.ndarray
+            Largest absolute homogeneous entry of every row, shape ``(N,)``.
+        valid: numpy.ndarray
+            Boolean mask of rows with a non-zero homogeneous matrix.
+        quadratic_scale: numpy.ndarray
+            Largest absolute normalized quadratic entry, shape ``(N,)``.
+        quadratic_coefficients: numpy.ndarray
+            Block coefficients of every row, shape ``(N, 3)``.
+        homogeneous_coefficients: numpy.ndarray
+            Homogeneous principal minor sums, shape ``(N, 4)``.
+        bordered_minors: numpy.ndarray
+            Principal minor sums containing the constant term, shape ``(N, 3)``.
+    return: CharacteristicInvariantBatch
+        Stacked invariants consumed by :meth:`QuadricClassifier.classify_invariant_batch`.
+    """
+
+    scale: FloatArray
+    valid: BoolArray
+    quadratic_scale: FloatArray
+    quadratic_coefficients: FloatArray
+    homogeneous_coefficients: FloatArray
+    bordered_minors: FloatArray
+
+    @classmethod
+    def from_matrices(cls, quadratic: FloatArray, homogeneous: FloatArray) -> CharacteristicInvariantBatch:
+        """
+        Normalize every row and expand its principal minors.
+
+        Args:
+            quadratic: numpy.ndarray
+                Quadratic blocks with shape ``(N, 3, 3)``.
+            homogeneous: numpy.ndarray
+                Homogeneous matrices with shape ``(N, 4, 4)``.
+            return: CharacteristicInvariantBatch
+                Invariants of every normalized row.
+        """
+
+        quadratic = np.asarray(quadratic, dtype=np.float64)
+        homogeneous = np.asarray(homogeneous, dtype=np.float64)
+        if quadratic.ndim != 3 or quadratic.shape[1:] != (3, 3) or homogeneous.shape != (quadratic.shape[0], 4, 4):
+            raise ValueError("expected quadratic shape (N, 3, 3) and homogeneous shape (N, 4, 4)")
+        raw_scale = np.max(np.abs(homogeneous), axis=(1, 2))
+        valid = raw_scale > 0
+        scale = np.where(valid, raw_scale, 1.0)
+        block = quadratic / scale[:, np.newaxis, np.newaxis]
+        border = homogeneous[:, 3] / scale[:, np.newaxis]
+        trace, minors, determinant, bordered2, bordered3, bordered4 = _coefficients(
+            block[:, 0, 0],
+            block[:, 0, 1],
+            block[:, 0, 2],
+            block[:, 1, 1],
+            block[:, 1, 2],
+            block[:, 2, 2],
+            border[:, 0],
+            border[:, 1],
+            border[:, 2],
+            border[:, 3],
+        )
+        return cls(
+            scale=scale,
+            valid=valid,
+            quadratic_scale=np.max(np.abs(block), axis=(1, 2)),
+            quadratic_coefficients=np.stack((trace, minors, determinant), axis=1),
+            homogeneous_coefficients=np.stack(
+                (trace + border[:, 3], minors + bordered2, determinant + bordered3, bordered4), axis=1
+            ),
+            bordered_minors=np.stack((bordered2, bordered3, bordered4), axis=1),
+        )
+
+    def __len__(self) -> int:
+        return int(self.scale.shape[0])
+
+    def _nonzero_quadratic(self) -> BoolArray:
+        base = np.maximum(self.quadratic_scale, _TINY)[:, np.newaxis]
+        thresholds = ROUNDOFF_FACTOR * _EPSILON * base ** np.arange(1, 4)
+        return np.abs(self.quadratic_coefficients) > thresholds
+
+    @property
+    def rank_quadratic(self) -> IntArray:
+        """Return the order of the last numerically non-zero block coefficient of every row."""
+
+        return np.asarray(np.max(self._nonzero_quadratic() * np.arange(1, 4), axis=1), dtype=np.intp)
+
+    @property
+    def rank_homogeneous(self) -> IntArray:
+        """Return the order of the last numerically non-zero homogeneous coefficient of every row."""
+
+        nonzero = np.abs(self.homogeneous_coefficients) > ROUNDOFF_FACTOR * _EPSILON
+        return np.asarray(np.max(nonzero * np.arange(1, 5), axis=1), dtype=np.intp)
+
+    @property
+    def determinant_sign(self) -> FloatArray:
+        """Return every homogeneous determinant sign, zero for singular rows."""
+
+        return np.where(self.rank_homogeneous == 4, np.sign(self.homogeneous_coefficients[:, 3]), 0.0)
+
+    @property
+    def inertia_counts(self) -> tuple[IntArray, IntArray, IntArray]:
+        """Return positive, negative, and zero eigenvalue counts by Descartes' rule of signs."""
+
+        rank = self.rank_quadratic
+        kept = self._nonzero_quadratic() & (np.arange(1, 4) <= rank[:, np.newaxis])
+        sequence = np.where(kept, self.quadratic_coefficients * np.array([-1.0, 1.0, -1.0]), 0.0)
+        positive = np.zeros(len(self), dtype=np.intp)
+        last = np.ones(len(self))
+        for column in sequence.T:
+            positive += (last * column < 0.0).astype(np.intp)
+            last = np.where(column != 0.0, column, last)
+        return positive, rank - positive, 3 - rank
+
+    @property
+    def reduced_constant(self) -> FloatArray:
+        """Return :attr:`CharacteristicInvariants.reduced_constant` for every row."""
+
+        rank = self.rank_quadratic
+        column = np.maximum(rank - 1, 0)[:, np.newaxis]
+        numerator = np.take_along_axis(self.bordered_minors, column, axis=1)[:, 0]
+        denominator = np.take_along_axis(self.quadratic_coefficients, column, axis=1)[:, 0]
+        constant = self.homogeneous_coefficients[:, 0] - self.quadratic_coefficients[:, 0]
+        ratio = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=rank > 0)
+        return np.where(rank > 0, ratio, constant)
+
+
+__all__ = ["CharacteristicInvariantBatch", "CharacteristicInvariants"]
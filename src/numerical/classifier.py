@@ -6,11 +6,30 @@ Run the classifier tests with ``python -m pytest tests/test_classifier.py -q``.
 
 from __future__ import annotations
 
-import numpy as np
+from collections.abc import Iterable
+from typing import Any
 
-from src.numerical.models import FloatArray, MatrixInertia, QuadricType
-from src.numerical.numerical_helpers import numerical_rank, relative_tolerance
+import numpy as np
+import numpy.typing as npt
+
+from src.numerical.characteristic_invariants import CharacteristicInvariantBatch, CharacteristicInvariants
+from src.numerical.invariants import (
+    ROUNDOFF_FACTOR,
+    QuadricInvariantBatch,
+    QuadricInvariants,
+    inertia_from_eigenvalues,
+)
+from src.numerical.models import (
+    ClassificationStrategy,
+    FloatArray,
+    Int8Array,
+    MatrixInertia,
+    QuadricMatrices,
+    QuadricMatrixBatch,
+    QuadricType,
+)
 from src.numerical.parser import QuadricParser
+from src.numerical.symmetric_eigen import eigvalsh3
 
 
 class NotAQuadricError(ValueError):
@@ -19,7 +38,11 @@ class NotAQuadricError(ValueError):
 
 # Compatibility alias retained for existing callers.
 NotAQuadricException = NotAQuadricError
-ROUNDOFF_FACTOR = 100.0
+# Batch code reported for rows that :meth:`QuadricClassifier.classify` would reject.
+UNCLASSIFIED = 0
+
+ScalarInvariants = QuadricInvariants | CharacteristicInvariants
+BatchInvariants = QuadricInvariantBatch | CharacteristicInvariantBatch
 
 
 class QuadricClassifier:
@@ -46,13 +69,14 @@ class QuadricClassifier:
         scale = float(np.max(np.abs(quadratic)))
         if scale == 0:
             return MatrixInertia(positive=0, negative=0, zero=3)
-        eigenvalues = np.linalg.eigvalsh(quadratic / scale)
-        threshold = relative_tolerance(eigenvalues, ROUNDOFF_FACTOR)
-        positive = int(np.count_nonzero(eigenvalues > threshold))
-        negative = int(np.count_nonzero(eigenvalues < -threshold))
-        return MatrixInertia(positive=positive, negative=negative, zero=3 - positive - negative)
-
-    def classify(self, quadratic: FloatArray, homogeneous: FloatArray) -> QuadricType:
+        return inertia_from_eigenvalues(eigvalsh3(quadratic / scale))
+
+    def classify(
+        self,
+        quadratic: FloatArray,
+        homogeneous: FloatArray,
+        strategy: ClassificationStrategy = ClassificationStrategy.SPECTRAL,
+    ) -> QuadricType:
         """
         Return the unique quadric type selected by the invariant decision table.
 
@@ -61,26 +85,36 @@ class QuadricClassifier:
                 Symmetric 3x3 quadratic block.
             homogeneous: numpy.ndarray
                 Symmetric 4x4 homogeneous matrix.
+            strategy: ClassificationStrategy
+                ``SPECTRAL`` reads eigenvalues; ``CHARACTERISTIC`` reads
+                characteristic polynomial coefficients without any eigen call.
         return: QuadricType
             Classified real or complex quadric family.
         """
 
         if quadratic.shape != (3, 3) or homogeneous.shape != (4, 4):
             raise ValueError("expected quadratic shape (3, 3) and homogeneous shape (4, 4)")
-
-        scale = float(np.max(np.abs(homogeneous)))
-        if scale == 0:
+        if float(np.max(np.abs(homogeneous))) == 0:
             raise NotAQuadricError("homogeneous quadric matrix cannot be identically zero")
-        normalized_homogeneous = homogeneous / scale
-        normalized_quadratic = quadratic / scale
-        rank_quadratic = numerical_rank(normalized_quadratic, ROUNDOFF_FACTOR)
-        rank_homogeneous = numerical_rank(normalized_homogeneous, ROUNDOFF_FACTOR)
-        determinant = (
-            float(np.linalg.slogdet(normalized_homogeneous)[0])
-            if rank_homogeneous == 4
-            else 0.0
-        )
-        inertia = self.inertia(normalized_quadratic)
+        if strategy is ClassificationStrategy.CHARACTERISTIC:
+            return self.classify_invariants(CharacteristicInvariants.from_matrices(quadratic, homogeneous))
+        return self.classify_invariants(QuadricInvariants.from_matrices(quadratic, homogeneous))
+
+    def classify_invariants(self, invariants: ScalarInvariants) -> QuadricType:
+        """
+        Apply the decision table to precomputed quadric invariants.
+
+        Args:
+            invariants: QuadricInvariants | CharacteristicInvariants
+                Ranks, determinant sign, inertia, and reduced constant of one quadric.
+        return: QuadricType
+            Classified real or complex quadric family.
+        """
+
+        rank_quadratic = invariants.rank_quadratic
+        rank_homogeneous = invariants.rank_homogeneous
+        determinant = invariants.determinant_sign
+        inertia = invariants.inertia
 
         if rank_quadratic == 3:
             if determinant < 0 and inertia.is_definite:
@@ -102,7 +136,7 @@ class QuadricClassifier:
             if determinant > 0 and inertia.is_indefinite:
                 return QuadricType.HYPERBOLIC_PARABOLOID
             if determinant == 0 and rank_homogeneous == 3 and inertia.is_semidefinite:
-                return self._elliptic_cylinder_type(normalized_quadratic, normalized_homogeneous, inertia)
+                return self._elliptic_cylinder_type(invariants, inertia)
             if determinant == 0 and rank_homogeneous == 3 and inertia.is_indefinite:
                 return QuadricType.HYPERBOLIC_CYLINDER
             if determinant == 0 and rank_homogeneous == 2 and inertia.is_indefinite:
@@ -114,7 +148,7 @@ class QuadricClassifier:
             if rank_homogeneous == 3:
                 return QuadricType.PARABOLIC_CYLINDER
             if rank_homogeneous == 2:
-                return self._parallel_planes_type(normalized_quadratic, normalized_homogeneous, inertia)
+                return self._parallel_planes_type(invariants, inertia)
             if rank_homogeneous == 1:
                 return QuadricType.DOUBLE_PLANE
 
@@ -124,25 +158,99 @@ class QuadricClassifier:
             f"det(A_overline)={determinant}, inertia={inertia}"
         )
 
-    def _reduced_constant(self, quadratic: FloatArray, homogeneous: FloatArray) -> float:
-        linear = homogeneous[:3, 3]
-        center = -np.linalg.pinv(
-            quadratic,
-            rcond=ROUNDOFF_FACTOR * float(np.finfo(np.float64).eps),
-        ) @ linear
-        return float(center @ quadratic @ center + 2 * linear @ center + homogeneous[3, 3])
+    def classify_many(
+        self,
+        quadratic: FloatArray,
+        homogeneous: FloatArray,
+        strategy: ClassificationStrategy = ClassificationStrategy.SPECTRAL,
+    ) -> Int8Array:
+        """
+        Classify a stack of quadrics with batched invariants and masks.
+
+        The vectorized decision table mirrors :meth:`classify_invariants`
+        row for row. Rows that :meth:`classify` would reject with
+        :class:`NotAQuadricError` are reported as :data:`UNCLASSIFIED`.
+
+        Args:
+            quadratic: numpy.ndarray
+                Symmetric quadratic blocks with shape ``(N, 3, 3)``.
+            homogeneous: numpy.ndarray
+                Symmetric homogeneous matrices with shape ``(N, 4, 4)``.
+            strategy: ClassificationStrategy
+                Invariants read by the decision table, as in :meth:`classify`.
+        return: numpy.ndarray
+            ``int8`` array of :class:`QuadricType` values with shape ``(N,)``.
+        """
+
+        if strategy is ClassificationStrategy.CHARACTERISTIC:
+            return self.classify_invariant_batch(CharacteristicInvariantBatch.from_matrices(quadratic, homogeneous))
+        return self.classify_invariant_batch(QuadricInvariantBatch.from_matrices(quadratic, homogeneous))
+
+    def classify_invariant_batch(self, invariants: BatchInvariants) -> Int8Array:
+        """
+        Apply the vectorized decision table to precomputed batch invariants.
+
+        Args:
+            invariants: QuadricInvariantBatch | CharacteristicInvariantBatch
+                Stacked ranks, determinant signs, inertia, and reduced constants.
+        return: numpy.ndarray
+            ``int8`` array of :class:`QuadricType` values with shape ``(N,)``.
+        """
+
+        rank_quadratic = invariants.rank_quadratic
+        rank_homogeneous = invariants.rank_homogeneous
+        determinant = invariants.determinant_sign
+        positive, negative, zero = invariants.inertia_counts
+        definite = (positive == 3) | (negative == 3)
+        semidefinite = (zero > 0) & (((positive > 0) & (negative == 0)) | ((negative > 0) & (positive == 0)))
+        indefinite = (positive > 0) & (negative > 0)
+        coefficient_sign = np.where(positive > 0, 1.0, -1.0)
+        has_real_points = coefficient_sign * invariants.reduced_constant < 0.0
+        singular = determinant == 0
+        full, two, one = rank_quadratic == 3, rank_quadratic == 2, rank_quadratic == 1
+        decisions = (
+            (full & (determinant < 0) & definite, QuadricType.REAL_ELLIPSOID),
+            (full & (determinant < 0) & indefinite, QuadricType.TWO_SHEET_HYPERBOLOID),
+            (full & (determinant > 0) & definite, QuadricType.COMPLEX_ELLIPSOID),
+            (full & (determinant > 0) & indefinite, QuadricType.ONE_SHEET_HYPERBOLOID),
+            (full & singular & (rank_homogeneous == 3) & definite, QuadricType.COMPLEX_CONE),
+            (full & singular & (rank_homogeneous == 3) & indefinite, QuadricType.REAL_CONE),
+            (two & (determinant < 0) & semidefinite, QuadricType.ELLIPTIC_PARABOLOID),
+            (two & (determinant > 0) & indefinite, QuadricType.HYPERBOLIC_PARABOLOID),
+            (
+                two & singular & (rank_homogeneous == 3) & semidefinite & has_real_points,
+                QuadricType.REAL_ELLIPTIC_CYLINDER,
+            ),
+            (
+                two & singular & (rank_homogeneous == 3) & semidefinite & ~has_real_points,
+                QuadricType.COMPLEX_ELLIPTIC_CYLINDER,
+            ),
+            (two & singular & (rank_homogeneous == 3) & indefinite, QuadricType.HYPERBOLIC_CYLINDER),
+            (two & singular & (rank_homogeneous == 2) & indefinite, QuadricType.REAL_INTERSECTING_PLANES),
+            (two & singular & (rank_homogeneous == 2) & semidefinite, QuadricType.COMPLEX_INTERSECTING_PLANES),
+            (one & (rank_homogeneous == 3), QuadricType.PARABOLIC_CYLINDER),
+            (one & (rank_homogeneous == 2) & has_real_points, QuadricType.REAL_PARALLEL_PLANES),
+            (one & (rank_homogeneous == 2) & ~has_real_points, QuadricType.COMPLEX_PARALLEL_PLANES),
+            (one & (rank_homogeneous == 1), QuadricType.DOUBLE_PLANE),
+        )
+        types = np.select(
+            [condition & invariants.valid for condition, _ in decisions],
+            [np.int8(quadric_type) for _, quadric_type in decisions],
+            default=np.int8(UNCLASSIFIED),
+        )
+        return np.asarray(types, dtype=np.int8)
 
-    def _semidefinite_has_real_points(self, quadratic: FloatArray, homogeneous: FloatArray, inertia: MatrixInertia) -> bool:
+    def _semidefinite_has_real_points(self, invariants: ScalarInvariants, inertia: MatrixInertia) -> bool:
         coefficient_sign = 1.0 if inertia.positive > 0 else -1.0
-        return coefficient_sign * self._reduced_constant(quadratic, homogeneous) < 0.0
+        return coefficient_sign * invariants.reduced_constant < 0.0
 
-    def _elliptic_cylinder_type(self, quadratic: FloatArray, homogeneous: FloatArray, inertia: MatrixInertia) -> QuadricType:
-        if self._semidefinite_has_real_points(quadratic, homogeneous, inertia):
+    def _elliptic_cylinder_type(self, invariants: ScalarInvariants, inertia: MatrixInertia) -> QuadricType:
+        if self._semidefinite_has_real_points(invariants, inertia):
             return QuadricType.REAL_ELLIPTIC_CYLINDER
         return QuadricType.COMPLEX_ELLIPTIC_CYLINDER
 
-    def _parallel_planes_type(self, quadratic: FloatArray, homogeneous: FloatArray, inertia: MatrixInertia) -> QuadricType:
-        if self._semidefinite_has_real_points(quadratic, homogeneous, inertia):
+    def _parallel_planes_type(self, invariants: ScalarInvariants, inertia: MatrixInertia) -> QuadricType:
+        if self._semidefinite_has_real_points(invariants, inertia):
             return QuadricType.REAL_PARALLEL_PLANES
         return QuadricType.COMPLEX_PARALLEL_PLANES
 
@@ -163,7 +271,11 @@ def get_eigenvalues_multiplicities(A: FloatArray, tol: float) -> MatrixInertia:
     return QuadricClassifier(tolerance=tol).inertia(A)
 
 
-def classify_quadric(A: FloatArray, A_overline: FloatArray) -> QuadricType:
+def classify_quadric(
+    A: FloatArray,
+    A_overline: FloatArray,
+    strategy: ClassificationStrategy = ClassificationStrategy.SPECTRAL,
+) -> QuadricType:
     """
     Classify matrices through the default numerical tolerance.
 
@@ -172,32 +284,128 @@ def classify_quadric(A: FloatArray, A_overline: FloatArray) -> QuadricType:
             Symmetric 3x3 quadratic matrix.
         A_overline: numpy.ndarray
             Symmetric 4x4 homogeneous matrix.
+        strategy: ClassificationStrategy
+            Invariants read by the decision table.
     return: QuadricType
         Quadric classification enum, also compatible with integer comparisons.
     """
 
-    return QuadricClassifier(tolerance=1e-10).classify(A, A_overline)
+    return QuadricClassifier(tolerance=1e-10).classify(A, A_overline, strategy)
 
 
-def expr2classification(eq: str) -> QuadricType:
+def expr2classification(
+    eq: str,
+    strategy: ClassificationStrategy = ClassificationStrategy.SPECTRAL,
+) -> QuadricType:
     """
     Parse and classify a degree-two equation.
 
     Args:
         eq: str
             Quadric equation in x, y, and z.
+        strategy: ClassificationStrategy
+            Invariants read by the decision table.
     return: QuadricType
         Quadric classification enum.
     """
 
     matrices = QuadricParser().parse_matrices(eq)
-    return classify_quadric(matrices.quadratic, matrices.homogeneous)
+    return classify_quadric(matrices.quadratic, matrices.homogeneous, strategy)
+
+
+_SHARED_PARSER = QuadricParser()
+_SHARED_CLASSIFIER = QuadricClassifier(tolerance=1e-10)
+
+
+def _quadric_matrices(quadric: str | npt.ArrayLike) -> QuadricMatrices:
+    """Parse an equation or wrap ten coefficients or a 4x4 homogeneous matrix."""
+
+    if isinstance(quadric, str):
+        return QuadricMatrices.from_coefficients(_SHARED_PARSER.coefficients(quadric))
+    array = np.asarray(quadric, dtype=np.float64)
+    if array.shape == (10,):
+        return QuadricMatrices.from_coefficients(array)
+    if array.shape == (4, 4):
+        return QuadricMatrices.from_homogeneous(array)
+    raise ValueError("a quadric must be an equation, ten coefficients, or a 4x4 homogeneous matrix")
+
+
+def _quadric_batch(quadrics: Iterable[str] | npt.ArrayLike) -> QuadricMatrixBatch:
+    """Stack equations, ``(N, 10)`` coefficients, or ``(N, 4, 4)`` matrices."""
+
+    if not isinstance(quadrics, (np.ndarray, str)) and isinstance(quadrics, Iterable):
+        rows: list[Any] = list(quadrics)
+        if all(isinstance(row, str) for row in rows):
+            return _SHARED_PARSER.parse_many(rows)
+        array = np.asarray(rows, dtype=np.float64)
+    else:
+        array = np.asarray(quadrics, dtype=np.float64)
+    if array.ndim == 2 and array.shape[1] == 10:
+        if not np.all(np.isfinite(array)):
+            raise ValueError("quadric coefficients must be finite")
+        return QuadricMatrixBatch.from_coefficients(array)
+    if array.ndim == 3 and array.shape[1:] == (4, 4):
+        return QuadricMatrixBatch.from_homogeneous(array)
+    raise ValueError("quadrics must be equations, (N, 10) coefficients, or (N, 4, 4) homogeneous matrices")
+
+
+def classify(
+    quadric: str | npt.ArrayLike,
+    strategy: ClassificationStrategy = ClassificationStrategy.SPECTRAL,
+) -> QuadricType:
+    """
+    Return the type of one quadric without canonicalizing it.
+
+    Only parsing and the invariant decision table run: no rotation,
+    translation, result validation, or SymPy equation is built.
+
+    Args:
+        quadric: str | numpy.typing.ArrayLike
+            Degree-two equation, ten coefficients in
+            :meth:`QuadricMatrices.from_coefficients` order, or a symmetric
+            4x4 homogeneous matrix.
+        strategy: ClassificationStrategy
+            ``SPECTRAL`` matches :func:`canonize_quadric`; ``CHARACTERISTIC``
+            avoids every eigen call.
+        return: QuadricType
+            Classified real or complex quadric family.
+    """
+
+    matrices = _quadric_matrices(quadric)
+    return _SHARED_CLASSIFIER.classify(matrices.quadratic, matrices.homogeneous, strategy)
+
+
+def classify_many(
+    quadrics: Iterable[str] | npt.ArrayLike,
+    strategy: ClassificationStrategy = ClassificationStrategy.SPECTRAL,
+) -> Int8Array:
+    """
+    Return the type code of many quadrics through one batched decision table.
+
+    Args:
+        quadrics: collections.abc.Iterable[str] | numpy.typing.ArrayLike
+            Equations, an ``(N, 10)`` coefficient array, or an ``(N, 4, 4)``
+            homogeneous stack.
+        strategy: ClassificationStrategy
+            Invariants read by the decision table, as in :func:`classify`.
+        return: numpy.ndarray
+            ``int8`` :class:`QuadricType` values in input order; rows that fail
+            to parse or classify are :data:`UNCLASSIFIED`.
+    """
+
+    batch = _quadric_batch(quadrics)
+    codes = _SHARED_CLASSIFIER.classify_many(batch.quadratic, batch.homogeneous, strategy)
+    codes[batch.error_mask] = UNCLASSIFIED
+    return codes
 
 
 __all__ = [
     "NotAQuadricError",
     "NotAQuadricException",
     "QuadricClassifier",
+    "UNCLASSIFIED",
+    "classify",
+    "classify_many",
     "classify_quadric",
     "expr2classification",
     "get_eigenvalues_multiplicities",
@@ -0,0 +1,220 @@
+"""
+Generate random quadrics of known type by inverting canonicalization.
+
+Each sample starts from the canonical form of its type with random positive
+coefficient magnitudes, is moved by a random proper rotation ``R`` and
+translation ``t`` (a canonical point ``u`` lands on ``R @ u + t``), and is
+multiplied by a random positive scale. Every step is a stacked NumPy
+operation, so millions of samples cost a few array passes; only
+:meth:`GeneratedQuadrics.equations` loops in Python to format text. The
+equations print every coefficient with ``repr``, so parsing them gives back
+exactly the generated matrices.
+
+Run the generator tests with ``python -m pytest tests/test_generator.py -q``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from src.numerical.models import FloatArray, Int8Array, QuadricMatrixBatch, QuadricType
+from src.numerical.quadric_polynomial import QuadricPolynomial, coefficients_from_homogeneous
+
+
+DEFAULT_COEFFICIENT_RANGE = (0.5, 3.0)
+DEFAULT_TRANSLATION_RANGE = 2.0
+DEFAULT_SCALE_RANGE = (0.5, 2.0)
+# Diagonal quadratic coefficient signs, linear half-coefficients, and constant
+# of every canonical form; the diagonal magnitudes are drawn per sample.
+CANONICAL_FORMS: dict[QuadricType, tuple[tuple[int, int, int], tuple[float, float, float], float]] = {
+    QuadricType.REAL_ELLIPSOID: ((1, 1, 1), (0.0, 0.0, 0.0), -1.0),
+    QuadricType.COMPLEX_ELLIPSOID: ((1, 1, 1), (0.0, 0.0, 0.0), 1.0),
+    QuadricType.ONE_SHEET_HYPERBOLOID: ((1, 1, -1), (0.0, 0.0, 0.0), -1.0),
+    QuadricType.TWO_SHEET_HYPERBOLOID: ((1, -1, -1), (0.0, 0.0, 0.0), -1.0),
+    QuadricType.REAL_CONE: ((1, 1, -1), (0.0, 0.0, 0.0), 0.0),
+    QuadricType.COMPLEX_CONE: ((1, 1, 1), (0.0, 0.0, 0.0), 0.0),
+    QuadricType.ELLIPTIC_PARABOLOID: ((1, 1, 0), (0.0, 0.0, -0.5), 0.0),
+    QuadricType.HYPERBOLIC_PARABOLOID: ((1, -1, 0), (0.0, 0.0, -0.5), 0.0),
+    QuadricType.REAL_ELLIPTIC_CYLINDER: ((1, 1, 0), (0.0, 0.0, 0.0), -1.0),
+    QuadricType.COMPLEX_ELLIPTIC_CYLINDER: ((1, 1, 0), (0.0, 0.0, 0.0), 1.0),
+    QuadricType.HYPERBOLIC_CYLINDER: ((1, -1, 0), (0.0, 0.0, 0.0), -1.0),
+    QuadricType.REAL_INTERSECTING_PLANES: ((1, -1, 0), (0.0, 0.0, 0.0), 0.0),
+    QuadricType.COMPLEX_INTERSECTING_PLANES: ((1, 1, 0), (0.0, 0.0, 0.0), 0.0),
+    QuadricType.PARABOLIC_CYLINDER: ((1, 0, 0), (0.0, -0.5, 0.0), 0.0),
+    QuadricType.REAL_PARALLEL_PLANES: ((1, 0, 0), (0.0, 0.0, 0.0), -1.0),
+    QuadricType.COMPLEX_PARALLEL_PLANES: ((1, 0, 0), (0.0, 0.0, 0.0), 1.0),
+    QuadricType.DOUBLE_PLANE: ((1, 0, 0), (0.0, 0.0, 0.0), 0.0),
+}
+_CODES = max(int(quadric_type) for quadric_type in QuadricType) + 1
+_SIGNS = np.zeros((_CODES, 3), dtype=np.float64)
+_LINEAR = np.zeros((_CODES, 3), dtype=np.float64)
+_CONSTANTS = np.zeros(_CODES, dtype=np.float64)
+for _type, (_signs, _linear, _constant) in CANONICAL_FORMS.items():
+    _SIGNS[_type], _LINEAR[_type], _CONSTANTS[_type] = _signs, _linear, _constant
+
+
+@dataclass(frozen=True, slots=True)
+class GeneratedQuadrics:
+    """
+    Store random quadrics together with the ground truth that produced them.
+
+    Args:
+        quadric_types: numpy.ndarray
+            ``int8`` type code of every sample, shape ``(N,)``.
+        canonical_matrices: numpy.ndarray
+            Canonical homogeneous matrices before the motion, ``(N, 4, 4)``.
+        rotations: numpy.ndarray
+            Proper rotations ``R`` applied to canonical points, ``(N, 3, 3)``.
+        translations: numpy.ndarray
+            Translations ``t`` applied after the rotation, ``(N, 3)``.
+        scales: numpy.ndarray
+            Positive factors multiplying the moved matrices, ``(N,)``.
+        homogeneous: numpy.ndarray
+            Generated homogeneous matrices, ``(N, 4, 4)``.
+    return: GeneratedQuadrics
+        Samples whose quadric at ``R @ u + t`` equals ``scale`` times the
+        canonical quadric at ``u``.
+    """
+
+    quadric_types: Int8Array
+    canonical_matrices: FloatArray
+    rotations: FloatArray
+    translations: FloatArray
+    scales: FloatArray
+    homogeneous: FloatArray
+
+    def __len__(self) -> int:
+        return int(self.quadric_types.shape[0])
+
+    def batch(self) -> QuadricMatrixBatch:
+        """Return the generated matrices as a batch for the vectorized kernels."""
+
+        return QuadricMatrixBatch.from_homogeneous(self.homogeneous)
+
+    def equations(self) -> list[str]:
+        """
+        Format every sample as an equation in the parser's grammar.
+
+        Args:
+            return: list[str]
+                Equations such as ``1.5*x**2 + ... = 0`` whose parsed matrices
+                equal :attr:`homogeneous` exactly.
+        """
+
+        coefficients = coefficients_from_homogeneous(self.homogeneous)
+        return [f"{QuadricPolynomial(row).to_text()} = 0" for row in coefficients]
+
+
+def random_rotations(size: int, rng: np.random.Generator) -> FloatArray:
+    """
+    Draw uniformly distributed proper rotations.
+
+    Args:
+        size: int
+            Number of rotations.
+        rng: numpy.random.Generator
+            Source of the Gaussian quaternions that are normalized.
+        return: numpy.ndarray
+            Rotations with determinant one, shape ``(size, 3, 3)``.
+    """
+
+    # A normalized Gaussian 4-vector is a uniform unit quaternion, whose
+    # rotation matrix is Haar-distributed over SO(3); this avoids a QR per sample.
+    quaternions = rng.normal(size=(size, 4))
+    quaternions /= np.linalg.norm(quaternions, axis=1, keepdims=True)
+    w, x, y, z = quaternions.T
+    rotations = np.empty((size, 3, 3), dtype=np.float64)
+    rotations[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    rotations[:, 0, 1] = 2.0 * (x * y - w * z)
+    rotations[:, 0, 2] = 2.0 * (x * z + w * y)
+    rotations[:, 1, 0] = 2.0 * (x * y + w * z)
+    rotations[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    rotations[:, 1, 2] = 2.0 * (y * z - w * x)
+    rotations[:, 2, 0] = 2.0 * (x * z - w * y)
+    rotations[:, 2, 1] = 2.0 * (y * z + w * x)
+    rotations[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return rotations
+
+
+def generate_quadrics(
+    quadric_types: QuadricType | Sequence[QuadricType] | npt.ArrayLike,
+    size: int | None = None,
+    rng: np.random.Generator | int | None = None,
+    coefficient_range: tuple[float, float] = DEFAULT_COEFFICIENT_RANGE,
+    translation_range: float = DEFAULT_TRANSLATION_RANGE,
+    scale_range: tuple[float, float] = DEFAULT_SCALE_RANGE,
+) -> GeneratedQuadrics:
+    """
+    Sample quadrics of requested types under random rigid motions.
+
+    Args:
+        quadric_types: QuadricType | collections.abc.Sequence[QuadricType] | numpy.typing.ArrayLike
+            One type repeated ``size`` times, or one type code per sample.
+        size: int | None
+            Number of samples when a single type is given.
+        rng: numpy.random.Generator | int | None
+            Generator or seed; equal seeds give equal samples.
+        coefficient_range: tuple[float, float]
+            Positive interval of the canonical diagonal magnitudes.
+        translation_range: float
+            Translation components are uniform in ``[-range, range]``.
+        scale_range: tuple[float, float]
+            Positive interval of the overall matrix scale.
+        return: GeneratedQuadrics
+            Matrices with their types, canonical forms, and motions.
+    """
+
+    if isinstance(quadric_types, QuadricType):
+        if size is None or size < 0:
+            raise ValueError("size must be a non-negative integer when a single type is requested")
+        codes = np.full(size, int(quadric_types), dtype=np.int8)
+    else:
+        codes = np.asarray(quadric_types, dtype=np.int8).reshape(-1)
+        if size is not None and size != codes.size:
+            raise ValueError("size must match the number of requested types")
+        if np.any(~np.isin(codes, [int(quadric_type) for quadric_type in QuadricType])):
+            raise ValueError("quadric_types must contain QuadricType codes")
+    low, high = coefficient_range
+    if not 0.0 < low <= high or not 0.0 < scale_range[0] <= scale_range[1] or translation_range < 0.0:
+        raise ValueError("coefficient and scale ranges must be positive and translation_range non-negative")
+    generator = np.random.default_rng(rng)
+    count = codes.size
+
+    canonical = np.zeros((count, 4, 4), dtype=np.float64)
+    diagonal = np.arange(3)
+    canonical[:, diagonal, diagonal] = _SIGNS[codes] * generator.uniform(low, high, size=(count, 3))
+    canonical[:, :3, 3] = canonical[:, 3, :3] = _LINEAR[codes]
+    canonical[:, 3, 3] = _CONSTANTS[codes]
+    rotations = random_rotations(count, generator)
+    translations = generator.uniform(-translation_range, translation_range, size=(count, 3))
+    scales = generator.uniform(scale_range[0], scale_range[1], size=count)
+
+    # With T = [[R, t], [0, 1]] the moved quadric is T^-T C T^-1, and
+    # T^-1 = [[R^T, -R^T t], [0, 1]].
+    inverse = np.zeros((count, 4, 4), dtype=np.float64)
+    inverse[:, :3, :3] = rotations.transpose(0, 2, 1)
+    inverse[:, :3, 3] = -np.einsum("nji,nj->ni", rotations, translations)
+    inverse[:, 3, 3] = 1.0
+    homogeneous = scales[:, np.newaxis, np.newaxis] * (inverse.transpose(0, 2, 1) @ canonical @ inverse)
+    # Symmetrize exactly so the equation text round-trips to the same matrix.
+    homogeneous = 0.5 * (homogeneous + homogeneous.transpose(0, 2, 1))
+    return GeneratedQuadrics(
+        quadric_types=codes,
+        canonical_matrices=canonical,
+        rotations=rotations,
+        translations=translations,
+        scales=scales,
+        homogeneous=homogeneous,
+    )
+
+
+__all__ = [
+    "CANONICAL_FORMS",
+    "GeneratedQuadrics",
+    "generate_quadrics",
+    "random_rotations",
+]
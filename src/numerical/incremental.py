@@ -0,0 +1,183 @@
+"""
+Warm-start the eigendecomposition of slowly changing quadrics.
+
+A quadric tracked frame by frame changes only slightly between updates, so
+the previous rotation basis almost diagonalizes the new quadratic block. A few
+cyclic Jacobi sweeps started from that basis converge quadratically, keep
+every eigenvector close to its predecessor, and therefore preserve column
+order and signs instead of letting LAPACK pick a new basis each frame. When
+the spectrum stays clear of the roundoff thresholds the previous type is
+still valid and classification is skipped.
+
+Run the incremental tests with ``python -m pytest tests/test_transformer.py -q``.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from src.numerical.invariants import ROUNDOFF_FACTOR, QuadricInvariants
+from src.numerical.models import CanonicalizationResult, FloatArray
+
+
+DEFAULT_MAX_SWEEPS = 8
+# Eigenvalues and constants must exceed the roundoff threshold by this factor
+# before the previous classification is trusted without re-running it.
+CLEARANCE_FACTOR = 1e4
+_PAIRS = ((0, 1), (0, 2), (1, 2))
+
+
+def _orthonormalized(basis: FloatArray) -> list[list[float]]:
+    """Remove accumulated drift from basis columns by Gram-Schmidt, keeping their signs."""
+
+    columns: list[list[float]] = []
+    for column in basis.T.tolist():
+        for previous in columns:
+            projection = sum(a * b for a, b in zip(column, previous))
+            column = [a - projection * b for a, b in zip(column, previous)]
+        norm = math.sqrt(sum(a * a for a in column))
+        columns.append([a / norm for a in column])
+    return [list(row) for row in zip(*columns)]
+
+
+def warm_eigendecomposition(
+    matrix: FloatArray,
+    basis: FloatArray,
+    max_sweeps: int = DEFAULT_MAX_SWEEPS,
+) -> tuple[FloatArray, FloatArray] | None:
+    """
+    Diagonalize a symmetric 3x3 matrix by Jacobi sweeps started from ``basis``.
+
+    Every rotation uses the angle of magnitude at most pi/4, so each returned
+    column is the eigenvector nearest to the same column of ``basis``.
+
+    Args:
+        matrix: numpy.ndarray
+            Symmetric 3x3 matrix.
+        basis: numpy.ndarray
+            Orthonormal columns that approximately diagonalize ``matrix``.
+        max_sweeps: int
+            Maximum number of cyclic sweeps over the three off-diagonal pairs.
+        return: tuple[numpy.ndarray, numpy.ndarray] | None
+            Eigenvalues and eigenvector columns in ``basis`` order, or ``None``
+            when the sweeps did not converge.
+    """
+
+    vectors = _orthonormalized(basis)
+    start = np.array(vectors, dtype=np.float64)
+    rotated = (start.T @ matrix @ start).tolist()
+    cutoff = float(np.finfo(np.float64).eps) * max(float(np.max(np.abs(matrix))), float(np.finfo(np.float64).tiny))
+    for _ in range(max_sweeps):
+        if max(abs(rotated[p][q]) for p, q in _PAIRS) <= cutoff:
+            eigenvalues = np.array([rotated[0][0], rotated[1][1], rotated[2][2]], dtype=np.float64)
+            return eigenvalues, np.array(vectors, dtype=np.float64)
+        for p, q in _PAIRS:
+            off_diagonal = rotated[p][q]
+            if abs(off_diagonal) <= cutoff:
+                continue
+            theta = (rotated[q][q] - rotated[p][p]) / (2.0 * off_diagonal)
+            tangent = math.copysign(1.0, theta) / (abs(theta) + math.sqrt(theta * theta + 1.0))
+            cosine = 1.0 / math.sqrt(tangent * tangent + 1.0)
+            sine = tangent * cosine
+            r = 3 - p - q
+            row_p, row_q = rotated[r][p], rotated[r][q]
+            rotated[r][p] = rotated[p][r] = cosine * row_p - sine * row_q
+            rotated[r][q] = rotated[q][r] = sine * row_p + cosine * row_q
+            rotated[p][p] -= tangent * off_diagonal
+            rotated[q][q] += tangent * off_diagonal
+            rotated[p][q] = rotated[q][p] = 0.0
+            for row in vectors:
+                vector_p, vector_q = row[p], row[q]
+                row[p] = cosine * vector_p - sine * vector_q
+                row[q] = sine * vector_p + cosine * vector_q
+    return None
+
+
+def warm_invariants(
+    previous: CanonicalizationResult,
+    quadratic: FloatArray,
+    homogeneous: FloatArray,
+    max_sweeps: int = DEFAULT_MAX_SWEEPS,
+) -> tuple[QuadricInvariants, bool] | None:
+    """
+    Build invariants of an updated quadric from the previous frame's basis.
+
+    The previous type may be reused only for a centered previous frame whose
+    new eigenvalues and reduced constant keep their signs and stay
+    ``CLEARANCE_FACTOR`` times above the roundoff threshold. The previous
+    reduced constant must clear it too at the previous frame's scale, so cones,
+    whose constant is exactly zero, are always reclassified. The homogeneous
+    spectrum is then replaced by the congruent diagonal form
+    ``(eigenvalues, reduced constant)``, which has the same inertia and is all
+    the rank and determinant-sign invariants read.
+
+    Args:
+        previous: CanonicalizationResult
+            Result of the preceding frame.
+        quadratic: numpy.ndarray
+            Symmetric 3x3 quadratic block of the new frame.
+        homogeneous: numpy.ndarray
+            Symmetric 4x4 homogeneous matrix of the new frame.
+        max_sweeps: int
+            Jacobi sweep limit passed to :func:`warm_eigendecomposition`.
+        return: tuple[QuadricInvariants, bool] | None
+            Invariants with warm eigenpairs and whether the previous type still
+            holds, or ``None`` when the warm start did not converge.
+    """
+
+    scale = float(np.max(np.abs(homogeneous)))
+    if scale == 0:
+        raise ValueError("quadric matrix cannot be identically zero")
+    normalized_quadratic = quadratic / scale
+    normalized_homogeneous = homogeneous / scale
+    eigenpairs = warm_eigendecomposition(normalized_quadratic, previous.rotation_matrix.T, max_sweeps)
+    if eigenpairs is None:
+        return None
+    eigenvalues, eigenvectors = eigenpairs
+
+    # The normalized homogeneous matrix has largest entry one, so its roundoff
+    # threshold is the plain ROUNDOFF_FACTOR multiple of machine epsilon.
+    threshold = CLEARANCE_FACTOR * ROUNDOFF_FACTOR * float(np.finfo(np.float64).eps)
+    values = eigenvalues.tolist()
+    previous_diagonal = np.diag(previous.middle_matrix).tolist()
+    if previous.centered and all(
+        abs(value) > threshold and (value > 0.0) == (reference > 0.0)
+        for value, reference in zip(values, previous_diagonal)
+    ):
+        rotated_linear = (eigenvectors.T @ normalized_homogeneous[:3, 3]).tolist()
+        center = [linear / value for linear, value in zip(rotated_linear, values)]
+        reduced_constant = float(normalized_homogeneous[3, 3]) - sum(a * b for a, b in zip(rotated_linear, center))
+        # By Ostrowski's theorem the homogeneous eigenvalues are those of the
+        # congruent diagonal form scaled by at least (1 + |center|) ** -2.
+        smallest = min(min(abs(value) for value in values), abs(reduced_constant))
+        clear = smallest / (1.0 + math.sqrt(sum(a * a for a in center))) ** 2 > threshold
+        previous_constant = float(previous.final_matrix[3, 3]) / float(np.max(np.abs(previous.initial_matrix)))
+        if (
+            clear
+            and abs(previous_constant) > threshold
+            and np.sign(reduced_constant) == np.sign(previous_constant)
+        ):
+            invariants = QuadricInvariants(
+                scale=scale,
+                quadratic=normalized_quadratic,
+                homogeneous=normalized_homogeneous,
+                quadratic_eigenvalues=eigenvalues,
+                quadratic_eigenvectors=eigenvectors,
+                homogeneous_eigenvalues=np.array([*values, reduced_constant], dtype=np.float64),
+            )
+            return invariants, True
+
+    invariants = QuadricInvariants(
+        scale=scale,
+        quadratic=normalized_quadratic,
+        homogeneous=normalized_homogeneous,
+        quadratic_eigenvalues=eigenvalues,
+        quadratic_eigenvectors=eigenvectors,
+        homogeneous_eigenvalues=np.asarray(np.linalg.eigvalsh(normalized_homogeneous), dtype=np.float64),
+    )
+    return invariants, False
+
+
+__all__ = ["CLEARANCE_FACTOR", "DEFAULT_MAX_SWEEPS", "warm_eigendecomposition", "warm_invariants"]
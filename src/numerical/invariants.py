@@ -0,0 +1,279 @@
+"""
+Compute every orthogonal invariant of one quadric from a single decomposition.
+
+The classifier and each canonicalization strategy read ranks, determinant
+sign, inertia, and eigenpairs from one shared :class:`QuadricInvariants`.
+Run the checks with ``python -m pytest tests/test_classifier.py -q``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.numerical.models import BoolArray, FloatArray, IntArray, MatrixInertia
+from src.numerical.numerical_helpers import batch_relative_tolerance, relative_tolerance
+from src.numerical.symmetric_eigen import batch_eigh3, eigh3
+
+
+ROUNDOFF_FACTOR = 100.0
+
+
+def inertia_from_eigenvalues(eigenvalues: FloatArray) -> MatrixInertia:
+    """
+    Count eigenvalue signs relative to the largest eigenvalue magnitude.
+
+    Args:
+        eigenvalues: numpy.ndarray
+            Real eigenvalues of one symmetric 3x3 matrix.
+        return: MatrixInertia
+            Positive, negative, and numerically zero counts.
+    """
+
+    threshold = relative_tolerance(eigenvalues, ROUNDOFF_FACTOR)
+    positive = int(np.count_nonzero(eigenvalues > threshold))
+    negative = int(np.count_nonzero(eigenvalues < -threshold))
+    return MatrixInertia(positive=positive, negative=negative, zero=eigenvalues.size - positive - negative)
+
+
+@dataclass(frozen=True, slots=True)
+class QuadricInvariants:
+    """
+    Store the scale-normalized matrices of one quadric and their spectra.
+
+    Args:
+        scale: float
+            Largest absolute homogeneous entry used for normalization.
+        quadratic: numpy.ndarray
+            Normalized symmetric 3x3 quadratic block.
+        homogeneous: numpy.ndarray
+            Normalized symmetric 4x4 homogeneous matrix.
+        quadratic_eigenvalues: numpy.ndarray
+            Eigenvalues of ``quadratic``, ascending when computed by
+            :meth:`from_matrices` and in warm-start basis order otherwise.
+        quadratic_eigenvectors: numpy.ndarray
+            Orthonormal eigenvector columns matching ``quadratic_eigenvalues``.
+        homogeneous_eigenvalues: numpy.ndarray
+            Ascending eigenvalues of ``homogeneous``.
+    return: QuadricInvariants
+        Invariants consumed by classification and canonicalization.
+    """
+
+    scale: float
+    quadratic: FloatArray
+    homogeneous: FloatArray
+    quadratic_eigenvalues: FloatArray
+    quadratic_eigenvectors: FloatArray
+    homogeneous_eigenvalues: FloatArray
+
+    @classmethod
+    def from_matrices(cls, quadratic: FloatArray, homogeneous: FloatArray) -> QuadricInvariants:
+        """
+        Normalize one quadric and run its two symmetric eigendecompositions.
+
+        The 3x3 block uses the closed-form :func:`eigh3` kernel; the 4x4
+        spectrum stays on LAPACK.
+
+        Args:
+            quadratic: numpy.ndarray
+                Symmetric 3x3 quadratic block.
+            homogeneous: numpy.ndarray
+                Symmetric 4x4 homogeneous matrix.
+            return: QuadricInvariants
+                Invariants of the normalized matrices.
+        """
+
+        if quadratic.shape != (3, 3) or homogeneous.shape != (4, 4):
+            raise ValueError("expected quadratic shape (3, 3) and homogeneous shape (4, 4)")
+        scale = float(np.max(np.abs(homogeneous)))
+        if scale == 0:
+            raise ValueError("quadric matrix cannot be identically zero")
+        normalized_quadratic = quadratic / scale
+        normalized_homogeneous = homogeneous / scale
+        quadratic_eigenvalues, quadratic_eigenvectors = eigh3(normalized_quadratic)
+        return cls(
+            scale=scale,
+            quadratic=normalized_quadratic,
+            homogeneous=normalized_homogeneous,
+            quadratic_eigenvalues=quadratic_eigenvalues,
+            quadratic_eigenvectors=quadratic_eigenvectors,
+            homogeneous_eigenvalues=np.asarray(np.linalg.eigvalsh(normalized_homogeneous), dtype=np.float64),
+        )
+
+    @property
+    def rank_quadratic(self) -> int:
+        """Return the numerical rank of the quadratic block."""
+
+        threshold = relative_tolerance(self.quadratic, ROUNDOFF_FACTOR)
+        return int(np.count_nonzero(np.abs(self.quadratic_eigenvalues) > threshold))
+
+    @property
+    def rank_homogeneous(self) -> int:
+        """Return the numerical rank of the homogeneous matrix."""
+
+        threshold = relative_tolerance(self.homogeneous, ROUNDOFF_FACTOR)
+        return int(np.count_nonzero(np.abs(self.homogeneous_eigenvalues) > threshold))
+
+    @property
+    def determinant_sign(self) -> float:
+        """Return the homogeneous determinant sign, or zero when it is singular."""
+
+        if self.rank_homogeneous != 4:
+            return 0.0
+        return float(np.prod(np.sign(self.homogeneous_eigenvalues)))
+
+    @property
+    def inertia(self) -> MatrixInertia:
+        """Return the eigenvalue sign counts of the quadratic block."""
+
+        return inertia_from_eigenvalues(self.quadratic_eigenvalues)
+
+    @property
+    def reduced_constant(self) -> float:
+        """
+        Return the constant left after completing every non-null square.
+
+        This equals the homogeneous constant evaluated at the minimum-norm
+        center ``-pinv(A) @ b`` and uses the stored eigenpairs instead of a
+        separate pseudo-inverse.
+        """
+
+        eigenvalues = self.quadratic_eigenvalues
+        cutoff = ROUNDOFF_FACTOR * float(np.finfo(np.float64).eps) * float(np.max(np.abs(eigenvalues)))
+        active = np.abs(eigenvalues) > cutoff
+        rotated_linear = self.quadratic_eigenvectors.T @ self.homogeneous[:3, 3]
+        return float(self.homogeneous[3, 3] - np.sum(rotated_linear[active] ** 2 / eigenvalues[active]))
+
+
+@dataclass(frozen=True, slots=True)
+class QuadricInvariantBatch:
+    """
+    Store :class:`QuadricInvariants` fields for ``N`` quadrics as stacked arrays.
+
+    Rows whose homogeneous matrix is identically zero are kept with unit
+    scale and flagged as invalid instead of raising.
+
+    Args:
+        scale: numpy.ndarray
+            Largest absolute homogeneous entry of every row, shape ``(N,)``.
+        valid: numpy.ndarray
+            Boolean mask of rows with a non-zero homogeneous matrix.
+        quadratic: numpy.ndarray
+            Normalized quadratic blocks, shape ``(N, 3, 3)``.
+        homogeneous: numpy.ndarray
+            Normalized homogeneous matrices, shape ``(N, 4, 4)``.
+        quadratic_eigenvalues: numpy.ndarray
+            Ascending quadratic eigenvalues, shape ``(N, 3)``.
+        quadratic_eigenvectors: numpy.ndarray
+            Matching eigenvector columns, shape ``(N, 3, 3)``.
+        homogeneous_eigenvalues: numpy.ndarray
+            Ascending homogeneous eigenvalues, shape ``(N, 4)``.
+    return: QuadricInvariantBatch
+        Stacked invariants consumed by batched classification and canonicalization.
+    """
+
+    scale: FloatArray
+    valid: BoolArray
+    quadratic: FloatArray
+    homogeneous: FloatArray
+    quadratic_eigenvalues: FloatArray
+    quadratic_eigenvectors: FloatArray
+    homogeneous_eigenvalues: FloatArray
+
+    @classmethod
+    def from_matrices(cls, quadratic: FloatArray, homogeneous: FloatArray) -> QuadricInvariantBatch:
+        """
+        Normalize every row and run two batched symmetric eigendecompositions.
+
+        Args:
+            quadratic: numpy.ndarray
+                Quadratic blocks with shape ``(N, 3, 3)``.
+            homogeneous: numpy.ndarray
+                Homogeneous matrices with shape ``(N, 4, 4)``.
+            return: QuadricInvariantBatch
+                Invariants of every normalized row.
+        """
+
+        quadratic = np.asarray(quadratic, dtype=np.float64)
+        homogeneous = np.asarray(homogeneous, dtype=np.float64)
+        if quadratic.ndim != 3 or quadratic.shape[1:] != (3, 3) or homogeneous.shape != (quadratic.shape[0], 4, 4):
+            raise ValueError("expected quadratic shape (N, 3, 3) and homogeneous shape (N, 4, 4)")
+        raw_scale = np.max(np.abs(homogeneous), axis=(1, 2))
+        valid = raw_scale > 0
+        scale = np.where(valid, raw_scale, 1.0)
+        normalized_quadratic = quadratic / scale[:, np.newaxis, np.newaxis]
+        normalized_homogeneous = homogeneous / scale[:, np.newaxis, np.newaxis]
+        quadratic_eigenvalues, quadratic_eigenvectors = batch_eigh3(normalized_quadratic)
+        return cls(
+            scale=scale,
+            valid=valid,
+            quadratic=normalized_quadratic,
+            homogeneous=normalized_homogeneous,
+            quadratic_eigenvalues=quadratic_eigenvalues,
+            quadratic_eigenvectors=quadratic_eigenvectors,
+            homogeneous_eigenvalues=np.asarray(np.linalg.eigvalsh(normalized_homogeneous), dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return int(self.scale.shape[0])
+
+    @property
+    def rank_quadratic(self) -> IntArray:
+        """Return the numerical rank of every quadratic block."""
+
+        threshold = batch_relative_tolerance(self.quadratic, ROUNDOFF_FACTOR)
+        ranks = np.count_nonzero(np.abs(self.quadratic_eigenvalues) > threshold[:, np.newaxis], axis=1)
+        return np.asarray(ranks, dtype=np.intp)
+
+    @property
+    def rank_homogeneous(self) -> IntArray:
+        """Return the numerical rank of every homogeneous matrix."""
+
+        threshold = batch_relative_tolerance(self.homogeneous, ROUNDOFF_FACTOR)
+        ranks = np.count_nonzero(np.abs(self.homogeneous_eigenvalues) > threshold[:, np.newaxis], axis=1)
+        return np.asarray(ranks, dtype=np.intp)
+
+    @property
+    def determinant_sign(self) -> FloatArray:
+        """Return every homogeneous determinant sign, zero for singular rows."""
+
+        signs = np.prod(np.sign(self.homogeneous_eigenvalues), axis=1)
+        return np.where(self.rank_homogeneous == 4, signs, 0.0)
+
+    @property
+    def inertia_counts(self) -> tuple[IntArray, IntArray, IntArray]:
+        """Return positive, negative, and zero eigenvalue counts of every quadratic block."""
+
+        threshold = batch_relative_tolerance(self.quadratic_eigenvalues, ROUNDOFF_FACTOR)[:, np.newaxis]
+        positive = np.count_nonzero(self.quadratic_eigenvalues > threshold, axis=1)
+        negative = np.count_nonzero(self.quadratic_eigenvalues < -threshold, axis=1)
+        return positive, negative, 3 - positive - negative
+
+    @property
+    def reduced_constant(self) -> FloatArray:
+        """Return :attr:`QuadricInvariants.reduced_constant` for every row."""
+
+        eigenvalues = self.quadratic_eigenvalues
+        cutoff = ROUNDOFF_FACTOR * float(np.finfo(np.float64).eps) * np.max(np.abs(eigenvalues), axis=1)
+        active = np.abs(eigenvalues) > cutoff[:, np.newaxis]
+        rotated_linear = np.einsum("nij,ni->nj", self.quadratic_eigenvectors, self.homogeneous[:, :3, 3])
+        completed = np.divide(rotated_linear**2, eigenvalues, out=np.zeros_like(eigenvalues), where=active)
+        return np.asarray(self.homogeneous[:, 3, 3] - np.sum(completed, axis=1), dtype=np.float64)
+
+    def row(self, index: int) -> QuadricInvariants:
+        """Return one valid row as a scalar :class:`QuadricInvariants`."""
+
+        if not self.valid[index]:
+            raise ValueError("quadric matrix cannot be identically zero")
+        return QuadricInvariants(
+            scale=float(self.scale[index]),
+            quadratic=self.quadratic[index],
+            homogeneous=self.homogeneous[index],
+            quadratic_eigenvalues=self.quadratic_eigenvalues[index],
+            quadratic_eigenvectors=self.quadratic_eigenvectors[index],
+            homogeneous_eigenvalues=self.homogeneous_eigenvalues[index],
+        )
+
+
+__all__ = ["QuadricInvariantBatch", "QuadricInvariants", "inertia_from_eigenvalues"]
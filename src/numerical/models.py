@@ -8,14 +8,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import IntEnum, StrEnum
-from typing import ClassVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import numpy as np
 import numpy.typing as npt
-import sympy as sp
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator, model_validator
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+    from src.numerical.quadric_polynomial import QuadricPolynomial
+    from src.numerical.stage_timings import PipelineTimings
 
 FloatArray = npt.NDArray[np.float64]
+BoolArray = npt.NDArray[np.bool_]
+IntArray = npt.NDArray[np.intp]
+Int8Array = npt.NDArray[np.int8]
 
 
 class TransformationKind(StrEnum):
@@ -25,6 +34,21 @@ class TransformationKind(StrEnum):
     ROTATION = "rotation"
 
 
+class ValidationMode(StrEnum):
+    """Choose how much of each :class:`CanonicalizationResult` is re-verified."""
+
+    FULL = "full"
+    SAMPLED = "sampled"
+    TRUSTED = "trusted"
+
+
+class ClassificationStrategy(StrEnum):
+    """Choose which invariants feed the classifier decision table."""
+
+    SPECTRAL = "spectral"
+    CHARACTERISTIC = "characteristic"
+
+
 class QuadricType(IntEnum):
     """Identify every supported mathematical quadric classification."""
 
@@ -81,6 +105,260 @@ class QuadricMatrices:
         if self.linear.shape != (3, 1):
             raise ValueError("linear vector must have shape (3, 1)")
 
+    @classmethod
+    def from_coefficients(cls, coefficients: npt.ArrayLike) -> QuadricMatrices:
+        """
+        Build the three matrix forms from ten polynomial coefficients.
+
+        Args:
+            coefficients: numpy.typing.ArrayLike
+                Coefficients of x**2, y**2, z**2, x*y, x*z, y*z, x, y, z,
+                and the constant term, in that order.
+            return: QuadricMatrices
+                Float matrices using half-coefficients for mixed and linear terms.
+        """
+
+        values = np.asarray(coefficients, dtype=np.float64)
+        if values.shape != (10,):
+            raise ValueError("quadric coefficients must have shape (10,)")
+        if not np.all(np.isfinite(values)):
+            raise ValueError("quadric coefficients must be finite")
+        homogeneous = homogeneous_from_coefficients(values)
+        return cls(
+            homogeneous=homogeneous,
+            quadratic=homogeneous[:3, :3].copy(),
+            linear=homogeneous[:3, 3:].copy(),
+        )
+
+    @classmethod
+    def from_homogeneous(cls, matrix: npt.ArrayLike) -> QuadricMatrices:
+        """
+        Build the three matrix forms from one symmetric homogeneous matrix.
+
+        Args:
+            matrix: numpy.typing.ArrayLike
+                Symmetric 4x4 matrix whose off-diagonal entries hold half the
+                mixed and linear coefficients.
+            return: QuadricMatrices
+                Owned float matrices; roundoff asymmetry is averaged away.
+        """
+
+        array = np.asarray(matrix, dtype=np.float64)
+        if array.shape != (4, 4):
+            raise ValueError("homogeneous matrix must have shape (4, 4)")
+        if not np.all(np.isfinite(array)):
+            raise ValueError("homogeneous matrix must be finite")
+        symmetry_tolerance = 1e-12 * max(float(np.max(np.abs(array))), float(np.finfo(np.float64).tiny))
+        if not np.allclose(array, array.T, atol=symmetry_tolerance, rtol=0):
+            raise ValueError("homogeneous matrix must be symmetric")
+        homogeneous = (array + array.T) / 2
+        return cls(
+            homogeneous=homogeneous,
+            quadratic=homogeneous[:3, :3].copy(),
+            linear=homogeneous[:3, 3:].copy(),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class QuadricMatrixBatch:
+    """
+    Store many quadrics as contiguous stacked matrices with per-row errors.
+
+    Rows whose equation could not be parsed hold zero matrices, are flagged
+    in ``error_mask``, and carry their message in ``errors``.
+
+    Args:
+        homogeneous: numpy.ndarray
+            Symmetric homogeneous matrices with shape ``(N, 4, 4)``.
+        quadratic: numpy.ndarray
+            Quadratic blocks with shape ``(N, 3, 3)``.
+        linear: numpy.ndarray
+            Linear half-coefficient columns with shape ``(N, 3, 1)``.
+        error_mask: numpy.ndarray
+            Boolean array with shape ``(N,)`` marking rows that failed.
+        errors: tuple[str | None, ...]
+            One error message per failed row and ``None`` elsewhere.
+    return: QuadricMatrixBatch
+        Stacked matrices consumed by batched classification and canonicalization.
+    """
+
+    homogeneous: FloatArray
+    quadratic: FloatArray
+    linear: FloatArray
+    error_mask: BoolArray
+    errors: tuple[str | None, ...]
+
+    def __post_init__(self) -> None:
+        count = self.error_mask.shape[0] if self.error_mask.ndim == 1 else -1
+        if count < 0 or self.homogeneous.shape != (count, 4, 4):
+            raise ValueError("homogeneous batch must have shape (N, 4, 4) matching error_mask (N,)")
+        if self.quadratic.shape != (count, 3, 3):
+            raise ValueError("quadratic batch must have shape (N, 3, 3)")
+        if self.linear.shape != (count, 3, 1):
+            raise ValueError("linear batch must have shape (N, 3, 1)")
+        if len(self.errors) != count:
+            raise ValueError("errors must contain one entry per batch row")
+
+    def __len__(self) -> int:
+        return int(self.error_mask.shape[0])
+
+    @classmethod
+    def from_coefficients(
+        cls,
+        coefficients: npt.ArrayLike,
+        errors: tuple[str | None, ...] | None = None,
+    ) -> QuadricMatrixBatch:
+        """
+        Build stacked matrix forms from an ``(N, 10)`` coefficient array.
+
+        Args:
+            coefficients: numpy.typing.ArrayLike
+                One row per quadric in :meth:`QuadricMatrices.from_coefficients` order.
+            errors: tuple[str | None, ...] | None
+                Optional per-row error messages; rows with a message are masked.
+            return: QuadricMatrixBatch
+                Contiguous float64 matrix stacks.
+        """
+
+        values = np.asarray(coefficients, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != 10:
+            raise ValueError("quadric coefficients must have shape (N, 10)")
+        row_errors = errors if errors is not None else (None,) * values.shape[0]
+        homogeneous = homogeneous_from_coefficients(values)
+        return cls(
+            homogeneous=homogeneous,
+            quadratic=np.ascontiguousarray(homogeneous[:, :3, :3]),
+            linear=np.ascontiguousarray(homogeneous[:, :3, 3:]),
+            error_mask=np.array([error is not None for error in row_errors], dtype=np.bool_).reshape(-1),
+            errors=tuple(row_errors),
+        )
+
+    @classmethod
+    def from_homogeneous(cls, matrices: npt.ArrayLike) -> QuadricMatrixBatch:
+        """
+        Build stacked matrix forms from an ``(N, 4, 4)`` homogeneous stack.
+
+        Args:
+            matrices: numpy.typing.ArrayLike
+                Symmetric homogeneous matrices stacked along the first axis.
+            return: QuadricMatrixBatch
+                Contiguous float64 stacks; roundoff asymmetry is averaged away.
+        """
+
+        array = np.asarray(matrices, dtype=np.float64)
+        if array.ndim != 3 or array.shape[1:] != (4, 4):
+            raise ValueError("homogeneous matrices must have shape (N, 4, 4)")
+        if not np.all(np.isfinite(array)):
+            raise ValueError("homogeneous matrix must be finite")
+        transposed = np.swapaxes(array, 1, 2)
+        scale = np.max(np.abs(array), axis=(1, 2), initial=0.0)
+        symmetry_tolerance = 1e-12 * np.maximum(scale, float(np.finfo(np.float64).tiny))
+        if np.any(np.max(np.abs(array - transposed), axis=(1, 2), initial=0.0) > symmetry_tolerance):
+            raise ValueError("homogeneous matrix must be symmetric")
+        homogeneous = np.ascontiguousarray((array + transposed) / 2)
+        return cls(
+            homogeneous=homogeneous,
+            quadratic=np.ascontiguousarray(homogeneous[:, :3, :3]),
+            linear=np.ascontiguousarray(homogeneous[:, :3, 3:]),
+            error_mask=np.zeros(array.shape[0], dtype=np.bool_),
+            errors=(None,) * array.shape[0],
+        )
+
+    def matrices(self, index: int) -> QuadricMatrices:
+        """Return one row as an independent :class:`QuadricMatrices` bundle."""
+
+        return QuadricMatrices(
+            homogeneous=self.homogeneous[index].copy(),
+            quadratic=self.quadratic[index].copy(),
+            linear=self.linear[index].copy(),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BatchCanonicalization:
+    """
+    Store the stacked artifacts of a batched canonicalization.
+
+    Rows that could not be parsed, classified, or transformed keep zero
+    matrices, are flagged in ``error_mask``, and carry their message in
+    ``errors``. Matrices are reported at the input scale, exactly like the
+    fields of :class:`CanonicalizationResult`.
+
+    Args:
+        quadric_types: numpy.ndarray
+            ``int8`` :class:`QuadricType` values, zero for failed rows, shape ``(N,)``.
+        centered: numpy.ndarray
+            Boolean mask of full-rank quadratic blocks, shape ``(N,)``.
+        initial_matrices: numpy.ndarray
+            Input homogeneous matrices, shape ``(N, 4, 4)``.
+        middle_matrices: numpy.ndarray
+            Matrices after the rotation stage, shape ``(N, 4, 4)``.
+        final_matrices: numpy.ndarray
+            Canonical homogeneous matrices, shape ``(N, 4, 4)``.
+        rotation_matrices: numpy.ndarray
+            Active point rotations, shape ``(N, 3, 3)``.
+        translation_vectors: numpy.ndarray
+            Active point translations applied before the rotation, shape ``(N, 3)``.
+        error_mask: numpy.ndarray
+            Boolean mask of failed rows, shape ``(N,)``.
+        errors: tuple[str | None, ...]
+            One error message per failed row and ``None`` elsewhere.
+    return: BatchCanonicalization
+        Stacked canonicalization artifacts in input order.
+    """
+
+    quadric_types: Int8Array
+    centered: BoolArray
+    initial_matrices: FloatArray
+    middle_matrices: FloatArray
+    final_matrices: FloatArray
+    rotation_matrices: FloatArray
+    translation_vectors: FloatArray
+    error_mask: BoolArray
+    errors: tuple[str | None, ...]
+
+    def __post_init__(self) -> None:
+        count = self.error_mask.shape[0] if self.error_mask.ndim == 1 else -1
+        if count < 0 or self.quadric_types.shape != (count,) or self.centered.shape != (count,):
+            raise ValueError("quadric_types, centered, and error_mask must share shape (N,)")
+        for matrices in (self.initial_matrices, self.middle_matrices, self.final_matrices):
+            if matrices.shape != (count, 4, 4):
+                raise ValueError("stage matrices must have shape (N, 4, 4)")
+        if self.rotation_matrices.shape != (count, 3, 3):
+            raise ValueError("rotation matrices must have shape (N, 3, 3)")
+        if self.translation_vectors.shape != (count, 3):
+            raise ValueError("translation vectors must have shape (N, 3)")
+        if len(self.errors) != count:
+            raise ValueError("errors must contain one entry per batch row")
+
+    def __len__(self) -> int:
+        return int(self.error_mask.shape[0])
+
+
+def homogeneous_from_coefficients(coefficients: FloatArray) -> FloatArray:
+    """
+    Build symmetric homogeneous matrices from trailing ten-coefficient rows.
+
+    Args:
+        coefficients: numpy.ndarray
+            Array with shape ``(..., 10)`` in :meth:`QuadricMatrices.from_coefficients` order.
+        return: numpy.ndarray
+            Contiguous homogeneous matrices with shape ``(..., 4, 4)``.
+    """
+
+    values = np.asarray(coefficients, dtype=np.float64)
+    homogeneous = np.empty(values.shape[:-1] + (4, 4), dtype=np.float64)
+    homogeneous[..., 0, 0] = values[..., 0]
+    homogeneous[..., 1, 1] = values[..., 1]
+    homogeneous[..., 2, 2] = values[..., 2]
+    homogeneous[..., 0, 1] = homogeneous[..., 1, 0] = values[..., 3] / 2
+    homogeneous[..., 0, 2] = homogeneous[..., 2, 0] = values[..., 4] / 2
+    homogeneous[..., 1, 2] = homogeneous[..., 2, 1] = values[..., 5] / 2
+    homogeneous[..., :3, 3] = values[..., 6:9] / 2
+    homogeneous[..., 3, :3] = values[..., 6:9] / 2
+    homogeneous[..., 3, 3] = values[..., 9]
+    return homogeneous
+
 
 @dataclass(frozen=True, slots=True)
 class MatrixInertia:
@@ -181,6 +459,26 @@ class AffineTransformation(BaseModel):
                 raise ValueError("a rotation step must have determinant one")
         return self
 
+    @classmethod
+    def trusted(cls, kind: TransformationKind, linear_map: FloatArray, offset: FloatArray) -> AffineTransformation:
+        """
+        Wrap arrays that are rigid by construction without copying or validating.
+
+        Args:
+            kind: TransformationKind
+                Whether the step is a translation or a rotation.
+            linear_map: numpy.ndarray
+                Owned float64 3x3 linear map; it is marked read-only in place.
+            offset: numpy.ndarray
+                Owned float64 offset with shape ``(3,)``; it is marked read-only in place.
+            return: AffineTransformation
+                Immutable transformation built through ``model_construct``.
+        """
+
+        linear_map.setflags(write=False)
+        offset.setflags(write=False)
+        return cls.model_construct(kind=kind, linear_map=linear_map, offset=offset)
+
     @property
     def homogeneous_matrix(self) -> FloatArray:
         """Return the 4x4 active point transformation matrix."""
@@ -195,7 +493,10 @@ class AffineTransformation(BaseModel):
     def inverse_homogeneous_matrix(self) -> FloatArray:
         """Return the coordinate substitution from the next stage to the current stage."""
 
-        inverse = np.asarray(np.linalg.inv(self.homogeneous_matrix), dtype=np.float64)
+        # Every step is rigid, so the inverse linear map is its transpose.
+        inverse = np.eye(4, dtype=np.float64)
+        inverse[:3, :3] = self.linear_map.T
+        inverse[:3, 3] = -(self.linear_map.T @ self.offset)
         inverse.setflags(write=False)
         return inverse
 
@@ -219,17 +520,29 @@ class CanonicalizationResult(BaseModel):
             Active point translation performed in the rotated coordinate frame.
         rotation_matrix: numpy.ndarray
             Active proper 3x3 rotation performed during canonicalization.
-        initial_equation: sympy.Expr
-            Expression reconstructed from the initial matrix.
-        middle_equation: sympy.Expr
-            Expression reconstructed from the intermediate matrix.
-        final_equation: sympy.Expr
-            Expression reconstructed from the canonical matrix.
+        initial_equation: sympy.Expr | None
+            Optional precomputed expression of the initial matrix.
+        middle_equation: sympy.Expr | None
+            Optional precomputed expression of the intermediate matrix.
+        final_equation: sympy.Expr | None
+            Optional precomputed expression of the canonical matrix.
     return: CanonicalizationResult
         Immutable validated public result model.
     """
 
     model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True, extra="forbid", frozen=True)
+    _LEGACY_KEYS: ClassVar[dict[str, str]] = {
+        "quadric type": "quadric_type",
+        "centered quadric": "centered",
+        "initial quadric matrix": "initial_matrix",
+        "middle quadric matrix": "middle_matrix",
+        "final quadric matrix": "final_matrix",
+        "translation vector": "translation_vector",
+        "rotation matrix": "rotation_matrix",
+        "initial quadric equation": "initial_equation",
+        "middle quadric equation": "middle_equation",
+        "final quadric equation": "final_equation",
+    }
 
     quadric_type: QuadricType
     centered: bool
@@ -238,9 +551,76 @@ class CanonicalizationResult(BaseModel):
     final_matrix: FloatArray
     translation_vector: FloatArray
     rotation_matrix: FloatArray
-    initial_equation: sp.Expr
-    middle_equation: sp.Expr
-    final_equation: sp.Expr
+    _equations: dict[str, sp.Expr] = PrivateAttr(default_factory=dict)
+    _timings: PipelineTimings | None = PrivateAttr(default=None)
+
+    def __init__(
+        self,
+        *,
+        initial_equation: sp.Expr | None = None,
+        middle_equation: sp.Expr | None = None,
+        final_equation: sp.Expr | None = None,
+        **data: Any,
+    ) -> None:
+        super().__init__(**data)
+        for stage, equation in (
+            ("initial", initial_equation),
+            ("middle", middle_equation),
+            ("final", final_equation),
+        ):
+            if equation is not None:
+                self._equations[stage] = equation
+
+    @classmethod
+    def trusted(
+        cls,
+        *,
+        quadric_type: QuadricType,
+        centered: bool,
+        initial_matrix: FloatArray,
+        middle_matrix: FloatArray,
+        final_matrix: FloatArray,
+        translation_vector: FloatArray,
+        rotation_matrix: FloatArray,
+    ) -> CanonicalizationResult:
+        """
+        Wrap pipeline artifacts that are correct by construction.
+
+        The arrays are taken over without copying and marked read-only in
+        place; none of the public-boundary checks run. Use the regular
+        constructor for data that did not come from the canonicalizer.
+
+        Args:
+            quadric_type: QuadricType
+                Mathematical classification of the input equation.
+            centered: bool
+                Whether the quadratic block has full rank.
+            initial_matrix: numpy.ndarray
+                Owned float64 4x4 initial matrix.
+            middle_matrix: numpy.ndarray
+                Owned float64 4x4 matrix after the rotation.
+            final_matrix: numpy.ndarray
+                Owned float64 4x4 canonical matrix.
+            translation_vector: numpy.ndarray
+                Owned float64 translation with three values.
+            rotation_matrix: numpy.ndarray
+                Owned float64 proper 3x3 rotation.
+            return: CanonicalizationResult
+                Immutable result built through ``model_construct``.
+        """
+
+        translation_vector = translation_vector.reshape(3)
+        for array in (initial_matrix, middle_matrix, final_matrix, translation_vector, rotation_matrix):
+            array.setflags(write=False)
+        return cls.model_construct(
+            quadric_type=quadric_type,
+            centered=centered,
+            initial_matrix=initial_matrix,
+            middle_matrix=middle_matrix,
+            final_matrix=final_matrix,
+            translation_vector=translation_vector,
+            rotation_matrix=rotation_matrix,
+        )
 
     @field_validator("initial_matrix", "middle_matrix", "final_matrix", "translation_vector", "rotation_matrix",
                      mode="before")
@@ -307,34 +687,76 @@ class CanonicalizationResult(BaseModel):
                 Initial-to-middle and middle-to-final point transformations.
         """
 
-        translation = AffineTransformation(
-            kind=TransformationKind.TRANSLATION,
-            linear_map=np.eye(3, dtype=np.float64),
-            offset=self.translation_vector,
+        # Both steps are rigid by construction from fields this model owns.
+        translation = AffineTransformation.trusted(
+            TransformationKind.TRANSLATION,
+            np.eye(3, dtype=np.float64),
+            self.translation_vector,
         )
-        rotation = AffineTransformation(
-            kind=TransformationKind.ROTATION,
-            linear_map=self.rotation_matrix,
-            offset=np.zeros(3, dtype=np.float64),
+        rotation = AffineTransformation.trusted(
+            TransformationKind.ROTATION,
+            self.rotation_matrix,
+            np.zeros(3, dtype=np.float64),
         )
         return rotation, translation
 
+    @property
+    def initial_equation(self) -> sp.Expr:
+        """Return the expression of the initial matrix, built on first access."""
+
+        return self._stage_equation("initial", self.initial_matrix)
+
+    @property
+    def middle_equation(self) -> sp.Expr:
+        """Return the expression of the intermediate matrix, built on first access."""
+
+        return self._stage_equation("middle", self.middle_matrix)
+
+    @property
+    def final_equation(self) -> sp.Expr:
+        """Return the expression of the canonical matrix, built on first access."""
+
+        return self._stage_equation("final", self.final_matrix)
+
+    @property
+    def stage_polynomials(self) -> tuple[QuadricPolynomial, QuadricPolynomial, QuadricPolynomial]:
+        """
+        Return the initial, middle, and final polynomials without building SymPy expressions.
+
+        Args:
+            return: tuple[QuadricPolynomial, QuadricPolynomial, QuadricPolynomial]
+                Integer-snapped coefficient polynomials of the three stages.
+        """
+
+        from src.numerical.quadric_polynomial import QuadricPolynomial
+
+        return (
+            QuadricPolynomial.from_matrix(self.initial_matrix),
+            QuadricPolynomial.from_matrix(self.middle_matrix),
+            QuadricPolynomial.from_matrix(self.final_matrix),
+        )
+
+    def _stage_equation(self, stage: str, matrix: FloatArray) -> sp.Expr:
+        """Build and cache one stage expression; numeric-only callers never reach SymPy."""
+
+        equation = self._equations.get(stage)
+        if equation is None:
+            from src.numerical.quadric_polynomial import QuadricPolynomial
+
+            start = perf_counter()
+            equation = QuadricPolynomial.from_matrix(matrix).to_sympy()
+            self._equations[stage] = equation
+            if self._timings is not None:
+                from src.numerical.stage_timings import PipelineStage
+
+                self._timings.record(PipelineStage.EQUATION, self.quadric_type, perf_counter() - start)
+        return equation
+
     def __getitem__(self, key: str) -> object:
         """Support legacy string keys while callers migrate to typed attributes."""
 
-        legacy_fields = {
-            "quadric type": self.quadric_type,
-            "centered quadric": self.centered,
-            "initial quadric matrix": self.initial_matrix,
-            "middle quadric matrix": self.middle_matrix,
-            "final quadric matrix": self.final_matrix,
-            "translation vector": self.translation_vector,
-            "rotation matrix": self.rotation_matrix,
-            "initial quadric equation": self.initial_equation,
-            "middle quadric equation": self.middle_equation,
-            "final quadric equation": self.final_equation,
-        }
         try:
-            return legacy_fields[key]
+            attribute = self._LEGACY_KEYS[key]
         except KeyError as error:
             raise KeyError(key) from error
+        return getattr(self, attribute)
@@ -1,17 +1,23 @@
 """
 Provide focused matrix and symbolic helpers for canonicalization.
 
+SymPy is imported only by the two symbolic helpers, so numeric callers do not
+pay for it.
+
 Run the helper tests with ``python -m pytest tests/test_algebra.py -q``.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
 import numpy.typing as npt
-import sympy as sp
 
 from src.numerical.models import FloatArray
-from src.numerical.symbols import x, y, z
+
+if TYPE_CHECKING:
+    import sympy as sp
 
 
 def relative_tolerance(values: npt.ArrayLike, factor: float) -> float:
@@ -36,6 +42,28 @@ def relative_tolerance(values: npt.ArrayLike, factor: float) -> float:
     return factor * float(np.finfo(np.float64).eps) * effective_scale
 
 
+def batch_relative_tolerance(values: npt.ArrayLike, factor: float) -> FloatArray:
+    """
+    Return :func:`relative_tolerance` independently for every leading-axis row.
+
+    Args:
+        values: numpy.typing.ArrayLike
+            Stacked values with shape ``(N, ...)``; each row defines its own scale.
+        factor: float
+            Positive safety multiplier applied to machine epsilon.
+        return: numpy.ndarray
+            Positive scale-aware tolerances with shape ``(N,)``.
+    """
+
+    if factor <= 0:
+        raise ValueError("relative tolerance factor must be positive")
+    array = np.asarray(values, dtype=np.float64)
+    scale = np.max(np.abs(array), axis=tuple(range(1, array.ndim)))
+    minimum_scale = float(np.finfo(np.float64).tiny)
+    effective_scale = np.where(scale > minimum_scale, scale, minimum_scale)
+    return np.asarray(factor * float(np.finfo(np.float64).eps) * effective_scale, dtype=np.float64)
+
+
 def numerical_rank(matrix: FloatArray, factor: float) -> int:
     """
     Return matrix rank under an explicit scale-relative tolerance.
@@ -142,6 +170,10 @@ def expression_from_matrix(matrix: npt.ArrayLike) -> sp.Expr:
             Expanded expression in x, y, and z.
     """
 
+    import sympy as sp
+
+    from src.numerical.symbols import x, y, z
+
     array = np.asarray(matrix)
     if array.shape != (4, 4):
         raise ValueError("matrix must have shape (4, 4)")
@@ -162,6 +194,8 @@ def normalize_integer_coefficients(expression: sp.Expr, tolerance: float) -> sp.
         Expanded expression with normalized coefficients.
     """
 
+    import sympy as sp
+
     normalized: sp.Expr = sp.Integer(0)
     for term, coefficient in sp.expand(expression).as_coefficients_dict().items():
         new_coefficient: sp.Expr | int = coefficient
@@ -8,10 +8,11 @@ Run the focused checks with
 from __future__ import annotations
 
 import numpy as np
-from scipy import linalg as la
 
+from src.numerical.invariants import QuadricInvariants
 from src.numerical.models import FloatArray
 from src.numerical.numerical_helpers import clean_near_zero, relative_tolerance
+from src.numerical.symmetric_eigen import eigh3
 
 
 ROUNDOFF_FACTOR = 100.0
@@ -38,8 +39,9 @@ def parabolic_cylinder_canonize(
     A_overline: FloatArray,
     A: FloatArray,
     b: FloatArray,
-    eq: str,
+    eq: str | None,
     A_overline_og: FloatArray,
+    invariants: QuadricInvariants | None = None,
 ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
     """
     Build the two canonical stages for a rank-one parabolic cylinder.
@@ -57,11 +59,15 @@ def parabolic_cylinder_canonize(
             Symmetric rank-one quadratic block.
         b: numpy.ndarray
             Three linear half-coefficients.
-        eq: str
+        eq: str | None
             Original equation retained for compatibility; the numerical
-            algorithm does not need to parse it again.
+            algorithm does not need to parse it again. Matrix inputs pass
+            ``None``.
         A_overline_og: numpy.ndarray
             Original 4x4 homogeneous matrix.
+        invariants: QuadricInvariants | None
+            Shared invariants whose eigenpairs belong to ``A``; when omitted
+            the quadratic block is decomposed here.
         return: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
             Final matrix, proper basis, coordinate translation, and
             rotation-only middle matrix.
@@ -71,10 +77,13 @@ def parabolic_cylinder_canonize(
         raise ValueError("parabolic-cylinder homogeneous matrices must have shape (4, 4)")
     if A.shape != (3, 3) or b.size != 3:
         raise ValueError("expected quadratic shape (3, 3) and three linear coefficients")
-    if not eq:
+    if eq is not None and not eq:
         raise ValueError("the original equation must not be empty")
 
-    eigenvalues, eigenvectors = la.eigh(A)
+    if invariants is None:
+        eigenvalues, eigenvectors = eigh3(A)
+    else:
+        eigenvalues, eigenvectors = invariants.quadratic_eigenvalues, invariants.quadratic_eigenvectors
     nonzero_indices = np.flatnonzero(np.abs(eigenvalues) > _roundoff_threshold(A))
     if nonzero_indices.size != 1:
         raise ValueError("a parabolic cylinder must have a rank-one quadratic block")
@@ -85,13 +94,13 @@ def parabolic_cylinder_canonize(
     linear = np.asarray(b, dtype=np.float64).reshape(3)
     quadratic_linear = float(quadratic_direction @ linear)
     null_linear = linear - quadratic_linear * quadratic_direction
-    null_linear_norm = float(la.norm(null_linear))
+    null_linear_norm = float(np.linalg.norm(null_linear))
     if null_linear_norm <= _roundoff_threshold(linear):
         raise ValueError("a parabolic cylinder must have a linear term in the quadratic null space")
 
     parabolic_direction = null_linear / null_linear_norm
     free_direction = np.cross(quadratic_direction, parabolic_direction)
-    free_direction /= la.norm(free_direction)
+    free_direction /= np.linalg.norm(free_direction)
     basis = np.column_stack([quadratic_direction, parabolic_direction, free_direction])
     if np.linalg.det(basis) < 0:
         free_direction *= -1
@@ -0,0 +1,258 @@
+"""
+Canonicalize large equation corpora across worker processes.
+
+Parsing falls back to SymPy, which holds the GIL, so throughput scales with
+processes rather than threads. Every worker owns one
+:class:`QuadricCanonicalizer`, BLAS is pinned to one thread per worker, and
+results come back in input order with per-item failures captured, either as
+a list or streamed with a bounded number of chunks in flight.
+
+Run the parallel checks with ``python -m pytest tests/test_parallel.py -q``.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+
+from src.numerical.canonicalize import QuadricCanonicalizer, _default_canonicalizer
+from src.numerical.models import CanonicalizationResult, FloatArray, QuadricType, ValidationMode
+
+
+BLAS_THREAD_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+DEFAULT_CHUNKSIZE = 256
+# Queued chunks per worker: enough to keep workers busy while bounding memory.
+IN_FLIGHT_CHUNKS_PER_WORKER = 2
+
+_ResultPayload = tuple[int, bool, FloatArray, FloatArray, FloatArray, FloatArray, FloatArray]
+_WORKER_CANONICALIZER: QuadricCanonicalizer | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CanonicalizationFailure:
+    """
+    Describe one equation that could not be canonicalized.
+
+    Args:
+        index: int
+            Position of the equation in the input corpus.
+        equation: str
+            The failing equation text.
+        error_type: str
+            Name of the raised exception class, for example ``NotAQuadricError``.
+        message: str
+            Exception message.
+    return: CanonicalizationFailure
+        Immutable failure record kept in place of the missing result.
+    """
+
+    index: int
+    equation: str
+    error_type: str
+    message: str
+
+
+@contextmanager
+def _pinned_blas_threads() -> Iterator[None]:
+    """Expose one BLAS thread per process to workers spawned inside the block."""
+
+    previous = {name: os.environ.get(name) for name in BLAS_THREAD_VARIABLES}
+    os.environ.update({name: "1" for name in BLAS_THREAD_VARIABLES})
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _worker_canonicalizer(validation: ValidationMode) -> QuadricCanonicalizer:
+    canonicalizer = _default_canonicalizer()
+    return QuadricCanonicalizer(canonicalizer.parser, canonicalizer.classifier, validation)
+
+
+def _initialize_worker(validation: ValidationMode) -> None:
+    """Create the canonicalizer owned by one worker process."""
+
+    global _WORKER_CANONICALIZER
+    _WORKER_CANONICALIZER = _worker_canonicalizer(validation)
+
+
+def _canonize_chunk(chunk: tuple[int, Sequence[str]]) -> list[_ResultPayload | CanonicalizationFailure]:
+    """Canonicalize one chunk with the worker-owned canonicalizer."""
+
+    if _WORKER_CANONICALIZER is None:
+        raise RuntimeError("worker process was not initialized")
+    return _canonize_equations(_WORKER_CANONICALIZER, chunk)
+
+
+def _canonize_equations(
+    canonicalizer: QuadricCanonicalizer,
+    chunk: tuple[int, Sequence[str]],
+) -> list[_ResultPayload | CanonicalizationFailure]:
+    """Canonicalize one chunk and return compact picklable payloads."""
+
+    start, equations = chunk
+    outcomes: list[_ResultPayload | CanonicalizationFailure] = []
+    for offset, equation in enumerate(equations):
+        try:
+            result = canonicalizer.canonize(equation)
+        # The SymPy fallback surfaces tokenizer, syntax, type, and attribute errors.
+        except Exception as error:
+            outcomes.append(CanonicalizationFailure(start + offset, equation, type(error).__name__, str(error)))
+            continue
+        outcomes.append(
+            (
+                int(result.quadric_type),
+                result.centered,
+                result.initial_matrix,
+                result.middle_matrix,
+                result.final_matrix,
+                result.translation_vector,
+                result.rotation_matrix,
+            )
+        )
+    return outcomes
+
+
+def _chunks(equations: Iterable[str], chunksize: int) -> Iterator[tuple[int, list[str]]]:
+    iterator = iter(equations)
+    start = 0
+    while chunk := list(islice(iterator, chunksize)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def _result_from_payload(payload: _ResultPayload) -> CanonicalizationResult:
+    """Rebuild a result that the worker already produced and validated."""
+
+    quadric_type, centered, initial, middle, final, translation, rotation = payload
+    return CanonicalizationResult.trusted(
+        quadric_type=QuadricType(quadric_type),
+        centered=centered,
+        initial_matrix=initial,
+        middle_matrix=middle,
+        final_matrix=final,
+        translation_vector=translation,
+        rotation_matrix=rotation,
+    )
+
+
+def iter_canonize_parallel(
+    equations: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    validation: ValidationMode = ValidationMode.FULL,
+) -> Iterator[CanonicalizationResult | CanonicalizationFailure]:
+    """
+    Stream canonicalizations of many equations in input order.
+
+    Equations are read lazily and at most ``IN_FLIGHT_CHUNKS_PER_WORKER``
+    chunks per worker are queued, so unbounded inputs such as stdin run in
+    constant memory and results appear while later chunks are still pending.
+
+    Args:
+        equations: collections.abc.Iterable[str]
+            Degree-two equations in x, y, and z.
+        workers: int | None
+            Number of worker processes; defaults to the CPU count. One worker
+            runs in the calling process without a pool.
+        chunksize: int
+            Number of equations sent to a worker per task.
+        validation: ValidationMode
+            Result validation performed inside the workers.
+        return: collections.abc.Iterator[CanonicalizationResult | CanonicalizationFailure]
+            One entry per equation in input order.
+    """
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least one")
+    worker_count = (os.cpu_count() or 1) if workers is None else workers
+    if worker_count < 1:
+        raise ValueError("workers must be at least one")
+    return _iter_outcomes(equations, worker_count, chunksize, validation)
+
+
+def _iter_outcomes(
+    equations: Iterable[str],
+    worker_count: int,
+    chunksize: int,
+    validation: ValidationMode,
+) -> Iterator[CanonicalizationResult | CanonicalizationFailure]:
+    """Yield validated outcomes chunk by chunk; arguments are already checked."""
+
+    chunks = _chunks(equations, chunksize)
+    if worker_count == 1:
+        canonicalizer = _worker_canonicalizer(validation)
+        for chunk in chunks:
+            yield from _outcomes(_canonize_equations(canonicalizer, chunk))
+        return
+    with _pinned_blas_threads(), ProcessPoolExecutor(
+        max_workers=worker_count,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker,
+        initargs=(validation,),
+    ) as executor:
+        pending: deque[Future[list[_ResultPayload | CanonicalizationFailure]]] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_canonize_chunk, chunk))
+            if len(pending) >= IN_FLIGHT_CHUNKS_PER_WORKER * worker_count:
+                yield from _outcomes(pending.popleft().result())
+        while pending:
+            yield from _outcomes(pending.popleft().result())
+
+
+def _outcomes(
+    payloads: list[_ResultPayload | CanonicalizationFailure],
+) -> Iterator[CanonicalizationResult | CanonicalizationFailure]:
+    """Turn worker payloads back into results, keeping failure records."""
+
+    for outcome in payloads:
+        yield outcome if isinstance(outcome, CanonicalizationFailure) else _result_from_payload(outcome)
+
+
+def canonize_parallel(
+    equations: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    validation: ValidationMode = ValidationMode.FULL,
+) -> list[CanonicalizationResult | CanonicalizationFailure]:
+    """
+    Canonicalize many equations in worker processes, preserving input order.
+
+    Failures such as :class:`NotAQuadricError` or parser ``ValueError`` are
+    returned as :class:`CanonicalizationFailure` records at their position
+    instead of aborting the run.
+
+    Args:
+        equations: collections.abc.Iterable[str]
+            Degree-two equations in x, y, and z.
+        workers: int | None
+            Number of worker processes; defaults to the CPU count. One worker
+            runs in the calling process without a pool.
+        chunksize: int
+            Number of equations sent to a worker per task.
+        validation: ValidationMode
+            Result validation performed inside the workers.
+        return: list[CanonicalizationResult | CanonicalizationFailure]
+            One entry per equation in input order.
+    """
+
+    return list(iter_canonize_parallel(equations, workers, chunksize, validation))
+
+
+__all__ = ["BLAS_THREAD_VARIABLES", "CanonicalizationFailure", "canonize_parallel", "iter_canonize_parallel"]
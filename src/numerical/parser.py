@@ -1,29 +1,33 @@
 """
 Parse quadric equations and construct their matrix representation.
 
+Equations inside the documented grammar never touch SymPy; it is imported by
+:meth:`QuadricParser.parse` the first time an equation needs the fallback.
+
 Run the parser tests with ``python -m pytest tests/test_parser.py -q``.
 """
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Iterable
 
 import numpy as np
-import sympy as sp
-from sympy.parsing.sympy_parser import implicit_multiplication_application, parse_expr, standard_transformations
 
-from src.numerical.models import QuadricMatrices
-from src.numerical.symbols import x, y, z
+from src.numerical.models import FloatArray, QuadricMatrices, QuadricMatrixBatch
+from src.numerical.polynomial_parser import COEFFICIENT_MONOMIALS, UnsupportedEquationError, polynomial_coefficients
+
+if TYPE_CHECKING:
+    import sympy as sp
 
 
 class QuadricParser:
     """Parse external equation strings into validated numerical matrix bundles."""
 
-    _transformations: tuple[Any, ...]
-    _local_symbols: dict[str, sp.Symbol]
-
-    _transformations = standard_transformations + (implicit_multiplication_application,)
-    _local_symbols = {"x": x, "y": y, "z": z}
+    def _split(self, equation: str) -> tuple[str, str]:
+        parts = equation.split("=")
+        if len(parts) != 2:
+            raise ValueError("equation must contain exactly one '=' sign")
+        return parts[0], parts[1]
 
     def parse(self, equation: str) -> sp.Poly:
         """
@@ -36,11 +40,16 @@ class QuadricParser:
                 Expanded polynomial after moving the right side to the left.
         """
 
-        parts = equation.split("=")
-        if len(parts) != 2:
-            raise ValueError("equation must contain exactly one '=' sign")
-        left = parse_expr(parts[0].strip(), local_dict=self._local_symbols, transformations=self._transformations)
-        right = parse_expr(parts[1].strip(), local_dict=self._local_symbols, transformations=self._transformations)
+        import sympy as sp
+        from sympy.parsing.sympy_parser import implicit_multiplication_application, parse_expr, standard_transformations
+
+        from src.numerical.symbols import x, y, z
+
+        left_text, right_text = self._split(equation)
+        local_symbols = {"x": x, "y": y, "z": z}
+        transformations = standard_transformations + (implicit_multiplication_application,)
+        left = parse_expr(left_text.strip(), local_dict=local_symbols, transformations=transformations)
+        right = parse_expr(right_text.strip(), local_dict=local_symbols, transformations=transformations)
         polynomial = sp.Poly(sp.expand(left - right), x, y, z)
         if not polynomial.free_symbols.issubset({x, y, z}):
             raise ValueError("equation may only contain variables x, y, and z")
@@ -48,6 +57,22 @@ class QuadricParser:
             raise ValueError("equation must be a polynomial of total degree two")
         return polynomial
 
+    def coefficients_from_polynomial(self, polynomial: sp.Poly) -> FloatArray:
+        """
+        Extract the ten float coefficients of a degree-two polynomial.
+
+        Args:
+            polynomial: sympy.Poly
+                Degree-two polynomial in x, y, and z.
+            return: numpy.ndarray
+                Coefficients in :data:`COEFFICIENT_MONOMIALS` order.
+        """
+
+        return np.array(
+            [float(polynomial.coeff_monomial(monomial)) for monomial in COEFFICIENT_MONOMIALS],
+            dtype=np.float64,
+        )
+
     def matrices_from_polynomial(self, polynomial: sp.Poly) -> QuadricMatrices:
         """
         Build homogeneous, quadratic, and linear matrices from a polynomial.
@@ -59,24 +84,28 @@ class QuadricParser:
                 Float matrices using half-coefficients for mixed and linear terms.
         """
 
-        coefficient = lambda monomial: float(polynomial.coeff_monomial(monomial))
-        quadratic = np.array(
-            [
-                [coefficient(x**2), coefficient(x * y) / 2, coefficient(x * z) / 2],
-                [coefficient(x * y) / 2, coefficient(y**2), coefficient(y * z) / 2],
-                [coefficient(x * z) / 2, coefficient(y * z) / 2, coefficient(z**2)],
-            ],
-            dtype=np.float64,
-        )
-        linear = np.array(
-            [[coefficient(x) / 2], [coefficient(y) / 2], [coefficient(z) / 2]], dtype=np.float64
-        )
-        homogeneous = np.zeros((4, 4), dtype=np.float64)
-        homogeneous[:3, :3] = quadratic
-        homogeneous[:3, 3:] = linear
-        homogeneous[3:, :3] = linear.T
-        homogeneous[3, 3] = coefficient(1)
-        return QuadricMatrices(homogeneous=homogeneous, quadratic=quadratic, linear=linear)
+        return QuadricMatrices.from_coefficients(self.coefficients_from_polynomial(polynomial))
+
+    def coefficients(self, equation: str) -> FloatArray:
+        """
+        Parse an equation into its ten float polynomial coefficients.
+
+        Equations inside the documented grammar are evaluated by the
+        hand-written parser in :mod:`src.numerical.polynomial_parser`; any
+        other input falls back to the SymPy path of :meth:`parse`.
+
+        Args:
+            equation: str
+                Degree-two equation accepted by :meth:`parse`.
+            return: numpy.ndarray
+                Coefficients in :data:`COEFFICIENT_MONOMIALS` order.
+        """
+
+        left_text, right_text = self._split(equation)
+        try:
+            return np.array(polynomial_coefficients(left_text, right_text), dtype=np.float64)
+        except UnsupportedEquationError:
+            return self.coefficients_from_polynomial(self.parse(equation))
 
     def parse_matrices(self, equation: str) -> QuadricMatrices:
         """
@@ -89,4 +118,29 @@ class QuadricParser:
                 Validated matrices for the equation.
         """
 
-        return self.matrices_from_polynomial(self.parse(equation))
+        return QuadricMatrices.from_coefficients(self.coefficients(equation))
+
+    def parse_many(self, equations: Iterable[str]) -> QuadricMatrixBatch:
+        """
+        Parse many equations into contiguous stacked matrices.
+
+        A row that fails to parse does not abort the batch: its matrices are
+        zero, ``error_mask`` is set, and ``errors`` holds the message.
+
+        Args:
+            equations: Iterable[str]
+                Degree-two equations accepted by :meth:`parse`.
+            return: QuadricMatrixBatch
+                Stacked ``(N, 4, 4)``, ``(N, 3, 3)``, and ``(N, 3, 1)`` matrices.
+        """
+
+        rows = list(equations)
+        coefficients = np.zeros((len(rows), len(COEFFICIENT_MONOMIALS)), dtype=np.float64)
+        errors: list[str | None] = [None] * len(rows)
+        for index, equation in enumerate(rows):
+            try:
+                coefficients[index] = self.coefficients(equation)
+            # The SymPy fallback surfaces tokenizer, syntax, type, and attribute errors.
+            except Exception as error:
+                errors[index] = f"{type(error).__name__}: {error}"
+        return QuadricMatrixBatch.from_coefficients(coefficients, tuple(errors))
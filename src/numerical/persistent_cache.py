@@ -0,0 +1,317 @@
+"""
+Persist canonicalization results across processes and runs with SQLite.
+
+The cache is opt-in: pass a :class:`PersistentCanonicalizationCache` as the
+``cache`` of a :class:`QuadricCanonicalizer`. Entries hold the type, center
+flag, stage matrices, rotation, and translation of one result as packed
+float64 bytes, keyed by a SHA-256 hash of the normalized input. Matrix rows
+also store the scale-normalized matrix, and a lookup is a hit only when it is
+identical to the requested one. The database runs in WAL mode so concurrent
+readers and writers are safe, evicts the least recently used rows beyond
+``max_entries``, and discards every entry when the schema or the numerical
+tolerances in its version stamp change.
+
+Run the persistence tests with ``python -m pytest tests/test_persistent_cache.py -q``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+
+import numpy as np
+
+from src.numerical.cache import (
+    DEFAULT_QUANTUM,
+    CacheStatistics,
+    normalize_equation_text,
+    rescaled_result,
+    scale_normalized_key,
+)
+from src.numerical.canonicalize import NUMERICAL_TOLERANCE, ROUNDOFF_FACTOR
+from src.numerical.models import CanonicalizationResult, FloatArray, QuadricType
+
+
+SCHEMA_VERSION = 2
+DEFAULT_MAX_ENTRIES = 100_000
+_PAYLOAD_VALUES = 3 * 16 + 3 + 9
+_BUSY_TIMEOUT_SECONDS = 30.0
+_METADATA_SCHEMA = "CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+_RESULTS_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS results (
+        key BLOB PRIMARY KEY,
+        quadric_type INTEGER NOT NULL,
+        centered INTEGER NOT NULL,
+        scale REAL NOT NULL,
+        normalized BLOB,
+        payload BLOB NOT NULL,
+        last_used INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)",
+)
+
+
+def version_stamp() -> str:
+    """Return the stamp that invalidates stored entries when numerics change."""
+
+    return f"schema={SCHEMA_VERSION};roundoff={ROUNDOFF_FACTOR!r};tolerance={NUMERICAL_TOLERANCE!r}"
+
+
+def _encode(result: CanonicalizationResult) -> bytes:
+    return np.concatenate(
+        [
+            result.initial_matrix.ravel(),
+            result.middle_matrix.ravel(),
+            result.final_matrix.ravel(),
+            result.translation_vector.ravel(),
+            result.rotation_matrix.ravel(),
+        ]
+    ).astype("<f8").tobytes()
+
+
+def _decode(quadric_type: int, centered: int, payload: bytes) -> CanonicalizationResult:
+    values = np.frombuffer(payload, dtype="<f8").astype(np.float64)
+    if values.size != _PAYLOAD_VALUES:
+        raise ValueError("stored canonicalization payload has an unexpected size")
+    return CanonicalizationResult.trusted(
+        quadric_type=QuadricType(quadric_type),
+        centered=bool(centered),
+        initial_matrix=values[0:16].reshape(4, 4),
+        middle_matrix=values[16:32].reshape(4, 4),
+        final_matrix=values[32:48].reshape(4, 4),
+        translation_vector=values[48:51].copy(),
+        rotation_matrix=values[51:60].reshape(3, 3),
+    )
+
+
+def _same_normalized(stored: bytes | None, normalized: FloatArray) -> bool:
+    return stored is not None and bool(np.array_equal(np.frombuffer(stored, dtype="<f8").reshape(4, 4), normalized))
+
+
+class PersistentCanonicalizationCache:
+    """
+    Store canonicalization results in a SQLite database shared by processes.
+
+    Args:
+        path: str | os.PathLike[str]
+            Database file; it is created on first use.
+        max_entries: int
+            Number of rows kept before the least recently used are evicted.
+        quantum: float
+            Grid spacing of the scale-normalized matrix keys.
+    """
+
+    path: Path
+    max_entries: int
+    quantum: float
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        quantum: float = DEFAULT_QUANTUM,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("cache max_entries must be at least one")
+        if not 0.0 < quantum < 1.0:
+            raise ValueError("cache quantum must lie in (0, 1)")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.quantum = quantum
+        self._lock = Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._owner_pid = -1
+        self._entries = 0
+        self._hits = 0
+        self._scaled_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this process's connection, opening and stamping the database when needed."""
+
+        if self._connection is not None and self._owner_pid == os.getpid():
+            return self._connection
+        connection = sqlite3.connect(
+            self.path,
+            timeout=_BUSY_TIMEOUT_SECONDS,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(_METADATA_SCHEMA)
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute("SELECT value FROM metadata WHERE name = 'version'").fetchone()
+            if row is None or row[0] != version_stamp():
+                # Older schemas may lack columns, so the table is rebuilt rather than emptied.
+                connection.execute("DROP TABLE IF EXISTS results")
+            for statement in _RESULTS_SCHEMA:
+                connection.execute(statement)
+            if row is None or row[0] != version_stamp():
+                connection.execute(
+                    "INSERT OR REPLACE INTO metadata (name, value) VALUES ('version', ?)",
+                    (version_stamp(),),
+                )
+        self._entries = int(connection.execute("SELECT COUNT(*) FROM results").fetchone()[0])
+        self._connection = connection
+        self._owner_pid = os.getpid()
+        return connection
+
+    def close(self) -> None:
+        """Close this process's connection; the cache reconnects on next use."""
+
+        with self._lock:
+            if self._connection is not None and self._owner_pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> PersistentCanonicalizationCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """Return this instance's counters and the current number of stored rows."""
+
+        with self._lock:
+            size = int(self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0])
+            return CacheStatistics(
+                hits=self._hits,
+                scaled_hits=self._scaled_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=size,
+            )
+
+    def clear(self) -> None:
+        """Delete every stored row and reset this instance's counters."""
+
+        with self._lock:
+            self._connect().execute("DELETE FROM results")
+            self._entries = 0
+            self._hits = self._scaled_hits = self._misses = self._evictions = 0
+
+    def _lookup(self, key: bytes, normalized: FloatArray | None) -> tuple[CanonicalizationResult, float] | None:
+        """Fetch one row, refresh its recency, and count the outcome like the in-memory cache."""
+
+        matrix_level = normalized is not None
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT quadric_type, centered, scale, normalized, payload FROM results WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or (normalized is not None and not _same_normalized(row[3], normalized)):
+                self._misses += matrix_level
+                return None
+            connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time_ns(), key))
+            if matrix_level:
+                self._scaled_hits += 1
+            else:
+                self._hits += 1
+        quadric_type, centered, scale, _, payload = row
+        return _decode(quadric_type, centered, payload), float(scale)
+
+    def _store(
+        self, key: bytes, result: CanonicalizationResult, scale: float, normalized: FloatArray | None
+    ) -> None:
+        payload = _encode(result)
+        stored_normalized = None if normalized is None else normalized.astype("<f8").tobytes()
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                inserted = connection.execute(
+                    "INSERT OR REPLACE INTO results "
+                    "(key, quadric_type, centered, scale, normalized, payload, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        int(result.quadric_type),
+                        int(result.centered),
+                        scale,
+                        stored_normalized,
+                        payload,
+                        time.time_ns(),
+                    ),
+                ).rowcount
+                self._entries += inserted
+                if self._entries > self.max_entries:
+                    self._entries = int(connection.execute("SELECT COUNT(*) FROM results").fetchone()[0])
+                    excess = self._entries - self.max_entries
+                    if excess > 0:
+                        connection.execute(
+                            "DELETE FROM results WHERE key IN "
+                            "(SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                            (excess,),
+                        )
+                        self._evictions += excess
+                        self._entries -= excess
+
+    @staticmethod
+    def _hash(level: bytes, key: bytes) -> bytes:
+        return hashlib.sha256(level + b"\0" + key).digest()
+
+    def get_text(self, eq: str) -> CanonicalizationResult | None:
+        """
+        Return the stored result of an equation text, if any.
+
+        Args:
+            eq: str
+                Equation whose whitespace-normalized text is hashed.
+            return: CanonicalizationResult | None
+                Stored result, or ``None`` on a miss.
+        """
+
+        entry = self._lookup(self._hash(b"text", normalize_equation_text(eq).encode()), normalized=None)
+        return None if entry is None else entry[0]
+
+    def put_text(self, eq: str, result: CanonicalizationResult) -> None:
+        """Store a result under the hash of its normalized equation text."""
+
+        self._store(self._hash(b"text", normalize_equation_text(eq).encode()), result, 1.0, None)
+
+    def get_matrix(self, homogeneous: FloatArray) -> CanonicalizationResult | None:
+        """
+        Return a stored result for a positive multiple of ``homogeneous``.
+
+        Args:
+            homogeneous: numpy.ndarray
+                Symmetric 4x4 matrix of the requested quadric.
+            return: CanonicalizationResult | None
+                Stored result rescaled to the requested matrix, or ``None``
+                unless the stored normalized matrix is identical.
+        """
+
+        key, scale, normalized = scale_normalized_key(homogeneous, self.quantum)
+        entry = self._lookup(self._hash(b"matrix", key), normalized)
+        if entry is None:
+            return None
+        result, cached_scale = entry
+        return rescaled_result(result, cached_scale, homogeneous, scale)
+
+    def put_matrix(self, homogeneous: FloatArray, result: CanonicalizationResult) -> None:
+        """Store a result and its normalized matrix under the hash of the matrix key."""
+
+        key, scale, normalized = scale_normalized_key(homogeneous, self.quantum)
+        self._store(self._hash(b"matrix", key), result, scale, normalized)
+
+
+__all__ = ["DEFAULT_MAX_ENTRIES", "PersistentCanonicalizationCache", "version_stamp"]
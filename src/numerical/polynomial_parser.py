@@ -0,0 +1,266 @@
+"""
+Parse degree-two equations into coefficients without building SymPy objects.
+
+The recursive-descent parser accepts the documented equation grammar: the
+variables x, y, and z, rational and decimal literals, implicit
+multiplication, integer powers, parentheses, and one ``=`` sign. Inputs
+outside that grammar are reported as unsupported so that
+:class:`src.numerical.parser.QuadricParser` can fall back to SymPy.
+
+Run the parser tests with ``python -m pytest tests/test_parser.py -q``.
+"""
+
+from __future__ import annotations
+
+import re
+from fractions import Fraction
+
+Monomial = tuple[int, int, int]
+Coefficient = int | Fraction
+Polynomial = dict[Monomial, Coefficient]
+
+MAXIMUM_DEGREE = 2
+MAXIMUM_CONSTANT_EXPONENT = 64
+COEFFICIENT_MONOMIALS: tuple[Monomial, ...] = (
+    (2, 0, 0),
+    (0, 2, 0),
+    (0, 0, 2),
+    (1, 1, 0),
+    (1, 0, 1),
+    (0, 1, 1),
+    (1, 0, 0),
+    (0, 1, 0),
+    (0, 0, 1),
+    (0, 0, 0),
+)
+_VARIABLE_MONOMIALS: dict[str, Monomial] = {"x": (1, 0, 0), "y": (0, 1, 0), "z": (0, 0, 1)}
+_CONSTANT: Monomial = (0, 0, 0)
+_TOKEN_PATTERN = re.compile(
+    r"\s*(?:"
+    r"(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_]\w*)"
+    r"|(?P<operator>\*\*|[-+*/()])"
+    r")"
+)
+
+
+class UnsupportedEquationError(Exception):
+    """Signal that an equation lies outside the fast grammar and needs SymPy."""
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    """Split one equation side into typed tokens, expanding ``xy`` into ``x``, ``y``."""
+
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    stripped_length = len(text.rstrip())
+    while position < stripped_length:
+        match = _TOKEN_PATTERN.match(text, position)
+        if match is None:
+            raise UnsupportedEquationError(f"unsupported character at position {position}")
+        kind = match.lastgroup
+        value = match.group(kind) if kind is not None else ""
+        if kind == "name":
+            if any(character not in _VARIABLE_MONOMIALS for character in value):
+                raise UnsupportedEquationError(f"unsupported name {value!r}")
+            if match.end() < len(text) and text[match.end()] == "(":
+                raise UnsupportedEquationError("function-call syntax requires SymPy")
+            tokens.extend(("name", character) for character in value)
+        elif kind is not None:
+            tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+def _add(left: Polynomial, right: Polynomial, sign: int) -> Polynomial:
+    result = dict(left)
+    for monomial, coefficient in right.items():
+        result[monomial] = result.get(monomial, 0) + sign * coefficient
+    return result
+
+
+def _multiply(left: Polynomial, right: Polynomial) -> Polynomial:
+    result: Polynomial = {}
+    for left_monomial, left_coefficient in left.items():
+        for right_monomial, right_coefficient in right.items():
+            monomial = (
+                left_monomial[0] + right_monomial[0],
+                left_monomial[1] + right_monomial[1],
+                left_monomial[2] + right_monomial[2],
+            )
+            if sum(monomial) > MAXIMUM_DEGREE:
+                raise UnsupportedEquationError("intermediate degree above two requires SymPy")
+            result[monomial] = result.get(monomial, 0) + left_coefficient * right_coefficient
+    return result
+
+
+def _constant_value(polynomial: Polynomial) -> Coefficient | None:
+    """Return the value of a constant polynomial, or ``None`` when it has variables."""
+
+    if any(monomial != _CONSTANT and coefficient != 0 for monomial, coefficient in polynomial.items()):
+        return None
+    return polynomial.get(_CONSTANT, 0)
+
+
+class _RecursiveDescent:
+    """
+    Evaluate one token stream with Python operator precedence.
+
+    Grammar::
+
+        expression := term (("+" | "-") term)*
+        term       := unary (("*" | "/" | <implicit>) unary)*
+        unary      := ("+" | "-") unary | power
+        power      := primary ("**" unary)?
+        primary    := number | variable | "(" expression ")"
+    """
+
+    tokens: list[tuple[str, str]]
+    position: int
+
+    def __init__(self, tokens: list[tuple[str, str]]) -> None:
+        self.tokens = tokens
+        self.position = 0
+
+    def parse(self) -> Polynomial:
+        if not self.tokens:
+            raise UnsupportedEquationError("empty equation side")
+        polynomial = self._expression()
+        if self.position != len(self.tokens):
+            raise UnsupportedEquationError(f"unexpected token {self.tokens[self.position][1]!r}")
+        return polynomial
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _accept(self, value: str) -> bool:
+        token = self._peek()
+        if token is not None and token[0] == "operator" and token[1] == value:
+            self.position += 1
+            return True
+        return False
+
+    def _expression(self) -> Polynomial:
+        polynomial = self._term()
+        while True:
+            if self._accept("+"):
+                polynomial = _add(polynomial, self._term(), 1)
+            elif self._accept("-"):
+                polynomial = _add(polynomial, self._term(), -1)
+            else:
+                return polynomial
+
+    def _term(self) -> Polynomial:
+        polynomial = self._unary()
+        while True:
+            if self._accept("*"):
+                polynomial = _multiply(polynomial, self._unary())
+            elif self._accept("/"):
+                divisor = _constant_value(self._unary())
+                if divisor is None or divisor == 0:
+                    raise UnsupportedEquationError("division requires a non-zero constant divisor")
+                polynomial = {
+                    monomial: Fraction(coefficient) / divisor for monomial, coefficient in polynomial.items()
+                }
+            elif self._starts_implicit_factor():
+                polynomial = _multiply(polynomial, self._power())
+            else:
+                return polynomial
+
+    def _starts_implicit_factor(self) -> bool:
+        token = self._peek()
+        return token is not None and (token[0] in ("number", "name") or token[1] == "(")
+
+    def _unary(self) -> Polynomial:
+        if self._accept("-"):
+            return {monomial: -coefficient for monomial, coefficient in self._unary().items()}
+        if self._accept("+"):
+            return self._unary()
+        return self._power()
+
+    def _power(self) -> Polynomial:
+        base = self._primary()
+        if not self._accept("**"):
+            return base
+        exponent = _constant_value(self._unary())
+        if exponent is None:
+            raise UnsupportedEquationError("exponents must be constants")
+        exact_exponent = Fraction(exponent)
+        if exact_exponent.denominator != 1 or abs(exact_exponent.numerator) > MAXIMUM_CONSTANT_EXPONENT:
+            raise UnsupportedEquationError("exponents must be small integer constants")
+        power = exact_exponent.numerator
+        constant = _constant_value(base)
+        if constant is not None:
+            if constant == 0 and power < 0:
+                raise UnsupportedEquationError("zero cannot be raised to a negative power")
+            return {_CONSTANT: Fraction(constant) ** power}
+        if power < 0:
+            raise UnsupportedEquationError("negative powers of variables are not polynomial")
+        result: Polynomial = {_CONSTANT: 1}
+        for _ in range(power):
+            result = _multiply(result, base)
+        return result
+
+    def _primary(self) -> Polynomial:
+        token = self._peek()
+        if token is None:
+            raise UnsupportedEquationError("unexpected end of equation")
+        kind, value = token
+        if kind == "number":
+            self.position += 1
+            return {_CONSTANT: int(value) if value.isdigit() else Fraction(value)}
+        if kind == "name":
+            self.position += 1
+            return {_VARIABLE_MONOMIALS[value]: 1}
+        if self._accept("("):
+            polynomial = self._expression()
+            if not self._accept(")"):
+                raise UnsupportedEquationError("unbalanced parentheses")
+            return polynomial
+        raise UnsupportedEquationError(f"unexpected token {value!r}")
+
+
+def parse_side(text: str) -> Polynomial:
+    """
+    Parse one side of an equation into exact monomial coefficients.
+
+    Args:
+        text: str
+            Expression in x, y, and z without an ``=`` sign.
+        return: dict[tuple[int, int, int], int | fractions.Fraction]
+            Exact coefficients keyed by x, y, and z exponents.
+    """
+
+    return _RecursiveDescent(_tokenize(text)).parse()
+
+
+def polynomial_coefficients(left: str, right: str) -> tuple[float, ...]:
+    """
+    Return the ten float coefficients of ``left - right``.
+
+    Args:
+        left: str
+            Left side of the equation.
+        right: str
+            Right side of the equation.
+        return: tuple[float, ...]
+            Coefficients ordered as :data:`COEFFICIENT_MONOMIALS`.
+    """
+
+    difference = _add(parse_side(left), parse_side(right), -1)
+    degrees = [sum(monomial) for monomial, coefficient in difference.items() if coefficient != 0]
+    if not degrees or max(degrees) != 2:
+        raise ValueError("equation must be a polynomial of total degree two")
+    try:
+        return tuple(float(difference.get(monomial, 0)) for monomial in COEFFICIENT_MONOMIALS)
+    except OverflowError as error:
+        # SymPy turns such literals into infinities that validation rejects.
+        raise UnsupportedEquationError("coefficient out of float range") from error
+
+
+__all__ = [
+    "COEFFICIENT_MONOMIALS",
+    "UnsupportedEquationError",
+    "parse_side",
+    "polynomial_coefficients",
+]
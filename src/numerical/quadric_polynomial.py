@@ -0,0 +1,205 @@
+"""
+Build and format quadric polynomials directly from their ten coefficients.
+
+A homogeneous matrix determines its polynomial through ten entries, so the
+coefficients are read off the matrix, snapped to integers on the float array,
+and formatted as text or LaTeX without creating a SymPy expression. SymPy is
+imported only by :meth:`QuadricPolynomial.to_sympy`.
+
+Run the formatter tests with ``python -m pytest tests/test_algebra.py -q``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from src.numerical.models import FloatArray
+from src.numerical.polynomial_parser import COEFFICIENT_MONOMIALS
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+
+INTEGER_SNAP_TOLERANCE = 100.0 * float(np.finfo(np.float64).eps)
+_TEXT_MONOMIALS = ("x**2", "y**2", "z**2", "x*y", "x*z", "y*z", "x", "y", "z", "")
+_LATEX_MONOMIALS = ("x^{2}", "y^{2}", "z^{2}", "x y", "x z", "y z", "x", "y", "z", "")
+
+
+def coefficients_from_homogeneous(matrices: npt.ArrayLike) -> FloatArray:
+    """
+    Read the ten polynomial coefficients off homogeneous matrices.
+
+    Mixed and linear coefficients add both symmetric entries, exactly as the
+    expanded product ``[x, y, z, 1] @ M @ [x, y, z, 1]`` does.
+
+    Args:
+        matrices: numpy.typing.ArrayLike
+            Homogeneous matrices with shape ``(..., 4, 4)``.
+        return: numpy.ndarray
+            Coefficients with shape ``(..., 10)`` in
+            :data:`src.numerical.polynomial_parser.COEFFICIENT_MONOMIALS` order.
+    """
+
+    array = np.asarray(matrices, dtype=np.float64)
+    if array.shape[-2:] != (4, 4):
+        raise ValueError("homogeneous matrices must have trailing shape (4, 4)")
+    return np.stack(
+        [
+            array[..., 0, 0],
+            array[..., 1, 1],
+            array[..., 2, 2],
+            array[..., 0, 1] + array[..., 1, 0],
+            array[..., 0, 2] + array[..., 2, 0],
+            array[..., 1, 2] + array[..., 2, 1],
+            array[..., 0, 3] + array[..., 3, 0],
+            array[..., 1, 3] + array[..., 3, 1],
+            array[..., 2, 3] + array[..., 3, 2],
+            array[..., 3, 3],
+        ],
+        axis=-1,
+    )
+
+
+def snap_integer_coefficients(coefficients: npt.ArrayLike, tolerance: float) -> FloatArray:
+    """
+    Replace coefficients closer than ``tolerance`` to an integer by that integer.
+
+    Args:
+        coefficients: numpy.typing.ArrayLike
+            Float coefficients of any shape.
+        tolerance: float
+            Strict absolute distance from an integer accepted for snapping.
+        return: numpy.ndarray
+            Snapped float copy with the same shape.
+    """
+
+    values = np.asarray(coefficients, dtype=np.float64)
+    nearest = np.round(values)
+    return np.where(np.abs(values - nearest) < tolerance, nearest, values)
+
+
+def _format_number(value: float, decimals: int | None) -> str:
+    """Format one coefficient magnitude without trailing zeros."""
+
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    if decimals is None:
+        return repr(value)
+    return f"{value:.{decimals}f}".rstrip("0").rstrip(".")
+
+
+@dataclass(frozen=True, slots=True)
+class QuadricPolynomial:
+    """
+    Store one quadric polynomial as ten float coefficients.
+
+    Args:
+        coefficients: numpy.ndarray
+            Coefficients of x**2, y**2, z**2, x*y, x*z, y*z, x, y, z, and the
+            constant term, in that order.
+    return: QuadricPolynomial
+        Immutable polynomial that formats without SymPy.
+    """
+
+    coefficients: FloatArray
+
+    def __post_init__(self) -> None:
+        if self.coefficients.shape != (10,):
+            raise ValueError("a quadric polynomial has exactly ten coefficients")
+
+    @classmethod
+    def from_matrix(cls, matrix: npt.ArrayLike, tolerance: float = INTEGER_SNAP_TOLERANCE) -> QuadricPolynomial:
+        """
+        Build the polynomial of one homogeneous matrix with integer snapping.
+
+        Args:
+            matrix: numpy.typing.ArrayLike
+                Symmetric 4x4 homogeneous matrix.
+            tolerance: float
+                Absolute distance below which coefficients snap to integers.
+            return: QuadricPolynomial
+                Polynomial whose zero level set is the quadric.
+        """
+
+        array = np.asarray(matrix, dtype=np.float64)
+        if array.shape != (4, 4):
+            raise ValueError("matrix must have shape (4, 4)")
+        coefficients = snap_integer_coefficients(coefficients_from_homogeneous(array), tolerance)
+        coefficients.setflags(write=False)
+        return cls(coefficients)
+
+    def _terms(self, monomials: tuple[str, ...], separator: str, decimals: int | None) -> str:
+        values = self.coefficients if decimals is None else np.round(self.coefficients, decimals)
+        pieces: list[str] = []
+        for monomial, value in zip(monomials, values.tolist()):
+            if value == 0:
+                continue
+            magnitude = _format_number(abs(value), decimals)
+            if not monomial:
+                term = magnitude
+            elif magnitude == "1":
+                term = monomial
+            else:
+                term = f"{magnitude}{separator}{monomial}"
+            sign = "-" if value < 0 else "+"
+            pieces.append(f"{sign} {term}" if pieces else ("-" if value < 0 else "") + term)
+        return " ".join(pieces) if pieces else "0"
+
+    def to_text(self, decimals: int | None = None) -> str:
+        """
+        Format the polynomial in the parser's equation syntax.
+
+        Args:
+            decimals: int | None
+                Optional rounding applied only to the displayed coefficients.
+            return: str
+                Text such as ``x**2 + 2*y**2 - 1`` that parses back unchanged.
+        """
+
+        return self._terms(_TEXT_MONOMIALS, "*", decimals)
+
+    def to_latex(self, decimals: int | None = None) -> str:
+        """
+        Format the polynomial as a LaTeX expression.
+
+        Args:
+            decimals: int | None
+                Optional rounding applied only to the displayed coefficients.
+            return: str
+                LaTeX such as ``x^{2} + 2 y^{2} - 1``.
+        """
+
+        return self._terms(_LATEX_MONOMIALS, " ", decimals)
+
+    def to_sympy(self) -> sp.Expr:
+        """
+        Return the equivalent SymPy expression, with exact integer coefficients.
+
+        Args:
+            return: sympy.Expr
+                Expression in the shared x, y, and z symbols.
+        """
+
+        import sympy as sp
+
+        from src.numerical.symbols import x, y, z
+
+        expression: sp.Expr = sp.Integer(0)
+        for (x_power, y_power, z_power), value in zip(COEFFICIENT_MONOMIALS, self.coefficients.tolist()):
+            if value == 0:
+                continue
+            coefficient = sp.Integer(int(value)) if value == int(value) else sp.Float(value)
+            expression += coefficient * x**x_power * y**y_power * z**z_power
+        return expression
+
+
+__all__ = [
+    "INTEGER_SNAP_TOLERANCE",
+    "QuadricPolynomial",
+    "coefficients_from_homogeneous",
+    "snap_integer_coefficients",
+]
@@ -0,0 +1,255 @@
+"""
+Hold whole corpora of canonicalization results as contiguous columns.
+
+A :class:`CanonicalizationResult` carries five arrays plus model overhead, so
+a list of them costs kilobytes per quadric. :class:`ResultTable` stores the
+same fields as one array per column, under 500 bytes per row, filters rows by
+type with vectorized masks, slices without copying, and materializes single
+rows back into result models on demand.
+
+Run the table tests with ``python -m pytest tests/test_models.py -q``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from src.numerical.models import (
+    BatchCanonicalization,
+    BoolArray,
+    CanonicalizationResult,
+    FloatArray,
+    Int8Array,
+    QuadricType,
+)
+
+
+Int64Array = npt.NDArray[np.int64]
+_COLUMNS = (
+    "quadric_types",
+    "centered",
+    "initial_matrices",
+    "middle_matrices",
+    "final_matrices",
+    "rotation_matrices",
+    "translation_vectors",
+    "source_indices",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ResultTable:
+    """
+    Store canonicalization results as a structure of arrays.
+
+    Args:
+        quadric_types: numpy.ndarray
+            ``int8`` :class:`QuadricType` values, shape ``(N,)``.
+        centered: numpy.ndarray
+            Boolean mask of full-rank quadratic blocks, shape ``(N,)``.
+        initial_matrices: numpy.ndarray
+            Input homogeneous matrices, shape ``(N, 4, 4)``.
+        middle_matrices: numpy.ndarray
+            Matrices after the rotation stage, shape ``(N, 4, 4)``.
+        final_matrices: numpy.ndarray
+            Canonical homogeneous matrices, shape ``(N, 4, 4)``.
+        rotation_matrices: numpy.ndarray
+            Active point rotations, shape ``(N, 3, 3)``.
+        translation_vectors: numpy.ndarray
+            Active point translations, shape ``(N, 3)``.
+        source_indices: numpy.ndarray
+            ``int64`` position of every row in the corpus it was built from,
+            shape ``(N,)``; preserved through filtering and slicing.
+    return: ResultTable
+        Immutable columnar view of the results.
+    """
+
+    quadric_types: Int8Array
+    centered: BoolArray
+    initial_matrices: FloatArray
+    middle_matrices: FloatArray
+    final_matrices: FloatArray
+    rotation_matrices: FloatArray
+    translation_vectors: FloatArray
+    source_indices: Int64Array
+
+    def __post_init__(self) -> None:
+        count = self.quadric_types.shape[0] if self.quadric_types.ndim == 1 else -1
+        if count < 0 or self.centered.shape != (count,) or self.source_indices.shape != (count,):
+            raise ValueError("quadric_types, centered, and source_indices must share shape (N,)")
+        for matrices in (self.initial_matrices, self.middle_matrices, self.final_matrices):
+            if matrices.shape != (count, 4, 4):
+                raise ValueError("stage matrices must have shape (N, 4, 4)")
+        if self.rotation_matrices.shape != (count, 3, 3):
+            raise ValueError("rotation matrices must have shape (N, 3, 3)")
+        if self.translation_vectors.shape != (count, 3):
+            raise ValueError("translation vectors must have shape (N, 3)")
+
+    @classmethod
+    def empty(cls) -> ResultTable:
+        """Return a table without rows."""
+
+        return cls(
+            quadric_types=np.empty(0, dtype=np.int8),
+            centered=np.empty(0, dtype=np.bool_),
+            initial_matrices=np.empty((0, 4, 4)),
+            middle_matrices=np.empty((0, 4, 4)),
+            final_matrices=np.empty((0, 4, 4)),
+            rotation_matrices=np.empty((0, 3, 3)),
+            translation_vectors=np.empty((0, 3)),
+            source_indices=np.empty(0, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_results(cls, results: Iterable[CanonicalizationResult]) -> ResultTable:
+        """
+        Pack result models into contiguous columns.
+
+        Args:
+            results: collections.abc.Iterable[CanonicalizationResult]
+                Results in corpus order; their positions become ``source_indices``.
+            return: ResultTable
+                Table holding copies of every result's arrays.
+        """
+
+        rows = list(results)
+        if not rows:
+            return cls.empty()
+        return cls(
+            quadric_types=np.fromiter((int(row.quadric_type) for row in rows), dtype=np.int8, count=len(rows)),
+            centered=np.fromiter((row.centered for row in rows), dtype=np.bool_, count=len(rows)),
+            initial_matrices=np.stack([row.initial_matrix for row in rows]),
+            middle_matrices=np.stack([row.middle_matrix for row in rows]),
+            final_matrices=np.stack([row.final_matrix for row in rows]),
+            rotation_matrices=np.stack([row.rotation_matrix for row in rows]),
+            translation_vectors=np.stack([row.translation_vector for row in rows]),
+            source_indices=np.arange(len(rows), dtype=np.int64),
+        )
+
+    @classmethod
+    def from_batch(cls, batch: BatchCanonicalization) -> ResultTable:
+        """
+        Keep the successful rows of a batched canonicalization.
+
+        Args:
+            batch: BatchCanonicalization
+                Output of :meth:`QuadricCanonicalizer.canonize_many`.
+            return: ResultTable
+                Table of the rows without errors; ``source_indices`` holds their
+                batch positions.
+        """
+
+        kept = np.flatnonzero(~batch.error_mask)
+        return cls(
+            quadric_types=batch.quadric_types[kept],
+            centered=batch.centered[kept],
+            initial_matrices=batch.initial_matrices[kept],
+            middle_matrices=batch.middle_matrices[kept],
+            final_matrices=batch.final_matrices[kept],
+            rotation_matrices=batch.rotation_matrices[kept],
+            translation_vectors=batch.translation_vectors[kept],
+            source_indices=kept.astype(np.int64),
+        )
+
+    @classmethod
+    def concatenate(cls, tables: Sequence[ResultTable]) -> ResultTable:
+        """
+        Join tables row-wise, keeping each row's original ``source_indices``.
+
+        Args:
+            tables: collections.abc.Sequence[ResultTable]
+                Tables to join in order.
+            return: ResultTable
+                Table with every row of every input.
+        """
+
+        if not tables:
+            return cls.empty()
+        return cls(*(np.concatenate([getattr(table, column) for table in tables]) for column in _COLUMNS))
+
+    def __len__(self) -> int:
+        return int(self.quadric_types.shape[0])
+
+    def __getitem__(self, selection: slice | npt.NDArray[np.bool_] | npt.NDArray[np.integer]) -> ResultTable:
+        """
+        Select rows by slice, boolean mask, or index array.
+
+        Args:
+            selection: slice | numpy.ndarray
+                Basic slices return views; masks and index arrays copy.
+            return: ResultTable
+                Table of the selected rows.
+        """
+
+        if isinstance(selection, (int, np.integer)):
+            raise TypeError("use ResultTable.row to materialize a single row")
+        return type(self)(*(getattr(self, column)[selection] for column in _COLUMNS))
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the column buffers."""
+
+        return sum(int(getattr(self, column).nbytes) for column in _COLUMNS)
+
+    def type_mask(self, *quadric_types: QuadricType) -> BoolArray:
+        """
+        Return the rows whose type is one of ``quadric_types``.
+
+        Args:
+            quadric_types: QuadricType
+                Accepted types.
+            return: numpy.ndarray
+                Boolean mask with shape ``(N,)``.
+        """
+
+        return np.isin(self.quadric_types, np.array([int(kind) for kind in quadric_types], dtype=np.int8))
+
+    def of_type(self, *quadric_types: QuadricType) -> ResultTable:
+        """Return the rows whose type is one of ``quadric_types``."""
+
+        return self[self.type_mask(*quadric_types)]
+
+    def type_counts(self) -> dict[QuadricType, int]:
+        """Return the number of rows of every type present in the table."""
+
+        values, counts = np.unique(self.quadric_types, return_counts=True)
+        return {QuadricType(int(value)): int(count) for value, count in zip(values, counts)}
+
+    def row(self, index: int, validate: bool = False) -> CanonicalizationResult:
+        """
+        Materialize one row as a result model.
+
+        Args:
+            index: int
+                Row position in this table, negative values counting from the end.
+            validate: bool
+                Run the full public-boundary validation instead of the trusted
+                constructor; rows normally come from results already validated.
+            return: CanonicalizationResult
+                Result holding copies of the row's arrays.
+        """
+
+        if not -len(self) <= index < len(self):
+            raise IndexError("result table row out of range")
+        build = CanonicalizationResult if validate else CanonicalizationResult.trusted
+        return build(
+            quadric_type=QuadricType(int(self.quadric_types[index])),
+            centered=bool(self.centered[index]),
+            initial_matrix=self.initial_matrices[index].copy(),
+            middle_matrix=self.middle_matrices[index].copy(),
+            final_matrix=self.final_matrices[index].copy(),
+            translation_vector=self.translation_vectors[index].copy(),
+            rotation_matrix=self.rotation_matrices[index].copy(),
+        )
+
+    def rows(self) -> Iterator[CanonicalizationResult]:
+        """Materialize every row lazily, in table order."""
+
+        return (self.row(index) for index in range(len(self)))
+
+
+__all__ = ["ResultTable"]
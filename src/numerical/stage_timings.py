@@ -0,0 +1,236 @@
+"""
+Record opt-in wall-clock timings of every canonicalization stage.
+
+A :class:`PipelineTimings` passed to :class:`QuadricCanonicalizer` collects
+the duration of each stage into log-spaced histograms keyed by quadric type.
+Stages that run before the type is known (parsing, matrix construction,
+eigendecomposition) are buffered per thread and filed under the type once
+classification resolves it; calls that fail are filed as ``unclassified``.
+SymPy equations are built lazily, so their stage is recorded when a result's
+equation is first accessed. A canonicalizer without timings enters one shared
+no-op context per stage and allocates nothing.
+
+Run the timing tests with ``python -m pytest tests/test_stage_timings.py -q``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import StrEnum
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from src.numerical.models import QuadricType
+
+
+UNCLASSIFIED_KEY = "unclassified"
+# Five log-spaced buckets per decade between 100 ns and 10 s.
+DEFAULT_BUCKET_EDGES = tuple(10.0 ** (exponent / 5) for exponent in range(-35, 6))
+
+
+class PipelineStage(StrEnum):
+    """Name the timed stages of one scalar canonicalization."""
+
+    PARSE = "parse"
+    MATRIX_CONSTRUCTION = "matrix_construction"
+    CLASSIFICATION = "classification"
+    EIGENDECOMPOSITION = "eigendecomposition"
+    TRANSLATION = "translation"
+    BUILD_RESULT = "build_result"
+    EQUATION = "equation"
+    VALIDATION = "validation"
+
+
+class StageHistogram:
+    """
+    Accumulate durations of one stage into fixed log-spaced buckets.
+
+    Args:
+        edges: tuple[float, ...]
+            Increasing bucket boundaries in seconds; ``counts`` has one more
+            entry than ``edges``, the first and last catching underflow and
+            overflow.
+    """
+
+    edges: tuple[float, ...]
+    counts: list[int]
+    total: float
+    minimum: float
+    maximum: float
+
+    __slots__ = ("edges", "counts", "total", "minimum", "maximum")
+
+    def __init__(self, edges: tuple[float, ...] = DEFAULT_BUCKET_EDGES) -> None:
+        self.edges = edges
+        self.counts = [0] * (len(edges) + 1)
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+
+    @property
+    def count(self) -> int:
+        """Return the number of recorded durations."""
+
+        return sum(self.counts)
+
+    def add(self, seconds: float) -> None:
+        """Add one duration in seconds."""
+
+        self.counts[bisect.bisect_right(self.edges, seconds)] += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return count, total, mean, extrema, and bucket counts as JSON-ready values."""
+
+        count = self.count
+        return {
+            "count": count,
+            "total": self.total,
+            "mean": self.total / count if count else 0.0,
+            "min": self.minimum if count else 0.0,
+            "max": self.maximum,
+            "counts": list(self.counts),
+        }
+
+
+class PipelineTimings:
+    """
+    Aggregate per-stage durations into histograms keyed by quadric type.
+
+    Args:
+        edges: tuple[float, ...]
+            Bucket boundaries in seconds shared by every histogram.
+    """
+
+    edges: tuple[float, ...]
+    _histograms: dict[str, dict[PipelineStage, StageHistogram]]
+    _pending: threading.local
+    _lock: threading.Lock
+
+    def __init__(self, edges: tuple[float, ...] = DEFAULT_BUCKET_EDGES) -> None:
+        if not edges or any(upper <= lower for lower, upper in zip(edges, edges[1:])):
+            raise ValueError("histogram edges must be non-empty and strictly increasing")
+        self.edges = tuple(float(edge) for edge in edges)
+        self._histograms = {}
+        self._pending = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, stage: PipelineStage) -> Iterator[None]:
+        """
+        Time one stage of the current call until its type is known.
+
+        When the stage raises, the call is over: its buffered stages are filed
+        as ``unclassified`` and the exception propagates.
+
+        Args:
+            stage: PipelineStage
+                Stage being timed.
+            return: collections.abc.Iterator[None]
+                Context manager measuring its body.
+        """
+
+        start = perf_counter()
+        try:
+            yield
+        except BaseException:
+            self._buffer().append((stage, perf_counter() - start))
+            self.flush(None)
+            raise
+        self._buffer().append((stage, perf_counter() - start))
+
+    def flush(self, quadric_type: QuadricType | None) -> None:
+        """File the current thread's buffered stages under ``quadric_type``, or as unclassified."""
+
+        buffer = self._buffer()
+        if not buffer:
+            return
+        samples = list(buffer)
+        buffer.clear()
+        with self._lock:
+            for stage, seconds in samples:
+                self._histogram(quadric_type, stage).add(seconds)
+
+    def record(self, stage: PipelineStage, quadric_type: QuadricType | None, seconds: float) -> None:
+        """Add one duration of a stage whose quadric type is already known."""
+
+        with self._lock:
+            self._histogram(quadric_type, stage).add(seconds)
+
+    def histogram(self, quadric_type: QuadricType | None, stage: PipelineStage) -> StageHistogram | None:
+        """Return the histogram of one type and stage, or ``None`` when nothing was recorded."""
+
+        with self._lock:
+            return self._histograms.get(_type_key(quadric_type), {}).get(stage)
+
+    def reset(self) -> None:
+        """Drop every histogram and the current thread's buffered stages."""
+
+        with self._lock:
+            self._histograms.clear()
+        self._buffer().clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Export the histograms as JSON-ready values.
+
+        Args:
+            return: dict[str, typing.Any]
+                ``edges`` in seconds and, under ``types``, one mapping per
+                type slug from stage name to its histogram summary.
+        """
+
+        with self._lock:
+            types = {
+                key: {stage.value: histogram.to_dict() for stage, histogram in stages.items()}
+                for key, stages in sorted(self._histograms.items())
+            }
+        return {"unit": "seconds", "edges": list(self.edges), "types": types}
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Serialize :meth:`to_dict` as JSON text."""
+
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def write_json(self, path: str | Path) -> None:
+        """Write :meth:`to_json` to ``path``."""
+
+        Path(path).write_text(self.to_json() + "\n", encoding="utf-8")
+
+    def _buffer(self) -> list[tuple[PipelineStage, float]]:
+        """Return the calling thread's list of stages awaiting a type."""
+
+        buffer: list[tuple[PipelineStage, float]] | None = getattr(self._pending, "samples", None)
+        if buffer is None:
+            buffer = self._pending.samples = []
+        return buffer
+
+    def _histogram(self, quadric_type: QuadricType | None, stage: PipelineStage) -> StageHistogram:
+        """Return, creating on demand, one histogram; the caller holds the lock."""
+
+        stages = self._histograms.setdefault(_type_key(quadric_type), {})
+        histogram = stages.get(stage)
+        if histogram is None:
+            histogram = stages[stage] = StageHistogram(self.edges)
+        return histogram
+
+
+def _type_key(quadric_type: QuadricType | None) -> str:
+    return UNCLASSIFIED_KEY if quadric_type is None else quadric_type.slug
+
+
+__all__ = [
+    "DEFAULT_BUCKET_EDGES",
+    "UNCLASSIFIED_KEY",
+    "PipelineStage",
+    "PipelineTimings",
+    "StageHistogram",
+]
@@ -0,0 +1,252 @@
+"""
+Sweep quadric coefficients over a grid and locate type transitions.
+
+A sweep adds parameter multiples of fixed direction matrices to a base
+quadric, so every grid point is built directly as a matrix and the whole grid
+goes through one batched classification and canonicalization pass. Adjacent
+grid points of different types bracket a transition, and every bracket is
+narrowed by vectorized bisection: midpoints are classified together through
+their batched invariants (ranks, determinant sign, inertia) instead of
+resampling the grid densely.
+
+Run the sweep tests with ``python -m pytest tests/test_sweep.py -q``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from src.numerical.canonicalize import QuadricCanonicalizer, _default_canonicalizer
+from src.numerical.classifier import UNCLASSIFIED
+from src.numerical.models import (
+    BatchCanonicalization,
+    FloatArray,
+    Int8Array,
+    QuadricMatrixBatch,
+    QuadricType,
+    homogeneous_from_coefficients,
+)
+
+
+DEFAULT_BISECTION_TOLERANCE = 1e-12
+DEFAULT_MAX_BISECTIONS = 64
+
+
+def _as_homogeneous(value: npt.ArrayLike, name: str) -> FloatArray:
+    """Accept ten coefficients or a symmetric 4x4 matrix and return the matrix."""
+
+    array = np.asarray(value, dtype=np.float64)
+    if array.shape == (10,):
+        return homogeneous_from_coefficients(array)
+    if array.shape != (4, 4):
+        raise ValueError(f"{name} must be ten coefficients or a 4x4 homogeneous matrix")
+    if not np.allclose(array, array.T, rtol=0.0, atol=1e-12 * max(float(np.max(np.abs(array))), 1.0)):
+        raise ValueError(f"{name} must be symmetric")
+    return np.asarray((array + array.T) / 2, dtype=np.float64)
+
+
+def _type_or_none(code: int) -> QuadricType | None:
+    return None if code == UNCLASSIFIED else QuadricType(code)
+
+
+@dataclass(frozen=True, slots=True)
+class TypeTransition:
+    """
+    Describe one parameter interval across which the quadric type changes.
+
+    Args:
+        axis: int
+            Swept parameter that varies across the interval.
+        grid_index: tuple[int, ...]
+            Grid index of the lower endpoint.
+        lower: float
+            Largest parameter value known to have type ``before``.
+        upper: float
+            Smallest parameter value known to differ from ``before``.
+        before: QuadricType | None
+            Type at ``lower``; ``None`` when that point is not a quadric.
+        after: QuadricType | None
+            Type at ``upper`` after refinement.
+    return: TypeTransition
+        Immutable bracket narrowed by bisection.
+    """
+
+    axis: int
+    grid_index: tuple[int, ...]
+    lower: float
+    upper: float
+    before: QuadricType | None
+    after: QuadricType | None
+
+    @property
+    def parameter(self) -> float:
+        """Return the midpoint of the refined bracket."""
+
+        return 0.5 * (self.lower + self.upper)
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterSweep:
+    """
+    Store a batched parameter sweep and its refined type transitions.
+
+    Args:
+        grids: tuple[numpy.ndarray, ...]
+            One ascending parameter grid per direction.
+        parameters: numpy.ndarray
+            Parameter vector of every grid point, shape ``(N, k)`` in C order.
+        batch: BatchCanonicalization
+            Canonical forms of every grid point in the same order.
+        transitions: tuple[TypeTransition, ...]
+            Refined brackets of every type change between neighbouring points.
+    return: ParameterSweep
+        Grid-shaped sweep results.
+    """
+
+    grids: tuple[FloatArray, ...]
+    parameters: FloatArray
+    batch: BatchCanonicalization
+    transitions: tuple[TypeTransition, ...]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Return the grid shape, one axis per direction."""
+
+        return tuple(grid.size for grid in self.grids)
+
+    @property
+    def types(self) -> Int8Array:
+        """Return the ``int8`` type codes arranged on the grid."""
+
+        return self.batch.quadric_types.reshape(self.shape)
+
+
+def _bisect(
+    canonicalizer: QuadricCanonicalizer,
+    base: FloatArray,
+    directions: FloatArray,
+    lower_points: FloatArray,
+    axes: npt.NDArray[np.intp],
+    lower: FloatArray,
+    upper: FloatArray,
+    before: Int8Array,
+    tolerance: float,
+    max_bisections: int,
+) -> tuple[FloatArray, FloatArray, Int8Array]:
+    """Narrow every bracket at once and classify the final upper ends."""
+
+    lower, upper = lower.copy(), upper.copy()
+    rows = np.arange(axes.size)
+    points = lower_points.copy()
+    for _ in range(max_bisections):
+        active = np.abs(upper - lower) > tolerance * np.maximum(1.0, np.abs(lower))
+        if not np.any(active):
+            break
+        middle = 0.5 * (lower + upper)
+        points[rows, axes] = middle
+        matrices = base + np.tensordot(points[active], directions, axes=(1, 0))
+        codes = canonicalizer.classifier.classify_many(matrices[:, :3, :3], matrices)
+        same = codes == before[active]
+        active_rows = rows[active]
+        lower[active_rows[same]] = middle[active][same]
+        upper[active_rows[~same]] = middle[active][~same]
+    points[rows, axes] = upper
+    final = base + np.tensordot(points, directions, axes=(1, 0))
+    return lower, upper, canonicalizer.classifier.classify_many(final[:, :3, :3], final)
+
+
+def sweep_parameters(
+    base: npt.ArrayLike,
+    directions: Sequence[npt.ArrayLike],
+    grids: Sequence[npt.ArrayLike],
+    canonicalizer: QuadricCanonicalizer | None = None,
+    tolerance: float = DEFAULT_BISECTION_TOLERANCE,
+    max_bisections: int = DEFAULT_MAX_BISECTIONS,
+) -> ParameterSweep:
+    """
+    Canonicalize ``base + sum(t_i * directions[i])`` over a parameter grid.
+
+    Args:
+        base: numpy.typing.ArrayLike
+            Ten coefficients or a symmetric 4x4 homogeneous matrix.
+        directions: collections.abc.Sequence[numpy.typing.ArrayLike]
+            One coefficient vector or homogeneous matrix per swept parameter.
+        grids: collections.abc.Sequence[numpy.typing.ArrayLike]
+            Strictly increasing values of every parameter.
+        canonicalizer: QuadricCanonicalizer | None
+            Canonicalizer whose classifier and batch kernels are used.
+        tolerance: float
+            Relative bracket width at which bisection stops.
+        max_bisections: int
+            Upper bound on bisection steps per bracket.
+        return: ParameterSweep
+            Canonical forms of every grid point and the refined transitions.
+    """
+
+    if len(directions) != len(grids) or not directions:
+        raise ValueError("provide one grid per direction and at least one direction")
+    base_matrix = _as_homogeneous(base, "base")
+    direction_matrices = np.stack(
+        [_as_homogeneous(direction, f"directions[{index}]") for index, direction in enumerate(directions)]
+    )
+    grid_values = tuple(np.asarray(grid, dtype=np.float64).reshape(-1) for grid in grids)
+    for grid in grid_values:
+        if grid.size == 0 or np.any(np.diff(grid) <= 0.0) or not np.all(np.isfinite(grid)):
+            raise ValueError("parameter grids must be finite, non-empty, and strictly increasing")
+    active = canonicalizer if canonicalizer is not None else _default_canonicalizer()
+    shape = tuple(grid.size for grid in grid_values)
+    parameters = np.stack([axis.reshape(-1) for axis in np.meshgrid(*grid_values, indexing="ij")], axis=1)
+    matrices = base_matrix + np.tensordot(parameters, direction_matrices, axes=(1, 0))
+    batch = active.canonize_many(QuadricMatrixBatch.from_homogeneous(matrices))
+
+    codes = batch.quadric_types.reshape(shape)
+    flat_index = np.arange(parameters.shape[0]).reshape(shape)
+    lower_rows: list[npt.NDArray[np.intp]] = []
+    upper_rows: list[npt.NDArray[np.intp]] = []
+    axes: list[npt.NDArray[np.intp]] = []
+    for axis in range(len(shape)):
+        head = [slice(None)] * len(shape)
+        tail = [slice(None)] * len(shape)
+        head[axis], tail[axis] = slice(None, -1), slice(1, None)
+        changed = codes[tuple(head)] != codes[tuple(tail)]
+        lower_rows.append(flat_index[tuple(head)][changed])
+        upper_rows.append(flat_index[tuple(tail)][changed])
+        axes.append(np.full(int(np.count_nonzero(changed)), axis, dtype=np.intp))
+    lower_index = np.concatenate(lower_rows)
+    upper_index = np.concatenate(upper_rows)
+    transition_axes = np.concatenate(axes)
+    if lower_index.size == 0:
+        return ParameterSweep(grid_values, parameters, batch, ())
+
+    rows = np.arange(lower_index.size)
+    lower, upper, after = _bisect(
+        active,
+        base_matrix,
+        direction_matrices,
+        parameters[lower_index],
+        transition_axes,
+        parameters[lower_index, transition_axes],
+        parameters[upper_index, transition_axes],
+        batch.quadric_types[lower_index],
+        tolerance,
+        max_bisections,
+    )
+    transitions = tuple(
+        TypeTransition(
+            axis=int(transition_axes[row]),
+            grid_index=tuple(int(value) for value in np.unravel_index(int(lower_index[row]), shape)),
+            lower=float(lower[row]),
+            upper=float(upper[row]),
+            before=_type_or_none(int(batch.quadric_types[lower_index[row]])),
+            after=_type_or_none(int(after[row])),
+        )
+        for row in rows
+    )
+    return ParameterSweep(grid_values, parameters, batch, transitions)
+
+
+__all__ = ["ParameterSweep", "TypeTransition", "sweep_parameters"]
@@ -0,0 +1,296 @@
+"""
+Diagonalize symmetric 3x3 matrices in closed form, one at a time or stacked.
+
+Every quadric needs only a 3x3 symmetric eigendecomposition, where LAPACK
+dispatch costs far more than the arithmetic. The matrix is scaled, shifted by
+its mean eigenvalue, and normalized, so its eigenvalues follow from the
+trigonometric solution of the characteristic cubic. The eigenvector of the
+best-separated eigenvalue is the largest cross product of two rows of the
+shifted matrix; the middle eigenvector is the null vector of the 2x2
+restriction to the orthogonal complement, which stays well defined for
+repeated eigenvalues; and the last is a cross product, so every basis is
+right-handed. Eigenvector signs follow one convention in both kernels: the
+first component of the first two columns that clears a roundoff floor is
+positive, and the third column follows their product to keep the handedness.
+This is the robust construction of Eberly, "A Robust
+Eigensolver for 3x3 Symmetric Matrices" (Geometric Tools, 2014).
+
+Run the kernel tests with ``python -m pytest tests/test_symmetric_eigen.py -q``.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+from src.numerical.models import FloatArray
+
+
+_THIRD_TURN = 2.0 * math.pi / 3.0
+# A plane block whose eigenvalues differ by less than this, relative to the
+# unit spread of the normalized matrix, is treated as a repeated pair and
+# keeps the complement basis, so both kernels agree on repeated eigenspaces.
+_REPEATED_GAP = 64.0 * float(np.finfo(np.float64).eps)
+# Unit eigenvector components below this count as zero when fixing signs, so
+# roundoff around an exact zero cannot flip a column in one kernel only.
+_SIGN_FLOOR = 1e-9
+
+
+def _leading_sign(c0: float, c1: float, c2: float) -> float:
+    """Return the sign that makes the first component above the floor positive."""
+
+    for component in (c0, c1, c2):
+        if abs(component) > _SIGN_FLOOR:
+            return 1.0 if component > 0.0 else -1.0
+    return 1.0
+
+
+def _plane_eigenpair(m00: float, m01: float, m11: float, upper: bool) -> tuple[float, float, float]:
+    """Return one eigenvalue of a symmetric 2x2 matrix and its unit eigenvector coordinates."""
+
+    half_gap = math.hypot(0.5 * (m00 - m11), m01)
+    if half_gap <= _REPEATED_GAP:
+        return 0.5 * (m00 + m11), 1.0, 0.0
+    value = 0.5 * (m00 + m11) + (half_gap if upper else -half_gap)
+    s00, s11 = m00 - value, m11 - value
+    along, across = (m01, s00) if abs(s00) >= abs(s11) else (s11, m01)
+    norm = math.hypot(along, across)
+    if norm == 0.0:
+        return value, 1.0, 0.0
+    return value, along / norm, -across / norm
+
+
+def eigh3(matrix: npt.ArrayLike) -> tuple[FloatArray, FloatArray]:
+    """
+    Diagonalize one symmetric 3x3 matrix in closed form.
+
+    The arithmetic runs on Python floats with the vector algebra written out,
+    since interpreter overhead rather than flops dominates at this size.
+
+    Args:
+        matrix: numpy.typing.ArrayLike
+            Symmetric 3x3 matrix; only its upper triangle is read.
+        return: tuple[numpy.ndarray, numpy.ndarray]
+            Ascending eigenvalues and a right-handed orthonormal matrix whose
+            columns are the matching eigenvectors, like ``numpy.linalg.eigh``.
+    """
+
+    (a00, a01, a02), (_, a11, a12), (_, _, a22) = np.asarray(matrix, dtype=np.float64).tolist()
+    scale = max(abs(a00), abs(a01), abs(a02), abs(a11), abs(a12), abs(a22))
+    if scale == 0.0:
+        return np.zeros(3), np.eye(3)
+    a00, a01, a02, a11, a12, a22 = a00 / scale, a01 / scale, a02 / scale, a11 / scale, a12 / scale, a22 / scale
+    mean = (a00 + a11 + a22) / 3.0
+    b00, b11, b22 = a00 - mean, a11 - mean, a22 - mean
+    spread_squared = (b00 * b00 + b11 * b11 + b22 * b22 + 2.0 * (a01 * a01 + a02 * a02 + a12 * a12)) / 6.0
+    if spread_squared == 0.0:
+        return np.full(3, mean * scale), np.eye(3)
+    spread = math.sqrt(spread_squared)
+    c00, c01, c02, c11, c12, c22 = b00 / spread, a01 / spread, a02 / spread, b11 / spread, a12 / spread, b22 / spread
+    half_determinant = 0.5 * (
+        c00 * (c11 * c22 - c12 * c12) - c01 * (c01 * c22 - c12 * c02) + c02 * (c01 * c12 - c11 * c02)
+    )
+    # The trigonometric roots lose accuracy for nearly repeated pairs, so they
+    # only select the best-separated root, which is accurate to roundoff.
+    angle = math.acos(min(max(half_determinant, -1.0), 1.0)) / 3.0
+    largest_first = half_determinant >= 0.0
+    root = 2.0 * math.cos(angle) if largest_first else 2.0 * math.cos(angle + _THIRD_TURN)
+
+    # The separated eigenvector is the largest cross product of two rows of
+    # the rank-two matrix ``c - root * I``.
+    d00, d11, d22 = c00 - root, c11 - root, c22 - root
+    candidates = (
+        (c01 * c12 - c02 * d11, c02 * c01 - d00 * c12, d00 * d11 - c01 * c01),
+        (c01 * d22 - c02 * c12, c02 * c02 - d00 * d22, d00 * c12 - c01 * c02),
+        (d11 * d22 - c12 * c12, c12 * c02 - c01 * d22, c01 * c12 - d11 * c02),
+    )
+    best, best_squared = candidates[0], -1.0
+    for candidate in candidates:
+        squared = candidate[0] * candidate[0] + candidate[1] * candidate[1] + candidate[2] * candidate[2]
+        if squared > best_squared:
+            best, best_squared = candidate, squared
+    norm = math.sqrt(best_squared)
+    x, y, z = best[0] / norm, best[1] / norm, best[2] / norm
+    separated_value = (
+        x * (c00 * x + c01 * y + c02 * z) + y * (c01 * x + c11 * y + c12 * z) + z * (c02 * x + c12 * y + c22 * z)
+    )
+
+    # Right-handed orthonormal basis (u, v) of the plane orthogonal to (x, y, z).
+    if abs(x) > abs(y):
+        length = math.sqrt(x * x + z * z)
+        u0, u1, u2 = -z / length, 0.0, x / length
+    else:
+        length = math.sqrt(y * y + z * z)
+        u0, u1, u2 = 0.0, z / length, -y / length
+    v0, v1, v2 = y * u2 - z * u1, z * u0 - x * u2, x * u1 - y * u0
+    cu0, cu1, cu2 = c00 * u0 + c01 * u1 + c02 * u2, c01 * u0 + c11 * u1 + c12 * u2, c02 * u0 + c12 * u1 + c22 * u2
+    cv0, cv1, cv2 = c00 * v0 + c01 * v1 + c02 * v2, c01 * v0 + c11 * v1 + c12 * v2, c02 * v0 + c12 * v1 + c22 * v2
+    m00 = u0 * cu0 + u1 * cu1 + u2 * cu2
+    m11 = v0 * cv0 + v1 * cv1 + v2 * cv2
+    middle_value, along, across = _plane_eigenpair(m00, u0 * cv0 + u1 * cv1 + u2 * cv2, m11, largest_first)
+    other_value = m00 + m11 - middle_value
+    w0, w1, w2 = along * u0 + across * v0, along * u1 + across * v1, along * u2 + across * v2
+    # ``middle x separated`` completes the basis; its negation follows ``separated``.
+    k0, k1, k2 = w1 * z - w2 * y, w2 * x - w0 * z, w0 * y - w1 * x
+    if largest_first:
+        values = [other_value, middle_value, separated_value]
+        vectors = [[k0, w0, x], [k1, w1, y], [k2, w2, z]]
+    else:
+        values = [separated_value, middle_value, other_value]
+        vectors = [[x, w0, -k0], [y, w1, -k1], [z, w2, -k2]]
+    first_sign = _leading_sign(vectors[0][0], vectors[1][0], vectors[2][0])
+    second_sign = _leading_sign(vectors[0][1], vectors[1][1], vectors[2][1])
+    signs = (first_sign, second_sign, first_sign * second_sign)
+    factor = spread * scale
+    offset = mean * scale
+    eigenvalues = np.array(
+        [values[0] * factor + offset, values[1] * factor + offset, values[2] * factor + offset], dtype=np.float64
+    )
+    eigenvectors = np.array([[value * sign for value, sign in zip(row, signs)] for row in vectors], dtype=np.float64)
+    return eigenvalues, eigenvectors
+
+
+def eigvalsh3(matrix: npt.ArrayLike) -> FloatArray:
+    """Return the ascending eigenvalues of one symmetric 3x3 matrix."""
+
+    return eigh3(matrix)[0]
+
+
+def _batch_cross(left: FloatArray, right: FloatArray) -> FloatArray:
+    return np.stack(
+        (
+            left[:, 1] * right[:, 2] - left[:, 2] * right[:, 1],
+            left[:, 2] * right[:, 0] - left[:, 0] * right[:, 2],
+            left[:, 0] * right[:, 1] - left[:, 1] * right[:, 0],
+        ),
+        axis=1,
+    )
+
+
+def _batch_dot(left: FloatArray, right: FloatArray) -> FloatArray:
+    return np.asarray(np.sum(left * right, axis=1), dtype=np.float64)
+
+
+def _batch_leading_signs(vectors: FloatArray) -> FloatArray:
+    """Return the batched counterpart of :func:`_leading_sign` for rows of unit vectors."""
+
+    leading = np.argmax(np.abs(vectors) > _SIGN_FLOOR, axis=1)
+    return np.where(vectors[np.arange(vectors.shape[0]), leading] < 0.0, -1.0, 1.0)
+
+
+def batch_eigh3(matrices: npt.ArrayLike) -> tuple[FloatArray, FloatArray]:
+    """
+    Diagonalize stacked symmetric 3x3 matrices in closed form.
+
+    Args:
+        matrices: numpy.typing.ArrayLike
+            Symmetric matrices with shape ``(N, 3, 3)``.
+        return: tuple[numpy.ndarray, numpy.ndarray]
+            Ascending eigenvalues with shape ``(N, 3)`` and right-handed
+            eigenvector columns with shape ``(N, 3, 3)``.
+    """
+
+    array = np.asarray(matrices, dtype=np.float64)
+    if array.ndim != 3 or array.shape[1:] != (3, 3):
+        raise ValueError("matrices must have shape (N, 3, 3)")
+    count = array.shape[0]
+    rows = np.arange(count)
+    identity = np.eye(3)
+
+    scale = np.max(np.abs(array), axis=(1, 2))
+    normalized = array / np.where(scale > 0.0, scale, 1.0)[:, None, None]
+    mean = np.trace(normalized, axis1=1, axis2=2) / 3.0
+    shifted = normalized - mean[:, None, None] * identity
+    spread = np.sqrt(np.sum(shifted * shifted, axis=(1, 2)) / 6.0)
+    isotropic = spread == 0.0
+    reduced = shifted / np.where(isotropic, 1.0, spread)[:, None, None]
+    half_determinant = 0.5 * (
+        reduced[:, 0, 0] * (reduced[:, 1, 1] * reduced[:, 2, 2] - reduced[:, 1, 2] * reduced[:, 1, 2])
+        - reduced[:, 0, 1] * (reduced[:, 0, 1] * reduced[:, 2, 2] - reduced[:, 1, 2] * reduced[:, 0, 2])
+        + reduced[:, 0, 2] * (reduced[:, 0, 1] * reduced[:, 1, 2] - reduced[:, 1, 1] * reduced[:, 0, 2])
+    )
+    angle = np.arccos(np.clip(half_determinant, -1.0, 1.0)) / 3.0
+    largest_first = half_determinant >= 0.0
+    root = np.where(largest_first, 2.0 * np.cos(angle), 2.0 * np.cos(angle + _THIRD_TURN))
+
+    root_shifted = reduced - root[:, None, None] * identity
+    candidates = np.stack(
+        (
+            _batch_cross(root_shifted[:, 0], root_shifted[:, 1]),
+            _batch_cross(root_shifted[:, 0], root_shifted[:, 2]),
+            _batch_cross(root_shifted[:, 1], root_shifted[:, 2]),
+        ),
+        axis=1,
+    )
+    squared_norms = np.sum(candidates * candidates, axis=2)
+    best = np.argmax(squared_norms, axis=1)
+    best_norm = np.sqrt(squared_norms[rows, best])
+    separated = candidates[rows, best] / np.where(best_norm > 0.0, best_norm, 1.0)[:, None]
+    separated[isotropic] = identity[2]
+    separated_value = _batch_dot(separated, np.einsum("nij,nj->ni", reduced, separated))
+
+    x, y, z = separated[:, 0], separated[:, 1], separated[:, 2]
+    use_xz = np.abs(x) > np.abs(y)
+    length = np.sqrt(np.where(use_xz, x * x + z * z, y * y + z * z))
+    zero = np.zeros(count)
+    first = np.where(use_xz[:, None], np.stack((-z, zero, x), axis=1), np.stack((zero, z, -y), axis=1))
+    first /= np.where(length > 0.0, length, 1.0)[:, None]
+    second = _batch_cross(separated, first)
+    m00 = _batch_dot(first, np.einsum("nij,nj->ni", reduced, first))
+    m01 = _batch_dot(first, np.einsum("nij,nj->ni", reduced, second))
+    m11 = _batch_dot(second, np.einsum("nij,nj->ni", reduced, second))
+    half_gap = np.hypot(0.5 * (m00 - m11), m01)
+    repeated = half_gap <= _REPEATED_GAP
+    half_gap = np.where(repeated, 0.0, half_gap)
+    middle_value = 0.5 * (m00 + m11) + np.where(largest_first, half_gap, -half_gap)
+    other_value = m00 + m11 - middle_value
+    s00, s11 = m00 - middle_value, m11 - middle_value
+    use_first_row = np.abs(s00) >= np.abs(s11)
+    along = np.where(use_first_row, m01, s11)
+    across = np.where(use_first_row, s00, m01)
+    norm = np.hypot(along, across)
+    degenerate = (norm == 0.0) | repeated
+    safe_norm = np.where(degenerate, 1.0, norm)
+    along = np.where(degenerate, 1.0, along / safe_norm)
+    across = np.where(degenerate, 0.0, -across / safe_norm)
+    middle = along[:, None] * first + across[:, None] * second
+
+    completed = _batch_cross(middle, separated)
+    eigenvectors = np.empty((count, 3, 3), dtype=np.float64)
+    eigenvectors[:, :, 0] = np.where(largest_first[:, None], completed, separated)
+    eigenvectors[:, :, 1] = middle
+    eigenvectors[:, :, 2] = np.where(largest_first[:, None], separated, -completed)
+    normalized_values = np.stack(
+        (
+            np.where(largest_first, other_value, separated_value),
+            middle_value,
+            np.where(largest_first, separated_value, other_value),
+        ),
+        axis=1,
+    )
+    normalized_values[isotropic] = 0.0
+    eigenvectors[isotropic] = identity
+    first_sign = _batch_leading_signs(eigenvectors[:, :, 0])
+    second_sign = _batch_leading_signs(eigenvectors[:, :, 1])
+    eigenvectors *= np.stack((first_sign, second_sign, first_sign * second_sign), axis=1)[:, None, :]
+    eigenvalues = (normalized_values * spread[:, None] + mean[:, None]) * scale[:, None]
+    return np.asarray(eigenvalues, dtype=np.float64), eigenvectors
+
+
+def batch_eigvalsh3(matrices: npt.ArrayLike) -> FloatArray:
+    """
+    Return the ascending eigenvalues of stacked symmetric 3x3 matrices.
+
+    Args:
+        matrices: numpy.typing.ArrayLike
+            Symmetric matrices with shape ``(N, 3, 3)``.
+        return: numpy.ndarray
+            Eigenvalues with shape ``(N, 3)``.
+    """
+
+    return batch_eigh3(matrices)[0]
+
+
+__all__ = ["batch_eigh3", "batch_eigvalsh3", "eigh3", "eigvalsh3"]
@@ -3,7 +3,10 @@
 import numpy as np
 import sympy as sp
 
+from src.numerical.canonicalize import convert_poly_coeffs
 from src.numerical.numerical_helpers import assign_linear_block, assign_quadratic_block, clean_near_zero, expression_from_matrix
+from src.numerical.parser import QuadricParser
+from src.numerical.quadric_polynomial import QuadricPolynomial, coefficients_from_homogeneous
 from src.numerical.symbols import x, y, z
 
 
@@ -23,3 +26,34 @@ def test_matrix_block_updates_are_symmetric_and_non_mutating() -> None:
 def test_clean_near_zero_uses_explicit_threshold() -> None:
     result = clean_near_zero(np.array([1e-11, 1e-8]), 1e-10)
     np.testing.assert_array_equal(result, np.array([0.0, 1e-8]))
+
+
+def test_polynomial_builder_matches_the_symbolic_reconstruction() -> None:
+    matrix = np.array(
+        [
+            [2.0, -0.5, 1.0 + 1e-15, 3.0],
+            [-0.5, 1.25, 0.0, -0.1],
+            [1.0 + 1e-15, 0.0, -3.0, 0.0],
+            [3.0, -0.1, 0.0, 0.7],
+        ]
+    )
+
+    polynomial = QuadricPolynomial.from_matrix(matrix)
+
+    np.testing.assert_array_equal(polynomial.coefficients, [2.0, 1.25, -3.0, -1.0, 2.0, 0.0, 6.0, -0.2, 0.0, 0.7])
+    assert polynomial.to_sympy() == convert_poly_coeffs(expression_from_matrix(matrix))
+    np.testing.assert_allclose(
+        coefficients_from_homogeneous(np.stack([matrix, matrix]))[1], polynomial.coefficients, atol=1e-14, rtol=0.0
+    )
+
+
+def test_polynomial_text_round_trips_through_the_parser_and_formats_latex() -> None:
+    polynomial = QuadricPolynomial.from_matrix(np.diag([1.0, 2.0, -0.125, -1.0]))
+
+    assert polynomial.to_text() == "x**2 + 2*y**2 - 0.125*z**2 - 1"
+    assert polynomial.to_latex(decimals=2) == "x^{2} + 2 y^{2} - 0.12 z^{2} - 1"
+    np.testing.assert_array_equal(
+        QuadricParser().coefficients(f"{polynomial.to_text()} = 0"),
+        polynomial.coefficients,
+    )
+    assert QuadricPolynomial.from_matrix(np.zeros((4, 4))).to_text() == "0"
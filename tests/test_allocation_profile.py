@@ -0,0 +1,148 @@
+"""Verify allocation accounting and budgets with ``python -m pytest tests/test_allocation_profile.py -q``."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.graphics.surface_spec import BOUNDS_SAMPLES_PER_AXIS, SurfaceSpecFactory
+from src.main import ExampleCatalog, QuadricExample
+from src.numerical.allocation_profile import AllocationProfiler, AllocationStage, AllocationStatistics
+from src.numerical.canonicalize import QuadricCanonicalizer
+from src.numerical.classifier import QuadricClassifier
+from src.numerical.models import AffineTransformation, CanonicalizationResult, ValidationMode
+from src.numerical.parser import QuadricParser
+
+EXAMPLES = ExampleCatalog.examples
+# Budgets leave roughly 40% headroom over CPython 3.11 / NumPy 2 measurements.
+CANONIZE_PEAK_BUDGET = 24 * 1024
+BUILD_RESULT_PEAK_BUDGET = 18 * 1024
+TRUSTED_BUILD_RESULT_PEAK_BUDGET = 4 * 1024
+RESULT_RETAINED_BUDGET = 6 * 1024
+# One 181x181 sampling pass of a patch is 786 kB; building a spec peaks at
+# about 3.7 passes per patch, so one extra pass held at once exceeds 4.2.
+SAMPLING_PASS_BYTES = BOUNDS_SAMPLES_PER_AXIS**2 * 3 * np.dtype(np.float64).itemsize
+SURFACE_PEAK_BUDGET_PER_PATCH = 4.2 * SAMPLING_PASS_BYTES
+SURFACE_RETAINED_BUDGET = 16 * 1024
+COERCE_OVERHEAD_BUDGET = 4 * 1024
+
+
+def _profiled(
+    profiler: AllocationProfiler | None, validation: ValidationMode = ValidationMode.FULL
+) -> QuadricCanonicalizer:
+    return QuadricCanonicalizer(
+        QuadricParser(), QuadricClassifier(tolerance=1e-10), validation=validation, allocations=profiler
+    )
+
+
+def _statistics(profiler: AllocationProfiler, stage: str) -> AllocationStatistics:
+    statistics = profiler.statistics(stage)
+    assert statistics is not None
+    return statistics
+
+
+def test_nested_stages_keep_the_enclosing_peak() -> None:
+    with AllocationProfiler() as profiler:
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                transient = np.ones(100_000)
+                del transient
+            kept = np.ones(10_000)
+
+    inner = _statistics(profiler, "inner")
+    outer = _statistics(profiler, "outer")
+    assert inner.peak_bytes >= 800_000 > inner.retained_bytes
+    assert outer.peak_bytes >= inner.peak_bytes
+    assert 80_000 <= outer.retained_bytes < 100_000
+    assert kept.size == 10_000
+
+
+def test_profiler_only_stops_tracing_it_started() -> None:
+    with AllocationProfiler() as profiler:
+        assert tracemalloc.is_tracing()
+        with profiler.stage("stage"):
+            pass
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start()
+    try:
+        with AllocationProfiler() as profiler:
+            with profiler.stage("stage"):
+                pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_failed_stages_are_still_recorded() -> None:
+    with AllocationProfiler() as profiler:
+        canonicalizer = _profiled(profiler)
+        with pytest.raises(ValueError):
+            canonicalizer.canonize("x**3 = 1")
+
+    assert _statistics(profiler, AllocationStage.CANONIZE).calls == 1
+    assert profiler.statistics(AllocationStage.BUILD_RESULT) is None
+
+
+@pytest.mark.parametrize("example", EXAMPLES, ids=lambda example: example.quadric_type.slug)
+def test_canonicalization_stays_within_its_allocation_budget(example: QuadricExample) -> None:
+    # One unprofiled call settles lazily initialized interpreter and module caches.
+    _profiled(None).canonize(example.equation)
+    with AllocationProfiler() as profiler:
+        canonicalizer = _profiled(profiler)
+        results = [canonicalizer.canonize(example.equation) for _ in range(3)]
+
+    canonize = _statistics(profiler, AllocationStage.CANONIZE)
+    build = _statistics(profiler, AllocationStage.BUILD_RESULT)
+    assert canonize.calls == build.calls == len(results)
+    assert canonize.peak_bytes <= CANONIZE_PEAK_BUDGET
+    assert build.peak_bytes <= BUILD_RESULT_PEAK_BUDGET
+    assert canonize.max_retained_bytes <= RESULT_RETAINED_BUDGET
+
+
+def test_trusted_results_skip_the_validation_allocations() -> None:
+    with AllocationProfiler() as profiler:
+        canonicalizer = _profiled(profiler, ValidationMode.TRUSTED)
+        for example in EXAMPLES:
+            canonicalizer.canonize(example.equation)
+
+    assert _statistics(profiler, AllocationStage.BUILD_RESULT).peak_bytes <= TRUSTED_BUILD_RESULT_PEAK_BUDGET
+
+
+@pytest.mark.parametrize("example", EXAMPLES, ids=lambda example: example.quadric_type.slug)
+def test_surface_specs_stay_within_the_sampling_budget(example: QuadricExample) -> None:
+    result = _profiled(None).canonize(example.equation)
+    with AllocationProfiler() as profiler:
+        spec = SurfaceSpecFactory(allocations=profiler).create(result)
+
+    statistics = _statistics(profiler, AllocationStage.SURFACE_SPEC)
+    assert statistics.peak_bytes <= SURFACE_PEAK_BUDGET_PER_PATCH * len(spec.patches)
+    assert statistics.retained_bytes <= SURFACE_RETAINED_BUDGET
+
+
+@pytest.mark.parametrize("model", [CanonicalizationResult, AffineTransformation])
+def test_coerce_array_makes_exactly_one_copy(
+    model: type[CanonicalizationResult] | type[AffineTransformation],
+) -> None:
+    source = np.ones((500, 500))
+
+    with AllocationProfiler() as profiler:
+        with profiler.stage("coerce"):
+            coerced = model.coerce_array(source)
+
+    statistics = _statistics(profiler, "coerce")
+    assert not np.shares_memory(coerced, source)
+    assert statistics.peak_bytes <= source.nbytes + COERCE_OVERHEAD_BUDGET
+
+
+def test_json_export_lists_every_stage() -> None:
+    with AllocationProfiler() as profiler:
+        _profiled(profiler).canonize("x**2 + y**2 + z**2 = 1")
+
+    exported = profiler.to_dict()
+
+    assert exported["unit"] == "bytes"
+    assert set(exported["stages"]) == {AllocationStage.CANONIZE, AllocationStage.BUILD_RESULT}
+    assert exported["stages"]["canonize"]["calls"] == 1
+    profiler.reset()
+    assert profiler.to_dict()["stages"] == {}
@@ -0,0 +1,66 @@
+"""Verify the binary result archive with ``python -m pytest tests/test_archive.py -q``."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.numerical.archive import (
+    HEADER_SIZE,
+    RECORD_DTYPE,
+    ArchiveFormatError,
+    ArchiveReader,
+    ArchiveWriter,
+    write_archive,
+)
+from src.numerical.canonicalize import canonize_quadric
+from src.numerical.models import QuadricType
+from src.numerical.result_table import ResultTable
+
+EQUATIONS = ("x**2 + y**2 + z**2 = 1", "x**2 + y**2 = z", "x**2 + 2*y**2 + 3*z**2 = 4", "x**2 - y**2 = 1")
+
+
+def test_archive_round_trips_results_through_a_memory_map(tmp_path: Path) -> None:
+    path = tmp_path / "results.qarc"
+    results = [canonize_quadric(equation) for equation in EQUATIONS]
+
+    assert write_archive(path, results[:2]) == 2
+    assert write_archive(path, ResultTable.from_results(results[2:])) == 4
+
+    with ArchiveReader(path) as reader:
+        assert isinstance(reader.records, np.memmap)
+        assert len(reader) == 4
+        for index, expected in enumerate(results):
+            row = reader.row(index)
+            assert row.quadric_type is expected.quadric_type
+            assert row.centered == expected.centered
+            np.testing.assert_array_equal(row.middle_matrix, expected.middle_matrix)
+            np.testing.assert_array_equal(row.final_matrix, expected.final_matrix)
+            np.testing.assert_array_equal(row.rotation_matrix, expected.rotation_matrix)
+            np.testing.assert_array_equal(row.translation_vector, expected.translation_vector)
+        assert reader.of_type(QuadricType.REAL_ELLIPSOID).source_indices.tolist() == [0, 2]
+        np.testing.assert_array_equal(reader.table().initial_matrices[3], results[3].initial_matrix)
+
+
+def test_torn_trailing_record_is_ignored_and_overwritten(tmp_path: Path) -> None:
+    path = tmp_path / "results.qarc"
+    write_archive(path, [canonize_quadric(EQUATIONS[0])])
+    with open(path, "ab") as file:
+        file.write(b"\1" * (RECORD_DTYPE.itemsize // 2))
+
+    assert len(ArchiveReader(path)) == 1
+    with ArchiveWriter(path, chunk_records=1) as writer:
+        writer.append(canonize_quadric(EQUATIONS[1]))
+
+    assert path.stat().st_size == HEADER_SIZE + 2 * RECORD_DTYPE.itemsize
+    assert ArchiveReader(path).row(1).quadric_type is canonize_quadric(EQUATIONS[1]).quadric_type
+
+
+def test_foreign_files_are_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "results.qarc"
+    path.write_bytes(b"not an archive".ljust(HEADER_SIZE, b"\0"))
+
+    with pytest.raises(ArchiveFormatError, match="not a result archive"):
+        ArchiveReader(path)
+    with pytest.raises(ArchiveFormatError):
+        ArchiveWriter(path)
@@ -0,0 +1,82 @@
+"""Verify the benchmark suite helpers with ``python -m pytest tests/test_benchmarks.py -q``."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmarks.suite import compare, corpora, latency_summary, main, run
+from src import classify
+from src.numerical.models import QuadricType
+
+
+def test_corpora_are_deterministic_and_classify_to_their_type() -> None:
+    generated = corpora(4, seed=7)
+
+    assert generated == corpora(4, seed=7)
+    assert generated != corpora(4, seed=8)
+    assert set(generated) == set(QuadricType)
+    for quadric_type, equations in generated.items():
+        assert [classify(equation) for equation in equations] == [quadric_type] * 4
+
+
+def test_latency_summary_reports_throughput_and_percentiles() -> None:
+    summary = latency_summary([1e-6 * value for value in range(1, 101)])
+
+    assert summary["count"] == 100
+    assert summary["throughput"] == pytest.approx(100 / 5050e-6)
+    assert summary["p50_us"] == pytest.approx(50.5)
+    assert summary["p99_us"] == pytest.approx(99.01)
+
+
+def test_compare_flags_only_slowdowns_beyond_the_threshold() -> None:
+    baseline = {"cases": {"parse": {"real_cone": {"p50_us": 100.0}, "double_plane": {"p50_us": 100.0}}}}
+    report = {
+        "cases": {
+            "parse": {
+                "real_cone": {"p50_us": 130.0},
+                "double_plane": {"p50_us": 120.0},
+                "real_ellipsoid": {"p50_us": 1.0},
+            },
+            "classify": {"real_cone": {"p50_us": 500.0}},
+        }
+    }
+
+    regressions = compare(report, baseline, threshold=0.25)
+
+    assert [(regression.case, regression.quadric_type) for regression in regressions] == [("parse", "real_cone")]
+    assert regressions[0].ratio == pytest.approx(1.3)
+    with pytest.raises(ValueError, match="non-negative"):
+        compare(report, baseline, threshold=-0.1)
+
+
+def test_run_covers_every_type_and_only_renderable_surfaces() -> None:
+    report = run(size=2, repeat=1, cases=("classify", "surface_spec"))
+
+    assert set(report["cases"]) == {"classify", "surface_spec"}
+    assert len(report["cases"]["classify"]) == len(QuadricType)
+    assert QuadricType.REAL_ELLIPSOID.slug in report["cases"]["surface_spec"]
+    assert QuadricType.COMPLEX_ELLIPSOID.slug not in report["cases"]["surface_spec"]
+    with pytest.raises(ValueError, match="unknown benchmark cases"):
+        run(size=1, cases=("render",))
+
+
+def test_cli_writes_json_and_fails_on_regression_without_manim(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setitem(sys.modules, "manim", None)
+    output = tmp_path / "report.json"
+    arguments = ["--size", "2", "--repeat", "1", "--cases", "render_plan", "--output", str(output)]
+
+    assert main(arguments) == 0
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert set(report["cases"]) == {"render_plan"}
+    assert len(report["cases"]["render_plan"]) == len(QuadricType)
+
+    faster = {"cases": {"render_plan": {slug: {"p50_us": 1e-6} for slug in report["cases"]["render_plan"]}}}
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(faster), encoding="utf-8")
+
+    assert main([*arguments, "--baseline", str(baseline)]) == 1
+    assert "regression: render_plan" in capsys.readouterr().err
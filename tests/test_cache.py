@@ -0,0 +1,99 @@
+"""Verify the canonicalization cache with ``python -m pytest tests/test_cache.py -q``."""
+
+import numpy as np
+import pytest
+
+from src.numerical.cache import CanonicalizationCache
+from src.numerical.canonicalize import QuadricCanonicalizer
+from src.numerical.classifier import QuadricClassifier
+from src.numerical.parser import QuadricParser
+
+
+def _cached_canonicalizer(maxsize: int = 8) -> QuadricCanonicalizer:
+    return QuadricCanonicalizer(
+        QuadricParser(),
+        QuadricClassifier(tolerance=1e-10),
+        cache=CanonicalizationCache(maxsize=maxsize),
+    )
+
+
+def test_repeated_text_is_answered_by_the_first_level() -> None:
+    canonicalizer = _cached_canonicalizer()
+
+    first = canonicalizer.canonize("x**2 + 2*y**2 - z = 3")
+    second = canonicalizer.canonize("x**2+2*y**2 -z=3")
+
+    assert second is first
+    assert canonicalizer.cache is not None
+    statistics = canonicalizer.cache.statistics
+    assert (statistics.hits, statistics.scaled_hits, statistics.misses) == (1, 0, 1)
+
+
+def test_scalar_multiple_rescales_the_cached_stage_matrices() -> None:
+    canonicalizer = _cached_canonicalizer()
+    uncached = QuadricCanonicalizer(QuadricParser(), QuadricClassifier(tolerance=1e-10))
+    equation = "2*x**2 - y**2 + 4*x*z + 3*y - z = 5"
+    scaled_equation = "6*x**2 - 3*y**2 + 12*x*z + 9*y - 3*z = 15"
+
+    canonicalizer.canonize(equation)
+    scaled = canonicalizer.canonize(scaled_equation)
+    expected = uncached.canonize(scaled_equation)
+
+    assert canonicalizer.cache is not None
+    assert canonicalizer.cache.statistics.scaled_hits == 1
+    assert scaled.quadric_type is expected.quadric_type
+    for actual, reference in (
+        (scaled.initial_matrix, expected.initial_matrix),
+        (scaled.middle_matrix, expected.middle_matrix),
+        (scaled.final_matrix, expected.final_matrix),
+        (scaled.rotation_matrix, expected.rotation_matrix),
+        (scaled.translation_vector, expected.translation_vector),
+    ):
+        np.testing.assert_allclose(actual, reference, atol=1e-12, rtol=1e-12)
+
+
+def test_near_miss_inside_one_key_is_recomputed() -> None:
+    canonicalizer = _cached_canonicalizer()
+    uncached = QuadricCanonicalizer(QuadricParser(), QuadricClassifier(tolerance=1e-10))
+    perturbed = "x**2 + y**2 + 0.0000000000001 = 0"
+
+    canonicalizer.canonize("x**2 + y**2 = 0")
+    result = canonicalizer.canonize(perturbed)
+
+    assert canonicalizer.cache is not None
+    assert canonicalizer.cache.statistics.scaled_hits == 0
+    assert result.quadric_type is uncached.canonize(perturbed).quadric_type
+    assert result.final_matrix[3, 3] != 0.0
+
+
+def test_negative_multiple_is_a_different_quadric() -> None:
+    canonicalizer = _cached_canonicalizer()
+
+    canonicalizer.canonize("x**2 + y**2 + z**2 = 1")
+    canonicalizer.canonize("-x**2 - y**2 - z**2 = -1")
+
+    assert canonicalizer.cache is not None
+    assert canonicalizer.cache.statistics.misses == 2
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    canonicalizer = _cached_canonicalizer(maxsize=2)
+    assert canonicalizer.cache is not None
+
+    for constant in (1, 2, 3):
+        canonicalizer.canonize(f"x**2 + y**2 + z**2 = {constant}")
+    canonicalizer.canonize("x**2 + y**2 + z**2 = 1")
+
+    statistics = canonicalizer.cache.statistics
+    assert statistics.evictions == 4
+    assert statistics.misses == 4
+    assert statistics.size == 4
+    canonicalizer.cache.clear()
+    assert canonicalizer.cache.statistics.size == 0
+
+
+def test_cache_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="maxsize"):
+        CanonicalizationCache(maxsize=0)
+    with pytest.raises(ValueError, match="quantum"):
+        CanonicalizationCache(quantum=0.0)
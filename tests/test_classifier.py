@@ -1,9 +1,26 @@
 """Verify classifier branches with ``python -m pytest tests/test_classifier.py -q``."""
 
+from typing import Callable
+
+import numpy as np
 import pytest
+from scipy.spatial.transform import Rotation
 
-from src.numerical.classifier import expr2classification
-from src.numerical.models import QuadricType
+from src.numerical.canonicalize import canonize_quadric
+from src.numerical.characteristic_invariants import CharacteristicInvariants
+from src.numerical.classifier import (
+    UNCLASSIFIED,
+    NotAQuadricError,
+    QuadricClassifier,
+    classify,
+    classify_many,
+    expr2classification,
+)
+from src.numerical.invariants import QuadricInvariants
+from src.numerical.models import ClassificationStrategy, QuadricType
+from src.numerical.numerical_helpers import numerical_rank
+from src.numerical.parser import QuadricParser
+from src.numerical.symmetric_eigen import eigh3
 
 
 @pytest.mark.parametrize(
@@ -28,5 +45,178 @@ from src.numerical.models import QuadricType
         ("x**2 = 0", QuadricType.DOUBLE_PLANE),
     ],
 )
-def test_classifier_covers_all_quadric_types(equation: str, expected: QuadricType) -> None:
-    assert expr2classification(equation) is expected
+@pytest.mark.parametrize("strategy", list(ClassificationStrategy))
+def test_classifier_covers_all_quadric_types(
+    equation: str, expected: QuadricType, strategy: ClassificationStrategy
+) -> None:
+    assert expr2classification(equation, strategy) is expected
+
+
+@pytest.mark.parametrize(
+    "equation",
+    ["x**2 + 2*y**2 - 3*z**2 = 1", "x**2 + y**2 - z = 0", "x**2 - y**2 = 0", "(x + y - z)**2 = 4", "x**2 = 0"],
+)
+def test_shared_invariants_match_independent_decompositions(equation: str) -> None:
+    matrices = QuadricParser().parse_matrices(equation)
+    invariants = QuadricInvariants.from_matrices(matrices.quadratic, matrices.homogeneous)
+    scale = float(np.max(np.abs(matrices.homogeneous)))
+
+    assert invariants.rank_quadratic == numerical_rank(matrices.quadratic / scale, 100.0)
+    assert invariants.rank_homogeneous == numerical_rank(matrices.homogeneous / scale, 100.0)
+    expected_sign = np.linalg.slogdet(matrices.homogeneous)[0] if invariants.rank_homogeneous == 4 else 0.0
+    assert invariants.determinant_sign == expected_sign
+    assert invariants.inertia == QuadricClassifier(tolerance=1e-10).inertia(matrices.quadratic)
+
+
+@pytest.mark.parametrize("equation", ["x**2 + y**2 + z**2 = 1", "x**2 - y = 0", "x**2 + y**2 = 1"])
+def test_canonicalization_runs_each_decomposition_once(equation: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: dict[str, int] = {}
+
+    def counted(name: str, original: Callable[..., object]) -> Callable[..., object]:
+        def wrapper(*args: object, **kwargs: object) -> object:
+            calls[name] = calls.get(name, 0) + 1
+            return original(*args, **kwargs)
+
+        return wrapper
+
+    for name in ("eigh", "eigvalsh", "svd", "matrix_rank", "pinv", "slogdet"):
+        monkeypatch.setattr(np.linalg, name, counted(name, getattr(np.linalg, name)))
+    for module in ("canonicalize", "invariants", "parabolic_cylinder"):
+        monkeypatch.setattr(f"src.numerical.{module}.eigh3", counted("eigh3", eigh3))
+
+    canonize_quadric(equation)
+
+    assert calls.get("eigh3") == 1
+    assert calls.get("eigvalsh") == 1
+    assert "eigh" not in calls
+    assert not {"svd", "matrix_rank", "pinv", "slogdet"} & calls.keys()
+
+
+def test_classify_many_matches_the_scalar_decision_table() -> None:
+    rng = np.random.default_rng(7)
+    homogeneous = rng.normal(size=(400, 4, 4))
+    homogeneous = homogeneous + homogeneous.transpose(0, 2, 1)
+    for index in range(200):
+        rank = int(rng.integers(1, 4))
+        factors = rng.normal(size=(4, rank))
+        homogeneous[index] = (factors * rng.choice([-1.0, 1.0], rank)) @ factors.T
+    for index in range(200, 300):
+        homogeneous[index, :3, :3] = np.diag(rng.choice([-1.0, 0.0, 1.0], 3))
+        homogeneous[index, :3, 3] = homogeneous[index, 3, :3] = rng.choice([-1.0, 0.0, 1.0], 3)
+    homogeneous[300] = 0.0
+    quadratic = homogeneous[:, :3, :3].copy()
+    classifier = QuadricClassifier(tolerance=1e-10)
+
+    batch = classifier.classify_many(quadratic, homogeneous)
+
+    expected = []
+    for quadratic_block, homogeneous_matrix in zip(quadratic, homogeneous):
+        try:
+            expected.append(int(classifier.classify(quadratic_block, homogeneous_matrix)))
+        except NotAQuadricError:
+            expected.append(UNCLASSIFIED)
+    assert batch.dtype == np.int8
+    np.testing.assert_array_equal(batch, np.array(expected, dtype=np.int8))
+    assert batch[300] == UNCLASSIFIED
+
+
+def _rigid_motions_of_diagonal_forms(count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    matrices = np.empty((count, 4, 4))
+    for index in range(count):
+        canonical = np.zeros((4, 4))
+        canonical[:3, :3] = np.diag(rng.choice([-1.0, 0.0, 1.0], 3) * rng.uniform(0.5, 3.0, 3))
+        canonical[3, 3] = rng.choice([-1.0, 0.0, 1.0])
+        if rng.random() < 0.3:
+            canonical[1, 3] = canonical[3, 1] = rng.choice([-1.0, 1.0])
+        motion = np.eye(4)
+        motion[:3, :3] = Rotation.random(random_state=rng).as_matrix()
+        motion[:3, 3] = rng.normal(size=3)
+        matrices[index] = motion.T @ canonical @ motion
+    return matrices
+
+
+def test_characteristic_strategy_matches_the_spectral_decision_table() -> None:
+    homogeneous = _rigid_motions_of_diagonal_forms(600, seed=19)
+    quadratic = homogeneous[:, :3, :3].copy()
+    classifier = QuadricClassifier(tolerance=1e-10)
+
+    spectral = classifier.classify_many(quadratic, homogeneous)
+    characteristic = classifier.classify_many(quadratic, homogeneous, ClassificationStrategy.CHARACTERISTIC)
+
+    np.testing.assert_array_equal(characteristic, spectral)
+    for index in range(0, 600, 7):
+        try:
+            expected = int(
+                classifier.classify(quadratic[index], homogeneous[index], ClassificationStrategy.CHARACTERISTIC)
+            )
+        except NotAQuadricError:
+            expected = UNCLASSIFIED
+        assert characteristic[index] == expected
+
+
+def test_characteristic_strategy_makes_no_eigen_or_svd_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    def forbidden(*args: object, **kwargs: object) -> object:
+        raise AssertionError("eigen or SVD call in characteristic classification")
+
+    for name in ("eigh", "eigvalsh", "eig", "eigvals", "svd", "matrix_rank", "pinv"):
+        monkeypatch.setattr(np.linalg, name, forbidden)
+    for target in ("invariants.eigh3", "invariants.batch_eigh3", "classifier.eigvalsh3"):
+        monkeypatch.setattr(f"src.numerical.{target}", forbidden)
+    homogeneous = _rigid_motions_of_diagonal_forms(50, seed=23)
+    classifier = QuadricClassifier(tolerance=1e-10)
+
+    classifier.classify_many(homogeneous[:, :3, :3], homogeneous, ClassificationStrategy.CHARACTERISTIC)
+    classifier.classify(homogeneous[0, :3, :3], homogeneous[0], ClassificationStrategy.CHARACTERISTIC)
+
+
+@pytest.mark.parametrize(
+    "equation", ["x**2 + 2*y**2 - 3*z**2 = 1", "(x - 1)**2 + 4*(y + z)**2 = 9", "(x + y - z)**2 = 4"]
+)
+def test_characteristic_invariants_match_the_spectral_invariants(equation: str) -> None:
+    matrices = QuadricParser().parse_matrices(equation)
+    spectral = QuadricInvariants.from_matrices(matrices.quadratic, matrices.homogeneous)
+    characteristic = CharacteristicInvariants.from_matrices(matrices.quadratic, matrices.homogeneous)
+
+    assert characteristic.rank_quadratic == spectral.rank_quadratic
+    assert characteristic.rank_homogeneous == spectral.rank_homogeneous
+    assert characteristic.determinant_sign == spectral.determinant_sign
+    assert characteristic.inertia == spectral.inertia
+    assert characteristic.reduced_constant == pytest.approx(spectral.reduced_constant, rel=1e-12, abs=1e-12)
+
+
+def test_classify_accepts_equations_coefficients_and_matrices() -> None:
+    coefficients = [1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0]
+
+    assert classify("x**2 + y**2 = 1") is QuadricType.REAL_ELLIPTIC_CYLINDER
+    assert classify(coefficients) is QuadricType.REAL_ELLIPTIC_CYLINDER
+    assert classify(np.diag([1.0, 1.0, 0.0, -1.0]), ClassificationStrategy.CHARACTERISTIC) is (
+        QuadricType.REAL_ELLIPTIC_CYLINDER
+    )
+    with pytest.raises(ValueError, match="4x4"):
+        classify(np.eye(3))
+    with pytest.raises(ValueError, match="degree two"):
+        classify("x + y = 1")
+    with pytest.raises(NotAQuadricError):
+        classify(np.diag([0.0, 0.0, 0.0, 1.0]))
+
+
+def test_classify_many_matches_canonicalization_and_flags_bad_rows() -> None:
+    equations = ["x**2 + y**2 + z**2 = 1", "x**2 - y = 0", "x = = 1", "x + y = 1", "x**2 = 0"]
+
+    codes = classify_many(equations)
+
+    assert codes.dtype == np.int8
+    assert codes.tolist() == [
+        canonize_quadric(equations[0]).quadric_type,
+        canonize_quadric(equations[1]).quadric_type,
+        UNCLASSIFIED,
+        UNCLASSIFIED,
+        QuadricType.DOUBLE_PLANE,
+    ]
+    matrices = np.stack([np.diag([1.0, 2.0, 3.0, -1.0]), np.diag([1.0, -1.0, 0.0, 0.0])])
+    np.testing.assert_array_equal(
+        classify_many(matrices, ClassificationStrategy.CHARACTERISTIC),
+        [QuadricType.REAL_ELLIPSOID, QuadricType.REAL_INTERSECTING_PLANES],
+    )
+    assert classify_many([]).shape == (0,)
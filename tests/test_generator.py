@@ -0,0 +1,73 @@
+"""Verify the random quadric generator with ``python -m pytest tests/test_generator.py -q``."""
+
+import numpy as np
+import pytest
+
+from src.numerical.classifier import classify_many
+from src.numerical.generator import CANONICAL_FORMS, generate_quadrics, random_rotations
+from src.numerical.models import ClassificationStrategy, QuadricType
+from src.numerical.parser import QuadricParser
+
+ALL_TYPES = np.repeat([int(quadric_type) for quadric_type in QuadricType], 40)
+
+
+def _evaluate(matrices: np.ndarray, points: np.ndarray) -> np.ndarray:
+    homogeneous = np.concatenate([points, np.ones((points.shape[0], 1))], axis=1)
+    return np.einsum("ni,nij,nj->n", homogeneous, matrices, homogeneous)
+
+
+def test_every_type_has_a_canonical_form() -> None:
+    assert set(CANONICAL_FORMS) == set(QuadricType)
+
+
+def test_rotations_are_proper_and_orthonormal() -> None:
+    rotations = random_rotations(500, np.random.default_rng(0))
+
+    assert np.allclose(rotations @ rotations.transpose(0, 2, 1), np.eye(3), atol=1e-12)
+    assert np.allclose(np.linalg.det(rotations), 1.0, atol=1e-12)
+
+
+@pytest.mark.parametrize("strategy", list(ClassificationStrategy))
+def test_generated_quadrics_classify_to_their_type(strategy: ClassificationStrategy) -> None:
+    samples = generate_quadrics(ALL_TYPES, rng=1)
+
+    assert len(samples) == ALL_TYPES.size
+    assert np.array_equal(samples.quadric_types, ALL_TYPES)
+    assert np.array_equal(classify_many(samples.homogeneous, strategy), ALL_TYPES)
+
+
+def test_samples_are_the_canonical_form_under_their_motion() -> None:
+    samples = generate_quadrics(ALL_TYPES, rng=2)
+    canonical_points = np.random.default_rng(3).normal(size=(len(samples), 3))
+    moved = np.einsum("nij,nj->ni", samples.rotations, canonical_points) + samples.translations
+
+    expected = samples.scales * _evaluate(samples.canonical_matrices, canonical_points)
+    assert np.allclose(_evaluate(samples.homogeneous, moved), expected, rtol=1e-9, atol=1e-9)
+
+
+def test_equations_parse_back_to_exactly_the_generated_matrices() -> None:
+    samples = generate_quadrics(ALL_TYPES, rng=4)
+
+    batch = QuadricParser().parse_many(samples.equations())
+
+    assert not np.any(batch.error_mask)
+    assert np.array_equal(batch.homogeneous, samples.homogeneous)
+    assert np.array_equal(samples.batch().homogeneous, samples.homogeneous)
+
+
+def test_seeds_make_samples_reproducible() -> None:
+    first = generate_quadrics(QuadricType.REAL_CONE, 8, rng=5)
+
+    assert np.array_equal(first.homogeneous, generate_quadrics(QuadricType.REAL_CONE, 8, rng=5).homogeneous)
+    assert not np.array_equal(first.homogeneous, generate_quadrics(QuadricType.REAL_CONE, 8, rng=6).homogeneous)
+
+
+def test_invalid_requests_are_rejected() -> None:
+    with pytest.raises(ValueError, match="size"):
+        generate_quadrics(QuadricType.REAL_CONE)
+    with pytest.raises(ValueError, match="size"):
+        generate_quadrics([QuadricType.REAL_CONE], size=2)
+    with pytest.raises(ValueError, match="QuadricType codes"):
+        generate_quadrics([0])
+    with pytest.raises(ValueError, match="positive"):
+        generate_quadrics(QuadricType.REAL_CONE, 1, coefficient_range=(0.0, 1.0))
@@ -0,0 +1,84 @@
+"""Verify lazy package imports with ``python -m pytest tests/test_imports.py -q``."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import src
+import src.numerical
+from src.numerical.models import QuadricType
+
+ROOT = Path(__file__).resolve().parents[1]
+# The numeric-only import must beat a cold SymPy and SciPy import in the same
+# interpreter: an eager layout pays at least that much, while the lazy one
+# takes about 40% of it. A relative budget holds on slow and fast machines.
+IMPORT_BUDGET_RATIO = 1.0
+NUMERIC_ONLY_SCRIPT = """
+import json, sys, time
+import numpy as np
+start = time.perf_counter()
+import src
+from src import canonize_matrix_many, canonize_quadric, classify_many
+elapsed = time.perf_counter() - start
+codes = classify_many(np.stack([np.diag([1.0, 1.0, 1.0, -1.0]), np.diag([1.0, 1.0, 0.0, -1.0])]))
+batch = canonize_matrix_many(np.stack([np.diag([1.0, 2.0, 3.0, -1.0])] * 2))
+result = canonize_quadric("x**2 + 2*y**2 - z = 0")
+loaded = [name for name in ("sympy", "scipy", "manim", "src.graphics") if name in sys.modules]
+start = time.perf_counter()
+import scipy.linalg, sympy
+heavy = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed, "heavy": heavy, "codes": codes.tolist(), "type": int(result.quadric_type), "loaded": loaded
+}))
+"""
+
+
+def _run(script: str) -> dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True, timeout=60
+    )
+    report: dict[str, Any] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return report
+
+
+def test_numeric_only_path_skips_sympy_scipy_and_graphics() -> None:
+    report = _run(NUMERIC_ONLY_SCRIPT)
+
+    assert report["loaded"] == []
+    assert report["codes"] == [QuadricType.REAL_ELLIPSOID, QuadricType.REAL_ELLIPTIC_CYLINDER]
+    assert report["type"] == QuadricType.ELLIPTIC_PARABOLOID
+
+
+def test_numeric_only_import_stays_within_the_time_budget() -> None:
+    reports = [_run(NUMERIC_ONLY_SCRIPT) for _ in range(3)]
+
+    fastest = min(float(report["elapsed"]) for report in reports)
+    heavy = min(float(report["heavy"]) for report in reports)
+    assert fastest < IMPORT_BUDGET_RATIO * heavy
+
+
+def test_symbolic_equation_loads_sympy_on_first_use() -> None:
+    report = _run(
+        "import json, sys\n"
+        "from src import canonize_quadric\n"
+        "result = canonize_quadric('x**2 + y**2 + z**2 = 1')\n"
+        "before = 'sympy' in sys.modules\n"
+        "result.final_equation\n"
+        "print(json.dumps({'before': before, 'after': 'sympy' in sys.modules}))\n"
+    )
+
+    assert report == {"before": False, "after": True}
+
+
+@pytest.mark.parametrize("package", [src, src.numerical])
+def test_lazy_exports_resolve_every_public_name(package: object) -> None:
+    for name in package.__all__:  # type: ignore[attr-defined]
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+    with pytest.raises(AttributeError, match="no_such_name"):
+        getattr(package, "no_such_name")
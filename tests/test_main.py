@@ -1,12 +1,14 @@
 """Verify application orchestration with ``python -m pytest tests/test_main.py -q``."""
 
+import io
+import json
 from pathlib import Path
 import sys
 
 import pytest
 
 from src.graphics.models import RenderSettings
-from src.main import ExampleCatalog, VideoRenderer
+from src.main import ExampleCatalog, VideoRenderer, main
 from src.numerical.canonicalize import canonize_quadric
 
 
@@ -22,3 +24,81 @@ def test_renderer_surfaces_missing_optional_dependency(monkeypatch: pytest.Monke
 
     with pytest.raises(RuntimeError, match="graphics"):
         renderer.render()
+
+
+def test_classify_subcommand_prints_one_slug_per_equation(capsys: pytest.CaptureFixture[str]) -> None:
+    status = main(["classify", "x**2 + y**2 + z**2 = 1", "x**2 - y = 0", "--strategy", "characteristic"])
+
+    assert status == 0
+    assert capsys.readouterr().out.splitlines() == ["real_ellipsoid", "parabolic_cylinder"]
+
+
+def test_classify_subcommand_reads_files_and_reports_failures(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    source = tmp_path / "equations.txt"
+    source.write_text("x**2 = 1\n\nx + y = 1\n")
+
+    status = main(["classify", "--input", str(source)])
+
+    assert status == 1
+    assert capsys.readouterr().out.splitlines() == ["real_parallel_planes", "unclassified"]
+
+
+def test_batch_subcommand_streams_json_lines_without_manim(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    monkeypatch.setitem(sys.modules, "manim", None)
+    source = tmp_path / "equations.jsonl"
+    source.write_text('x**2 + y**2 + z**2 = 1\n\n{"equation": "x + y = 1"}\n{"equation": "x**2 - y = 0"}\n')
+
+    status = main(["batch", "--input", str(source)])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert status == 1
+    assert [record["index"] for record in records] == [0, 1, 2]
+    assert [record["quadric_type"] for record in records] == ["real_ellipsoid", None, "parabolic_cylinder"]
+    assert records[1]["error"]["type"] == "ValueError"
+    expected = canonize_quadric("x**2 - y = 0")
+    assert records[2]["error"] is None
+    assert records[2]["rotation_matrix"] == expected.rotation_matrix.tolist()
+    assert records[2]["translation_vector"] == expected.translation_vector.tolist()
+    assert records[2]["final_matrix"] == expected.final_matrix.tolist()
+    assert "src.graphics.scene_render" not in sys.modules
+
+
+def test_batch_subcommand_matches_serial_output_with_workers(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    equations = [example.equation for example in ExampleCatalog.examples]
+    monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(equations)))
+    serial = tmp_path / "serial.jsonl"
+    parallel = tmp_path / "parallel.jsonl"
+
+    assert main(["batch", "--output", str(serial)]) == 0
+    monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(equations)))
+    assert main(["batch", "--output", str(parallel), "--workers", "2", "--chunksize", "3"]) == 0
+
+    assert parallel.read_text() == serial.read_text()
+    assert [json.loads(line)["equation"] for line in serial.read_text().splitlines()] == equations
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("workers", ("1", "2"))
+def test_batch_subcommand_reports_malformed_lines_and_keeps_going(
+    workers: str, capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    source = tmp_path / "equations.jsonl"
+    source.write_text('x + y = 1\n{"equation": 3}\n{bad\nx**2 = 1\n')
+
+    status = main(["batch", "--input", str(source), "--workers", workers])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert status == 1
+    assert [record["index"] for record in records] == [0, 1, 2, 3]
+    assert [record["quadric_type"] for record in records] == [None, None, None, "real_parallel_planes"]
+    assert [record["error"]["type"] for record in records[:3]] == ["ValueError", "ValueError", "JSONDecodeError"]
+    assert "line 2" in records[1]["error"]["message"]
+    assert records[2]["equation"] == "{bad"
+    assert len({tuple(record) for record in records}) == 1
+    assert records[0]["final_matrix"] is None
@@ -5,7 +5,18 @@ import pytest
 import sympy as sp
 from pydantic import ValidationError
 
-from src.numerical.models import CanonicalizationResult, QuadricMatrices, QuadricType
+from src.numerical.canonicalize import QuadricCanonicalizer, canonize_quadric
+from src.numerical.classifier import QuadricClassifier
+from src.numerical.models import (
+    CanonicalizationResult,
+    QuadricMatrices,
+    QuadricMatrixBatch,
+    QuadricType,
+    ValidationMode,
+)
+from src.numerical.parser import QuadricParser
+from src.numerical.quadric_polynomial import QuadricPolynomial
+from src.numerical.result_table import ResultTable
 
 
 def test_quadric_matrices_reject_invalid_shapes() -> None:
@@ -46,3 +57,96 @@ def test_result_rejects_invalid_rotation_shape() -> None:
             middle_equation=sp.sympify("x**2"),
             final_equation=sp.sympify("x**2"),
         )
+
+
+def test_result_builds_each_equation_once_and_only_on_access(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[QuadricPolynomial] = []
+    build_expression = QuadricPolynomial.to_sympy
+
+    def counting_to_sympy(polynomial: QuadricPolynomial) -> sp.Expr:
+        calls.append(polynomial)
+        return build_expression(polynomial)
+
+    monkeypatch.setattr(QuadricPolynomial, "to_sympy", counting_to_sympy)
+    result = canonize_quadric("x**2 + 2*y**2 + 3*z**2 - 4*x = 1")
+
+    assert result.final_matrix.shape == (4, 4)
+    assert calls == []
+    assert result.final_equation == result["final quadric equation"]
+    assert len(calls) == 1
+    assert result.initial_equation.coeff(sp.Symbol("x"), 1) == -4
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("validation", tuple(ValidationMode))
+def test_every_validation_mode_returns_the_same_result(validation: ValidationMode) -> None:
+    equation = "2*x**2 - y**2 + 4*x*z + 3*y - z = 5"
+    canonicalizer = QuadricCanonicalizer(
+        QuadricParser(), QuadricClassifier(tolerance=1e-10), validation=validation, sample_rate=0.5, seed=7
+    )
+
+    result = canonicalizer.canonize(equation)
+    reference = canonize_quadric(equation)
+
+    assert result.quadric_type is reference.quadric_type
+    np.testing.assert_array_equal(result.final_matrix, reference.final_matrix)
+    np.testing.assert_array_equal(result.rotation_matrix, reference.rotation_matrix)
+    assert result.final_matrix.flags.writeable is False
+    assert result.final_equation == reference.final_equation
+
+
+def test_trusted_result_skips_validation_and_does_not_copy() -> None:
+    rotation = np.eye(4)
+
+    result = CanonicalizationResult.trusted(
+        quadric_type=QuadricType.REAL_ELLIPSOID,
+        centered=True,
+        initial_matrix=np.eye(4),
+        middle_matrix=np.eye(4),
+        final_matrix=np.eye(4),
+        translation_vector=np.zeros((3, 1)),
+        rotation_matrix=rotation,
+    )
+
+    assert result.rotation_matrix is rotation
+    assert rotation.flags.writeable is False
+    assert result.translation_vector.shape == (3,)
+
+
+def test_sampled_validation_rate_is_bounded() -> None:
+    with pytest.raises(ValueError, match="sample_rate"):
+        QuadricCanonicalizer(QuadricParser(), QuadricClassifier(tolerance=1e-10), sample_rate=1.5)
+
+
+def test_result_table_filters_slices_and_materializes_rows() -> None:
+    equations = ["x**2 + y**2 + z**2 = 1", "x**2 + y**2 = z", "x**2 + 2*y**2 + 3*z**2 = 4", "x**2 - y**2 = 1"]
+    results = [canonize_quadric(equation) for equation in equations]
+
+    table = ResultTable.from_results(results)
+    ellipsoids = table.of_type(QuadricType.REAL_ELLIPSOID)
+
+    assert len(table) == 4
+    assert table.nbytes < 500 * len(table)
+    assert ellipsoids.source_indices.tolist() == [0, 2]
+    assert table.type_counts()[QuadricType.REAL_ELLIPSOID] == 2
+    assert np.shares_memory(table[1:3].final_matrices, table.final_matrices)
+    row = ellipsoids.row(-1)
+    assert row.quadric_type is results[2].quadric_type
+    np.testing.assert_array_equal(row.final_matrix, results[2].final_matrix)
+    np.testing.assert_array_equal(row.rotation_matrix, results[2].rotation_matrix)
+    with pytest.raises(IndexError):
+        table.row(4)
+
+
+def test_result_table_from_batch_keeps_successful_rows() -> None:
+    canonicalizer = QuadricCanonicalizer(QuadricParser(), QuadricClassifier(tolerance=1e-10))
+    batch = canonicalizer.canonize_many(
+        QuadricMatrixBatch.from_homogeneous(np.stack([np.diag([1.0, 1.0, 1.0, -1.0]), np.diag([0.0, 0.0, 0.0, 1.0])]))
+    )
+
+    table = ResultTable.from_batch(batch)
+    joined = ResultTable.concatenate([table, table])
+
+    assert table.source_indices.tolist() == [0]
+    assert len(joined) == 2
+    np.testing.assert_array_equal(joined.row(1).final_matrix, batch.final_matrices[0])
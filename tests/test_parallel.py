@@ -0,0 +1,69 @@
+"""Verify parallel canonicalization with ``python -m pytest tests/test_parallel.py -q``."""
+
+from collections.abc import Iterator
+from itertools import cycle, islice
+
+import numpy as np
+import pytest
+
+from src.numerical.canonicalize import canonize_quadric
+from src.numerical.models import CanonicalizationResult
+from src.numerical.parallel import (
+    IN_FLIGHT_CHUNKS_PER_WORKER,
+    CanonicalizationFailure,
+    canonize_parallel,
+    iter_canonize_parallel,
+)
+
+
+_EQUATIONS = (
+    "x**2 + y**2 + z**2 = 1",
+    "x + y = 1",
+    "x**2 - y**2 + 2*z = 0",
+    "x**2 + y**2 = 1 = 2",
+    "x**2 + y**2 - 2*x*y - 4*x - 4*y - 4*z + 4 = 0",
+)
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_parallel_results_keep_input_order_and_capture_failures(workers: int) -> None:
+    outcomes = canonize_parallel(_EQUATIONS, workers=workers, chunksize=2)
+
+    assert len(outcomes) == len(_EQUATIONS)
+    for index, (equation, outcome) in enumerate(zip(_EQUATIONS, outcomes)):
+        if index in (1, 3):
+            assert isinstance(outcome, CanonicalizationFailure)
+            assert outcome.index == index
+            assert outcome.equation == equation
+            assert outcome.error_type == "ValueError"
+            continue
+        assert isinstance(outcome, CanonicalizationResult)
+        expected = canonize_quadric(equation)
+        assert outcome.quadric_type is expected.quadric_type
+        np.testing.assert_array_equal(outcome.final_matrix, expected.final_matrix)
+        np.testing.assert_array_equal(outcome.rotation_matrix, expected.rotation_matrix)
+        assert outcome.final_matrix.flags.writeable is False
+
+
+def test_parallel_rejects_invalid_pool_settings() -> None:
+    with pytest.raises(ValueError, match="chunksize"):
+        canonize_parallel(_EQUATIONS, workers=1, chunksize=0)
+    with pytest.raises(ValueError, match="workers"):
+        canonize_parallel(_EQUATIONS, workers=0)
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_streaming_reads_only_the_chunks_in_flight(workers: int) -> None:
+    consumed = 0
+
+    def endless() -> Iterator[str]:
+        nonlocal consumed
+        for equation in cycle(_EQUATIONS):
+            consumed += 1
+            yield equation
+
+    outcomes = list(islice(iter_canonize_parallel(endless(), workers=workers, chunksize=2), 7))
+
+    failed = [isinstance(outcome, CanonicalizationFailure) for outcome in outcomes]
+    assert failed == [False, True, False, True, False, False, True]
+    assert consumed <= 2 * (IN_FLIGHT_CHUNKS_PER_WORKER * workers + 4)
@@ -19,3 +19,73 @@ def test_parser_builds_symmetric_homogeneous_matrix() -> None:
 def test_parser_rejects_non_quadric_equations(equation: str) -> None:
     with pytest.raises(ValueError):
         QuadricParser().parse(equation)
+
+
+@pytest.mark.parametrize(
+    "equation",
+    [
+        "2x**2 + 2*y**2 + 4z**2 - 2xy + 2x = 0",
+        "2*(x-1)**2 + 3*(y+2)**2 + 4*(z-3)**2 = 1",
+        "(x-1)(y+2) = 0",
+        "2/3x**2 = 1/3",
+        "-x**2 = 1",
+        ".5x**2 = 1e-3",
+        "(x + y + z)**2 = 0",
+        "2**2x**2 = 1",
+        "1.00000000005*x**2 + y**2 = 1",
+    ],
+)
+def test_fast_parser_matches_sympy_matrices(equation: str) -> None:
+    parser = QuadricParser()
+
+    fast = parser.parse_matrices(equation)
+    reference = parser.matrices_from_polynomial(parser.parse(equation))
+
+    np.testing.assert_array_equal(fast.homogeneous, reference.homogeneous)
+    np.testing.assert_array_equal(fast.quadratic, reference.quadratic)
+    np.testing.assert_array_equal(fast.linear, reference.linear)
+
+
+@pytest.mark.parametrize("equation", ["x**2 + y**2", "x + y = 0", "x**3 = 1", "x**2 + w = 0"])
+def test_fast_parser_raises_the_sympy_errors(equation: str) -> None:
+    with pytest.raises(ValueError) as reference:
+        QuadricParser().parse(equation)
+    with pytest.raises(ValueError) as fast:
+        QuadricParser().parse_matrices(equation)
+
+    assert str(fast.value) == str(reference.value)
+
+
+def test_unsupported_syntax_falls_back_to_sympy() -> None:
+    matrices = QuadricParser().parse_matrices("x**-1*x**3 + sqrt(4)*y**2 = 1")
+
+    np.testing.assert_allclose(np.diag(matrices.homogeneous), np.array([1.0, 2.0, 0.0, -1.0]))
+
+
+def test_out_of_range_literals_fall_back_to_sympy_and_fail_validation() -> None:
+    equation = "1e400*x**2 + y**2 + z**2 = 1"
+
+    np.testing.assert_array_equal(QuadricParser().coefficients(equation)[:2], [np.inf, 1.0])
+    with pytest.raises(ValueError, match="finite"):
+        QuadricParser().parse_matrices(equation)
+
+
+def test_parse_many_stacks_contiguous_matrices_and_reports_row_errors() -> None:
+    equations = ["x**2 + y**2 + z**2 = 1", "x + y = 0", "(x-1)(y+2) = 0", "x**2 = ("]
+    parser = QuadricParser()
+
+    batch = parser.parse_many(equations)
+
+    assert batch.homogeneous.shape == (4, 4, 4)
+    assert batch.quadratic.shape == (4, 3, 3)
+    assert batch.linear.shape == (4, 3, 1)
+    for stack in (batch.homogeneous, batch.quadratic, batch.linear):
+        assert stack.dtype == np.float64
+        assert stack.flags.c_contiguous
+    np.testing.assert_array_equal(batch.error_mask, np.array([False, True, False, True]))
+    assert batch.errors[0] is None and batch.errors[2] is None
+    assert "degree two" in str(batch.errors[1])
+    np.testing.assert_array_equal(batch.homogeneous[1], np.zeros((4, 4)))
+    for index in (0, 2):
+        np.testing.assert_array_equal(batch.homogeneous[index], parser.parse_matrices(equations[index]).homogeneous)
+        np.testing.assert_array_equal(batch.linear[index], parser.parse_matrices(equations[index]).linear)
@@ -0,0 +1,116 @@
+"""Verify the SQLite result cache with ``python -m pytest tests/test_persistent_cache.py -q``."""
+
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.numerical import persistent_cache
+from src.numerical.canonicalize import QuadricCanonicalizer
+from src.numerical.classifier import QuadricClassifier
+from src.numerical.models import QuadricMatrices
+from src.numerical.parser import QuadricParser
+from src.numerical.persistent_cache import PersistentCanonicalizationCache
+
+
+def _cached_canonicalizer(cache: PersistentCanonicalizationCache) -> QuadricCanonicalizer:
+    return QuadricCanonicalizer(QuadricParser(), QuadricClassifier(tolerance=1e-10), cache=cache)
+
+
+def test_results_survive_reopening_the_database(tmp_path: Path) -> None:
+    path = tmp_path / "results.sqlite"
+    equation = "x**2 + 2*y**2 - z**2 + 4*x = 3"
+    with PersistentCanonicalizationCache(path) as cache:
+        expected = _cached_canonicalizer(cache).canonize(equation)
+
+    with PersistentCanonicalizationCache(path) as cache:
+        stored = _cached_canonicalizer(cache).canonize("x**2+2*y**2 - z**2+4*x=3")
+        assert cache.statistics.hits == 1
+
+    assert stored.quadric_type is expected.quadric_type
+    assert stored.centered == expected.centered
+    for actual, reference in (
+        (stored.initial_matrix, expected.initial_matrix),
+        (stored.middle_matrix, expected.middle_matrix),
+        (stored.final_matrix, expected.final_matrix),
+        (stored.rotation_matrix, expected.rotation_matrix),
+        (stored.translation_vector, expected.translation_vector),
+    ):
+        np.testing.assert_array_equal(actual, reference)
+
+
+def test_scalar_multiple_is_rescaled_from_the_stored_row(tmp_path: Path) -> None:
+    with PersistentCanonicalizationCache(tmp_path / "results.sqlite") as cache:
+        canonicalizer = _cached_canonicalizer(cache)
+        canonicalizer.canonize("2*x**2 - y**2 + 4*x*z + 3*y - z = 5")
+        scaled = canonicalizer.canonize("6*x**2 - 3*y**2 + 12*x*z + 9*y - 3*z = 15")
+        assert cache.statistics.scaled_hits == 1
+
+    uncached = QuadricCanonicalizer(QuadricParser(), QuadricClassifier(tolerance=1e-10))
+    expected = uncached.canonize("6*x**2 - 3*y**2 + 12*x*z + 9*y - 3*z = 15")
+    np.testing.assert_allclose(scaled.final_matrix, expected.final_matrix, atol=1e-12, rtol=1e-12)
+
+
+def test_near_miss_inside_one_key_is_not_served_from_disk(tmp_path: Path) -> None:
+    path = tmp_path / "results.sqlite"
+    perturbed = "x**2 + y**2 + 0.0000000000001 = 0"
+    with PersistentCanonicalizationCache(path) as cache:
+        _cached_canonicalizer(cache).canonize("x**2 + y**2 = 0")
+
+    with PersistentCanonicalizationCache(path) as cache:
+        result = _cached_canonicalizer(cache).canonize(perturbed)
+        assert cache.statistics.scaled_hits == 0
+
+    uncached = QuadricCanonicalizer(QuadricParser(), QuadricClassifier(tolerance=1e-10))
+    assert result.quadric_type is uncached.canonize(perturbed).quadric_type
+
+
+def test_databases_with_an_older_schema_are_rebuilt(tmp_path: Path) -> None:
+    path = tmp_path / "results.sqlite"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE metadata (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        connection.execute("INSERT INTO metadata VALUES ('version', 'schema=1')")
+        connection.execute("CREATE TABLE results (key BLOB PRIMARY KEY, payload BLOB NOT NULL)")
+    connection.close()
+
+    with PersistentCanonicalizationCache(path) as cache:
+        canonicalizer = _cached_canonicalizer(cache)
+        canonicalizer.canonize("x**2 + y**2 + z**2 = 1")
+        canonicalizer.canonize("2*x**2 + 2*y**2 + 2*z**2 = 2")
+        assert cache.statistics.scaled_hits == 1
+
+
+def test_changed_tolerances_invalidate_stored_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "results.sqlite"
+    with PersistentCanonicalizationCache(path) as cache:
+        _cached_canonicalizer(cache).canonize("x**2 + y**2 + z**2 = 1")
+        assert cache.statistics.size == 2
+
+    monkeypatch.setattr(persistent_cache, "ROUNDOFF_FACTOR", 1000.0)
+    with PersistentCanonicalizationCache(path) as cache:
+        assert cache.statistics.size == 0
+        assert cache.get_text("x**2 + y**2 + z**2 = 1") is None
+
+
+def test_least_recently_used_rows_are_evicted(tmp_path: Path) -> None:
+    spheres, ellipsoid, cylinder = (
+        QuadricMatrices.from_homogeneous(np.diag(diagonal))
+        for diagonal in ([1.0, 1.0, 1.0, -1.0], [1.0, 2.0, 3.0, -1.0], [1.0, 1.0, 0.0, -1.0])
+    )
+    with PersistentCanonicalizationCache(tmp_path / "results.sqlite", max_entries=2) as cache:
+        canonicalizer = _cached_canonicalizer(cache)
+        canonicalizer.canonize_matrices(spheres)
+        canonicalizer.canonize_matrices(ellipsoid)
+        assert cache.get_matrix(spheres.homogeneous) is not None
+        canonicalizer.canonize_matrices(cylinder)
+
+        statistics = cache.statistics
+        assert (statistics.size, statistics.evictions) == (2, 1)
+        assert cache.get_matrix(spheres.homogeneous) is not None
+        assert cache.get_matrix(ellipsoid.homogeneous) is None
+
+
+def test_invalid_settings_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        PersistentCanonicalizationCache(tmp_path / "results.sqlite", max_entries=0)
@@ -0,0 +1,159 @@
+"""Verify per-stage pipeline timings with ``python -m pytest tests/test_stage_timings.py -q``."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.numerical.cache import CanonicalizationCache
+from src.numerical.canonicalize import QuadricCanonicalizer
+from src.numerical.classifier import NotAQuadricError, QuadricClassifier
+from src.numerical.models import QuadricMatrices, QuadricType, ValidationMode
+from src.numerical.parser import QuadricParser
+from src.numerical.stage_timings import UNCLASSIFIED_KEY, PipelineStage, PipelineTimings, StageHistogram
+
+PIPELINE_STAGES = (
+    PipelineStage.PARSE,
+    PipelineStage.MATRIX_CONSTRUCTION,
+    PipelineStage.EIGENDECOMPOSITION,
+    PipelineStage.CLASSIFICATION,
+    PipelineStage.TRANSLATION,
+    PipelineStage.BUILD_RESULT,
+    PipelineStage.VALIDATION,
+)
+
+
+def _timed_canonicalizer(**options: object) -> tuple[QuadricCanonicalizer, PipelineTimings]:
+    timings = PipelineTimings()
+    canonicalizer = QuadricCanonicalizer(
+        QuadricParser(), QuadricClassifier(tolerance=1e-10), timings=timings, **options  # type: ignore[arg-type]
+    )
+    return canonicalizer, timings
+
+
+def _count(timings: PipelineTimings, quadric_type: QuadricType | None, stage: PipelineStage) -> int:
+    histogram = timings.histogram(quadric_type, stage)
+    return 0 if histogram is None else histogram.count
+
+
+def test_every_stage_is_recorded_under_the_classified_type() -> None:
+    canonicalizer, timings = _timed_canonicalizer()
+
+    for _ in range(3):
+        canonicalizer.canonize("x**2 + 2*y**2 + 3*z**2 = 1")
+    canonicalizer.canonize("x**2 + y**2 - z = 0")
+
+    for stage in PIPELINE_STAGES:
+        assert _count(timings, QuadricType.REAL_ELLIPSOID, stage) == 3
+        assert _count(timings, QuadricType.ELLIPTIC_PARABOLOID, stage) == 1
+    assert timings.histogram(None, PipelineStage.PARSE) is None
+
+
+def test_equation_stage_is_recorded_once_on_first_access() -> None:
+    canonicalizer, timings = _timed_canonicalizer()
+    result = canonicalizer.canonize("x**2 - y**2 = 1")
+
+    assert _count(timings, QuadricType.HYPERBOLIC_CYLINDER, PipelineStage.EQUATION) == 0
+    result.final_equation
+    result.final_equation
+    result.initial_equation
+
+    assert _count(timings, QuadricType.HYPERBOLIC_CYLINDER, PipelineStage.EQUATION) == 2
+
+
+def test_failed_calls_are_filed_as_unclassified() -> None:
+    canonicalizer, timings = _timed_canonicalizer()
+
+    with pytest.raises(ValueError):
+        canonicalizer.canonize("x**3 = 1")
+    with pytest.raises(NotAQuadricError):
+        canonicalizer.canonize_matrices(QuadricMatrices.from_homogeneous(np.diag([0.0, 0.0, 0.0, 1.0])))
+    canonicalizer.canonize("x**2 + y**2 + z**2 = 1")
+
+    assert _count(timings, None, PipelineStage.PARSE) == 1
+    assert _count(timings, None, PipelineStage.MATRIX_CONSTRUCTION) == 0
+    assert _count(timings, None, PipelineStage.EIGENDECOMPOSITION) == 1
+    assert _count(timings, None, PipelineStage.CLASSIFICATION) == 1
+    assert _count(timings, QuadricType.REAL_ELLIPSOID, PipelineStage.PARSE) == 1
+
+
+def test_cache_hits_and_kept_types_skip_their_stages() -> None:
+    canonicalizer, timings = _timed_canonicalizer(cache=CanonicalizationCache())
+    first = canonicalizer.canonize("x**2 + 2*y**2 + 3*z**2 = 1")
+    canonicalizer.canonize("x**2 + 2*y**2 + 3*z**2 = 1")
+    moved = QuadricMatrices.from_homogeneous(np.diag([1.0, 2.0, 3.0001, -1.0]))
+
+    canonicalizer.recanonize(first, moved)
+
+    assert _count(timings, QuadricType.REAL_ELLIPSOID, PipelineStage.PARSE) == 1
+    assert _count(timings, QuadricType.REAL_ELLIPSOID, PipelineStage.EIGENDECOMPOSITION) == 2
+    assert _count(timings, QuadricType.REAL_ELLIPSOID, PipelineStage.CLASSIFICATION) == 1
+    assert _count(timings, QuadricType.REAL_ELLIPSOID, PipelineStage.TRANSLATION) == 2
+
+
+def test_scaled_cache_hits_file_their_parse_stages_under_the_cached_type() -> None:
+    canonicalizer, timings = _timed_canonicalizer(cache=CanonicalizationCache())
+    canonicalizer.canonize("x**2 + 2*y**2 + 3*z**2 = 1")
+    canonicalizer.canonize("2*x**2 + 4*y**2 + 6*z**2 = 2")
+    canonicalizer.canonize("x**2 - y**2 = z")
+
+    assert canonicalizer.cache is not None
+    assert canonicalizer.cache.statistics.scaled_hits == 1
+    for stage in (PipelineStage.PARSE, PipelineStage.MATRIX_CONSTRUCTION):
+        assert _count(timings, QuadricType.REAL_ELLIPSOID, stage) == 2
+        assert _count(timings, QuadricType.HYPERBOLIC_PARABOLOID, stage) == 1
+
+
+def test_trusted_results_time_model_construction_as_validation() -> None:
+    canonicalizer, timings = _timed_canonicalizer(validation=ValidationMode.TRUSTED)
+
+    canonicalizer.canonize("x**2 + y**2 = z**2")
+
+    assert _count(timings, QuadricType.REAL_CONE, PipelineStage.VALIDATION) == 1
+
+
+def test_disabled_timings_leave_results_untouched() -> None:
+    canonicalizer = QuadricCanonicalizer(QuadricParser(), QuadricClassifier(tolerance=1e-10))
+
+    result = canonicalizer.canonize("x**2 + y**2 + z**2 = 1")
+    result.final_equation
+
+    assert canonicalizer.timings is None
+    assert result._timings is None
+
+
+def test_json_export_lists_histograms_per_type_slug(tmp_path: Path) -> None:
+    canonicalizer, timings = _timed_canonicalizer()
+    canonicalizer.canonize("x**2 + y**2 + z**2 = 1")
+    with pytest.raises(ValueError):
+        canonicalizer.canonize("x + y = 1")
+    path = tmp_path / "timings.json"
+
+    timings.write_json(path)
+    exported = json.loads(path.read_text(encoding="utf-8"))
+
+    assert exported == json.loads(timings.to_json())
+    assert set(exported["types"]) == {QuadricType.REAL_ELLIPSOID.slug, UNCLASSIFIED_KEY}
+    parse = exported["types"][QuadricType.REAL_ELLIPSOID.slug]["parse"]
+    assert parse["count"] == 1 == sum(parse["counts"])
+    assert len(parse["counts"]) == len(exported["edges"]) + 1
+    assert 0.0 < parse["min"] <= parse["mean"] <= parse["max"]
+
+    timings.reset()
+    assert timings.to_dict()["types"] == {}
+
+
+def test_histogram_buckets_include_underflow_and_overflow() -> None:
+    histogram = StageHistogram((1e-6, 1e-3))
+
+    for seconds in (1e-9, 1e-6, 5e-4, 2.0):
+        histogram.add(seconds)
+
+    assert histogram.counts == [1, 2, 1]
+    assert (histogram.count, histogram.minimum, histogram.maximum) == (4, 1e-9, 2.0)
+
+
+def test_histogram_edges_must_increase() -> None:
+    with pytest.raises(ValueError, match="strictly increasing"):
+        PipelineTimings((1e-3, 1e-3))
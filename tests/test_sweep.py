@@ -0,0 +1,57 @@
+"""Verify parameter sweeps with ``python -m pytest tests/test_sweep.py -q``."""
+
+import numpy as np
+import pytest
+
+from src.numerical.canonicalize import canonize_coefficients
+from src.numerical.models import QuadricType
+from src.numerical.sweep import sweep_parameters
+
+HYPERBOLOID = [1.0, 1.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0]
+CONSTANT = [0.0] * 9 + [1.0]
+Y_SQUARED = [0.0, 1.0] + [0.0] * 8
+
+
+def test_sweep_matches_pointwise_canonicalization_on_the_grid() -> None:
+    grid = np.linspace(-2.0, 3.0, 7)
+
+    sweep = sweep_parameters(HYPERBOLOID, [CONSTANT], [grid])
+
+    assert sweep.types.shape == (7,)
+    for index, value in enumerate(grid):
+        expected = canonize_coefficients(np.add(HYPERBOLOID, np.multiply(value, CONSTANT)))
+        assert sweep.batch.quadric_types[index] == expected.quadric_type
+        np.testing.assert_allclose(sweep.batch.final_matrices[index], expected.final_matrix, atol=1e-12)
+
+
+def test_transitions_are_refined_by_bisection() -> None:
+    sweep = sweep_parameters(HYPERBOLOID, [CONSTANT], [np.linspace(-2.0, 3.0, 7)])
+
+    (transition,) = sweep.transitions
+    assert transition.before is QuadricType.ONE_SHEET_HYPERBOLOID
+    assert transition.after is QuadricType.TWO_SHEET_HYPERBOLOID
+    assert transition.lower < transition.upper
+    assert transition.parameter == pytest.approx(1.0, abs=1e-11)
+
+
+def test_two_dimensional_sweeps_bracket_each_axis() -> None:
+    sweep = sweep_parameters(
+        HYPERBOLOID,
+        [Y_SQUARED, CONSTANT],
+        [np.linspace(-1.55, 0.45, 5), np.linspace(-2.0, 3.0, 7)],
+    )
+
+    assert sweep.types.shape == (5, 7)
+    assert {transition.axis for transition in sweep.transitions} == {0, 1}
+    for transition in sweep.transitions:
+        expected = -1.0 if transition.axis == 0 else 1.0
+        assert transition.parameter == pytest.approx(expected, abs=1e-11)
+
+
+def test_invalid_sweeps_are_rejected() -> None:
+    with pytest.raises(ValueError, match="one grid per direction"):
+        sweep_parameters(HYPERBOLOID, [CONSTANT], [])
+    with pytest.raises(ValueError, match="strictly increasing"):
+        sweep_parameters(HYPERBOLOID, [CONSTANT], [[1.0, 0.0]])
+    with pytest.raises(ValueError, match="symmetric"):
+        sweep_parameters(HYPERBOLOID, [np.triu(np.ones((4, 4)))], [[0.0, 1.0]])
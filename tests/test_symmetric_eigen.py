@@ -0,0 +1,105 @@
+"""Verify the closed-form 3x3 eigensolver with ``python -m pytest tests/test_symmetric_eigen.py -q``."""
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation
+
+from src.numerical.symmetric_eigen import batch_eigh3, batch_eigvalsh3, eigh3, eigvalsh3
+
+EPS = float(np.finfo(np.float64).eps)
+ADVERSARIAL_SPECTRA = [
+    [1.0, 2.0, 3.0],
+    [1.0, 1.0 + 1e-4, 1.0 + 2e-4],
+    [1.0, 1.0 + 1e-9, 1.0 + 2e-9],
+    [1.0, 1.0 + 1e-15, 1.0],
+    [1.0, 1.0, 1.0 + 1e-7],
+    [3.0, 3.0, 3.0 + 1e-13],
+    [0.0, 0.0, 1.0],
+    [0.0, 1e-16, 1.0],
+    [1.0, -1.0, 0.0],
+    [1.0, 1.0, -2.0],
+    [-1.0, 1e-12, 1.0],
+    [1e8, 1.0, 1e-8],
+    [1e-300, 1.0, 2.0],
+    [1.0, 1.0, 1.0],
+]
+
+
+def _rotated(spectrum: list[float], count: int, seed: int) -> np.ndarray:
+    rotations = Rotation.random(count, random_state=seed).as_matrix()
+    matrices = rotations @ (np.asarray(spectrum)[:, np.newaxis] * rotations.transpose(0, 2, 1))
+    return (matrices + matrices.transpose(0, 2, 1)) / 2
+
+
+def _assert_accurate(matrix: np.ndarray, eigenvalues: np.ndarray, eigenvectors: np.ndarray) -> None:
+    norm = float(np.max(np.abs(matrix)))
+    np.testing.assert_allclose(eigenvalues, np.linalg.eigvalsh(matrix), rtol=0.0, atol=32 * EPS * norm)
+    np.testing.assert_allclose(matrix @ eigenvectors, eigenvectors * eigenvalues, rtol=0.0, atol=32 * EPS * norm)
+    np.testing.assert_allclose(eigenvectors.T @ eigenvectors, np.eye(3), rtol=0.0, atol=32 * EPS)
+    assert np.linalg.det(eigenvectors) == pytest.approx(1.0, abs=32 * EPS)
+
+
+@pytest.mark.parametrize("spectrum", ADVERSARIAL_SPECTRA)
+def test_eigh3_matches_lapack_on_rotated_near_degenerate_spectra(spectrum: list[float]) -> None:
+    for matrix in _rotated(spectrum, 50, seed=3):
+        _assert_accurate(matrix, *eigh3(matrix))
+
+
+@pytest.mark.parametrize("spectrum", ADVERSARIAL_SPECTRA)
+def test_batch_eigh3_matches_lapack_on_rotated_near_degenerate_spectra(spectrum: list[float]) -> None:
+    matrices = _rotated(spectrum, 50, seed=4)
+
+    eigenvalues, eigenvectors = batch_eigh3(matrices)
+
+    for matrix, values, vectors in zip(matrices, eigenvalues, eigenvectors):
+        _assert_accurate(matrix, values, vectors)
+
+
+def test_kernels_match_lapack_on_random_and_diagonal_matrices() -> None:
+    rng = np.random.default_rng(11)
+    matrices = rng.normal(size=(500, 3, 3)) * 10.0 ** rng.uniform(-6, 6, size=(500, 1, 1))
+    matrices = np.concatenate([matrices + matrices.transpose(0, 2, 1), np.zeros((1, 3, 3))])
+    matrices = np.concatenate([matrices, np.stack([np.diag(row) for row in rng.normal(size=(20, 3))])])
+
+    eigenvalues, eigenvectors = batch_eigh3(matrices)
+
+    for matrix, values, vectors in zip(matrices, eigenvalues, eigenvectors):
+        _assert_accurate(matrix, values, vectors)
+        _assert_accurate(matrix, *eigh3(matrix))
+    np.testing.assert_array_equal(batch_eigvalsh3(matrices), eigenvalues)
+
+
+def test_scalar_and_batch_kernels_share_repeated_eigenspace_bases() -> None:
+    matrices = np.concatenate([_rotated([2.0, 2.0, -1.0], 20, seed=5), _rotated([0.0, 0.0, 1.0], 20, seed=6)])
+
+    eigenvalues, eigenvectors = batch_eigh3(matrices)
+
+    for matrix, values, vectors in zip(matrices, eigenvalues, eigenvectors):
+        scalar_values, scalar_vectors = eigh3(matrix)
+        np.testing.assert_allclose(scalar_values, values, rtol=0.0, atol=8 * EPS)
+        np.testing.assert_allclose(scalar_vectors, vectors, rtol=0.0, atol=1e-12)
+
+
+def test_scalar_and_batch_kernels_share_eigenvector_signs() -> None:
+    matrices = np.random.default_rng(1).integers(-3, 4, size=(2000, 3, 3)).astype(np.float64)
+    matrices = matrices + matrices.transpose(0, 2, 1)
+
+    eigenvectors = batch_eigh3(matrices)[1]
+
+    for matrix, vectors in zip(matrices, eigenvectors):
+        np.testing.assert_allclose(eigh3(matrix)[1], vectors, rtol=0.0, atol=1e-9)
+        for column in vectors.T[:2]:
+            assert column[np.flatnonzero(np.abs(column) > 1e-9)[0]] > 0.0
+
+
+def test_degenerate_inputs_return_the_identity_basis() -> None:
+    for matrix, expected in ((np.zeros((3, 3)), np.zeros(3)), (2.5 * np.eye(3), np.full(3, 2.5))):
+        eigenvalues, eigenvectors = eigh3(matrix)
+        np.testing.assert_array_equal(eigenvalues, expected)
+        np.testing.assert_array_equal(eigenvectors, np.eye(3))
+        np.testing.assert_array_equal(eigvalsh3(matrix), expected)
+
+
+def test_batch_eigh3_rejects_misshaped_stacks() -> None:
+    with pytest.raises(ValueError, match=r"\(N, 3, 3\)"):
+        batch_eigh3(np.eye(3))
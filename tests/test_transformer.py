@@ -5,8 +5,24 @@ import pytest
 import sympy as sp
 from scipy.spatial.transform import Rotation
 
-from src.numerical.canonicalize import canonize_quadric
-from src.numerical.models import CanonicalizationResult, FloatArray, QuadricType, TransformationKind
+from src.numerical.canonicalize import (
+    _default_canonicalizer,
+    canonize_coefficients,
+    canonize_coefficients_many,
+    canonize_matrix,
+    canonize_matrix_many,
+    canonize_quadric,
+    recanonize_matrix,
+)
+from src.numerical.invariants import QuadricInvariants
+from src.numerical.models import (
+    CanonicalizationResult,
+    FloatArray,
+    QuadricMatrices,
+    QuadricMatrixBatch,
+    QuadricType,
+    TransformationKind,
+)
 from src.numerical.numerical_helpers import expression_from_matrix
 from src.numerical.symbols import x, y
 
@@ -435,3 +451,170 @@ def test_reported_equations_preserve_nonzero_matrix_coefficients(
     result = canonize_quadric(equation)
 
     assert float(result.initial_equation.coeff(symbol, 2)) == expected_coefficient
+
+
+def test_coefficient_and_matrix_inputs_match_the_parsed_equation() -> None:
+    equation = "2x**2 + 2*y**2 + 4z**2 - 2xy + 2x = 0"
+    coefficients = np.array([2.0, 2.0, 4.0, -2.0, 0.0, 0.0, 2.0, 0.0, 0.0, 0.0])
+    reference = canonize_quadric(equation)
+
+    for result in (canonize_coefficients(coefficients), canonize_matrix(reference.initial_matrix)):
+        assert result.quadric_type is reference.quadric_type
+        np.testing.assert_array_equal(result.initial_matrix, reference.initial_matrix)
+        np.testing.assert_array_equal(result.final_matrix, reference.final_matrix)
+        np.testing.assert_array_equal(result.rotation_matrix, reference.rotation_matrix)
+
+
+def test_vectorized_inputs_canonicalize_every_row_in_order() -> None:
+    coefficients = np.array(
+        [
+            [1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0],
+            [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0, 0.0, 0.0],
+        ]
+    )
+
+    from_coefficients = canonize_coefficients_many(coefficients)
+    from_matrices = canonize_matrix_many(np.stack([result.initial_matrix for result in from_coefficients]))
+
+    assert [result.quadric_type for result in from_coefficients] == [
+        QuadricType.REAL_ELLIPSOID,
+        QuadricType.PARABOLIC_CYLINDER,
+    ]
+    assert [result.quadric_type for result in from_matrices] == [
+        QuadricType.REAL_ELLIPSOID,
+        QuadricType.PARABOLIC_CYLINDER,
+    ]
+
+
+def test_matrix_input_rejects_asymmetric_matrices() -> None:
+    matrix = np.diag([1.0, 1.0, 1.0, -1.0])
+    matrix[0, 1] = 1.0
+
+    with pytest.raises(ValueError, match="symmetric"):
+        canonize_matrix(matrix)
+
+
+def test_canonize_many_matches_the_scalar_strategies_for_every_type() -> None:
+    matrices = np.stack(
+        [
+            _INPUT_TO_CANONICAL_TRANSFORMS[case_index].T
+            @ _CANONICAL_METRIC_MATRICES[quadric_type][case_index]
+            @ _INPUT_TO_CANONICAL_TRANSFORMS[case_index]
+            for quadric_type in QuadricType
+            for case_index in range(_METRIC_CASE_COUNT)
+        ]
+    )
+    canonicalizer = _default_canonicalizer()
+
+    batch = canonicalizer.canonize_many(QuadricMatrixBatch.from_homogeneous(matrices))
+
+    assert not np.any(batch.error_mask)
+    for index, matrix in enumerate(matrices):
+        expected = canonicalizer.canonize_matrices(QuadricMatrices.from_homogeneous(matrix))
+        assert batch.quadric_types[index] == expected.quadric_type
+        assert batch.centered[index] == expected.centered
+        for actual, reference in (
+            (batch.initial_matrices[index], expected.initial_matrix),
+            (batch.middle_matrices[index], expected.middle_matrix),
+            (batch.final_matrices[index], expected.final_matrix),
+            (batch.rotation_matrices[index], expected.rotation_matrix),
+            (batch.translation_vectors[index], expected.translation_vector),
+        ):
+            np.testing.assert_allclose(actual, reference, atol=1e-12, rtol=1e-12)
+
+
+def test_canonize_many_matches_scalar_signs_on_small_integer_quadrics() -> None:
+    # Integer coefficients hit eigenvectors with tied components, where the
+    # two eigen kernels used to round to opposite signs.
+    coefficients = np.random.default_rng(0).integers(-3, 4, size=(600, 10)).astype(np.float64)
+    canonicalizer = _default_canonicalizer()
+
+    batch = canonicalizer.canonize_many(QuadricMatrixBatch.from_coefficients(coefficients))
+
+    for index in np.flatnonzero(~batch.error_mask):
+        expected = canonicalizer.canonize_matrices(QuadricMatrices.from_coefficients(coefficients[index]))
+        np.testing.assert_allclose(batch.final_matrices[index], expected.final_matrix, atol=1e-9)
+        np.testing.assert_allclose(batch.rotation_matrices[index], expected.rotation_matrix, atol=1e-9)
+
+
+def test_canonize_many_reports_failed_rows_without_raising() -> None:
+    coefficients = np.array(
+        [
+            [1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0],
+            [0.0] * 10,
+            [1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -4.0],
+        ]
+    )
+    errors = (None, None, "ValueError: equation must contain exactly one '=' sign")
+
+    batch = _default_canonicalizer().canonize_many(QuadricMatrixBatch.from_coefficients(coefficients, errors))
+
+    np.testing.assert_array_equal(batch.error_mask, [False, True, True])
+    assert batch.errors[1] == "quadric matrix cannot be identically zero"
+    assert batch.errors[2] == errors[2]
+    assert batch.quadric_types.tolist() == [QuadricType.REAL_ELLIPSOID, 0, 0]
+    np.testing.assert_array_equal(batch.final_matrices[1:], np.zeros((2, 4, 4)))
+
+
+def _ellipsoid_frame(frame: int) -> FloatArray:
+    rotation = Rotation.from_rotvec([0.0, 0.0, 0.02 * frame]).as_matrix()
+    homogeneous = np.eye(4)
+    homogeneous[:3, :3] = rotation @ np.diag([1.0 + 0.05 * np.sin(frame / 9.0), 2.0, 3.0]) @ rotation.T
+    homogeneous[:3, 3] = homogeneous[3, :3] = [0.3, 0.1 * np.cos(frame / 7.0), 0.0]
+    homogeneous[3, 3] = -1.0
+    return homogeneous
+
+
+def test_recanonize_tracks_frames_without_basis_flips() -> None:
+    previous = canonize_matrix(_ellipsoid_frame(0))
+
+    for frame in range(1, 120):
+        matrix = _ellipsoid_frame(frame)
+        current = recanonize_matrix(previous, matrix)
+        cold = canonize_matrix(matrix)
+
+        assert current.quadric_type is cold.quadric_type
+        np.testing.assert_allclose(current.final_matrix, cold.final_matrix, atol=1e-12)
+        np.testing.assert_allclose(current.rotation_matrix @ current.rotation_matrix.T, np.eye(3), atol=1e-13)
+        assert np.linalg.det(current.rotation_matrix) == pytest.approx(1.0)
+        assert np.all(np.sum(current.rotation_matrix * previous.rotation_matrix, axis=1) > 0.99)
+        previous = current
+
+
+def test_recanonize_skips_classification_only_while_the_spectrum_is_clear(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    canonicalizer = _default_canonicalizer()
+    previous = canonicalizer.canonize_matrices(QuadricMatrices.from_homogeneous(np.diag([1.0, 1.0, 1.0, -1.0])))
+    calls: list[QuadricInvariants] = []
+    classify = canonicalizer.classifier.classify_invariants
+
+    def counted(invariants: QuadricInvariants) -> QuadricType:
+        calls.append(invariants)
+        return classify(invariants)
+
+    monkeypatch.setattr(canonicalizer.classifier, "classify_invariants", counted)
+
+    sphere = canonicalizer.recanonize(previous, QuadricMatrices.from_homogeneous(np.diag([1.0, 1.0, 1.001, -1.0])))
+    imaginary = canonicalizer.recanonize(previous, QuadricMatrices.from_homogeneous(np.diag([1.0, 1.0, 1.0, 1.0])))
+
+    assert sphere.quadric_type is QuadricType.REAL_ELLIPSOID
+    np.testing.assert_array_equal(sphere.rotation_matrix, previous.rotation_matrix)
+    assert imaginary.quadric_type is QuadricType.COMPLEX_ELLIPSOID
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("cone", "constant"),
+    [([1.0, 1.0, -1.0], -0.5), ([1.0, 1.0, -1.0], 0.5), ([1.0, 1.0, 1.0], -0.5), ([1.0, 1.0, 1.0], 0.5)],
+)
+def test_recanonize_reclassifies_a_cone_that_gains_a_constant(cone: list[float], constant: float) -> None:
+    previous = canonize_matrix(np.diag([*cone, 0.0]))
+    matrix = np.diag([*cone, constant])
+
+    result = recanonize_matrix(previous, matrix)
+    expected = canonize_matrix(matrix)
+
+    assert previous.quadric_type in (QuadricType.REAL_CONE, QuadricType.COMPLEX_CONE)
+    assert result.quadric_type is expected.quadric_type
+    np.testing.assert_allclose(result.final_matrix, expected.final_matrix, atol=1e-12)